@@ -2,41 +2,152 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_USERNAME, CONF_PASSWORD, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
-from .client import EcoalClient
-from .coordinator import EcoalCoordinator
+from .const import (
+    CONF_CAPTURE,
+    CONF_CURVE,
+    CONF_CURVE_ROOM_GAIN,
+    CONF_CURVE_ROOM_TEMP,
+    CONF_CURVE_SHIFT,
+    CONF_CURVE_SLOPE,
+    CONF_EFFICIENCY,
+    CONF_FEED_RATE,
+    CONF_FUEL_KWH,
+    CONF_GATEWAY_URL,
+    CONF_TELEMETRY,
+    CONF_TELEMETRY_KEEP_DAYS,
+    CONF_WATCH_INTERVAL,
+    DATA_COUNTER_STORES,
+    DEFAULT_CURVE_ROOM_GAIN,
+    DEFAULT_CURVE_ROOM_TEMP,
+    DEFAULT_CURVE_SHIFT,
+    DEFAULT_CURVE_SLOPE,
+    DEFAULT_EFFICIENCY,
+    DEFAULT_FEED_RATE,
+    DEFAULT_FUEL_KWH,
+    DEFAULT_TELEMETRY_KEEP_DAYS,
+    DEFAULT_WATCH_INTERVAL,
+    DOMAIN,
+)
+from .pyecoal import EcoalClient
+from .pyecoal.counters import RuntimeCounters
+from .coordinator import EcoalCoordinator, async_get_status_cache
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.BINARY_SENSOR, Platform.CLIMATE, Platform.SENSOR, Platform.SWITCH]
+_COUNTERS_STORAGE_VERSION = 1
+
+PLATFORMS = [
+    Platform.BINARY_SENSOR,
+    Platform.CLIMATE,
+    Platform.NUMBER,
+    Platform.SELECT,
+    Platform.SENSOR,
+    Platform.SWITCH,
+]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     session = async_get_clientsession(hass)
+    capture = None
+    if entry.options.get(CONF_CAPTURE):
+        from .pyecoal.capture import CaptureWriter
+
+        capture = CaptureWriter(hass.config.path(f"ecoal_capture_{entry.entry_id}.log"))
     client = EcoalClient(
         entry.data[CONF_HOST],
         entry.data[CONF_USERNAME],
         entry.data[CONF_PASSWORD],
         session,
+        capture,
+        status_cache=async_get_status_cache(hass),
     )
-    coordinator = EcoalCoordinator(hass, client)
+    coordinator = EcoalCoordinator(hass, client, entry)
     await coordinator.async_config_entry_first_refresh()
+    counters = RuntimeCounters(
+        feed_rate=entry.options.get(CONF_FEED_RATE, DEFAULT_FEED_RATE),
+        kwh_per_kg=entry.options.get(CONF_FUEL_KWH, DEFAULT_FUEL_KWH),
+        efficiency=entry.options.get(CONF_EFFICIENCY, DEFAULT_EFFICIENCY) / 100,
+    )
+    entry.async_on_unload(
+        await coordinator.async_start_counters(counters, _counters_store(hass, entry))
+    )
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_setup_services(hass)
+
+    watch_interval = entry.options.get(CONF_WATCH_INTERVAL, DEFAULT_WATCH_INTERVAL)
+    if watch_interval:
+        entry.async_on_unload(
+            coordinator.async_start_watch(timedelta(seconds=watch_interval))
+        )
+    if gateway_url := entry.options.get(CONF_GATEWAY_URL):
+        coordinator.async_start_gateway(entry, gateway_url)
+    if entry.options.get(CONF_TELEMETRY):
+        from .pyecoal.telemetry import TelemetryWriter
+
+        writer = TelemetryWriter(
+            hass.config.path("ecoal_telemetry", entry.entry_id),
+            changes_only=True,
+            keep_days=entry.options.get(
+                CONF_TELEMETRY_KEEP_DAYS, DEFAULT_TELEMETRY_KEEP_DAYS
+            ),
+        )
+        entry.async_on_unload(coordinator.async_start_telemetry(writer))
+    if entry.options.get(CONF_CURVE):
+        if "outdoor_temp" in coordinator.connected_sensors:
+            from .pyecoal.curve import CurveController, HeatingCurve
+
+            curve = HeatingCurve(
+                slope=entry.options.get(CONF_CURVE_SLOPE, DEFAULT_CURVE_SLOPE),
+                shift=entry.options.get(CONF_CURVE_SHIFT, DEFAULT_CURVE_SHIFT),
+                room_temp=entry.options.get(CONF_CURVE_ROOM_TEMP, DEFAULT_CURVE_ROOM_TEMP),
+                room_gain=entry.options.get(CONF_CURVE_ROOM_GAIN, DEFAULT_CURVE_ROOM_GAIN),
+            )
+            entry.async_on_unload(coordinator.async_start_curve(CurveController(curve)))
+        else:
+            _LOGGER.warning(
+                "Heating curve for %s needs a connected outdoor sensor", entry.title
+            )
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        client = hass.data[DOMAIN].pop(entry.entry_id).client
+        # The shared cache must not serve this entry's last status to a new
+        # entry for the same host
+        if client.status_cache is not None:
+            client.status_cache.invalidate(client.cache_key)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await _counters_store(hass, entry).async_remove()
+    hass.data[DATA_COUNTER_STORES].pop(entry.entry_id, None)
+
+
+def _counters_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict]:
+    stores: dict[str, Store[dict]] = hass.data.setdefault(DATA_COUNTER_STORES, {})
+    if entry.entry_id not in stores:
+        stores[entry.entry_id] = Store(
+            hass, _COUNTERS_STORAGE_VERSION, f"{DOMAIN}.counters.{entry.entry_id}"
+        )
+    return stores[entry.entry_id]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import attrgetter
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -11,17 +12,19 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .pyecoal import ALARM2_NAMES, ALARM_NAMES, INPUT_NAMES
+from .pyecoal.anomaly import ANOMALY_NAMES, ANOMALY_SENSORS
 from .const import DOMAIN
 from .coordinator import EcoalCoordinator
+from .entity import EcoalEntity
 
 
 @dataclass(frozen=True, kw_only=True)
 class EcoalBinarySensorDescription(BinarySensorEntityDescription):
     value_key: str
+    mask: int = 0
 
 
 BINARY_SENSOR_DESCRIPTIONS: tuple[EcoalBinarySensorDescription, ...] = (
@@ -83,6 +86,47 @@ OUTPUT_BINARY_SENSOR_DESCRIPTIONS: tuple[EcoalBinarySensorDescription, ...] = (
     ),
 )
 
+# Controller inputs (byte 61) - disabled by default, wiring differs per boiler
+INPUT_BINARY_SENSOR_DESCRIPTIONS: tuple[EcoalBinarySensorDescription, ...] = tuple(
+    EcoalBinarySensorDescription(
+        key=name,
+        value_key=name,
+        translation_key=name,
+        icon="mdi:electric-switch",
+        entity_registry_enabled_default=False,
+    )
+    for name in INPUT_NAMES
+)
+
+# Per-bit alarm sensors - disabled by default, bit meanings not mapped yet
+ALARM_BINARY_SENSOR_DESCRIPTIONS: tuple[EcoalBinarySensorDescription, ...] = tuple(
+    EcoalBinarySensorDescription(
+        key=name,
+        value_key=value_key,
+        translation_key=translation_key,
+        translation_placeholders={"bit": str(bit)},
+        mask=1 << bit,
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+    )
+    for value_key, translation_key, names in (
+        ("alarms_raw", "alarm_bit", ALARM_NAMES),
+        ("alarms2_raw", "alarm2_bit", ALARM2_NAMES),
+    )
+    for bit, name in enumerate(names)
+)
+
+# Early warnings from the integration's own rules, ahead of controller alarms
+ANOMALY_BINARY_SENSOR_DESCRIPTIONS: tuple[BinarySensorEntityDescription, ...] = tuple(
+    BinarySensorEntityDescription(
+        key=name,
+        translation_key=name,
+        device_class=BinarySensorDeviceClass.PROBLEM,
+    )
+    for name in ANOMALY_NAMES
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -91,39 +135,66 @@ async def async_setup_entry(
 ) -> None:
     coordinator: EcoalCoordinator = hass.data[DOMAIN][entry.entry_id]
     entities: list[BinarySensorEntity] = [
-        EcoalBinarySensor(coordinator, description, entry)
+        EcoalBinarySensor(coordinator, description)
         for description in BINARY_SENSOR_DESCRIPTIONS
     ]
     entities.extend(
-        EcoalBinarySensor(coordinator, description, entry)
+        EcoalBinarySensor(coordinator, description)
         for description in OUTPUT_BINARY_SENSOR_DESCRIPTIONS
     )
+    entities.extend(
+        EcoalBinarySensor(coordinator, description)
+        for description in INPUT_BINARY_SENSOR_DESCRIPTIONS
+    )
+    entities.extend(
+        EcoalBinarySensor(coordinator, description)
+        for description in ALARM_BINARY_SENSOR_DESCRIPTIONS
+    )
+    connected = coordinator.connected_sensors
+    entities.extend(
+        EcoalAnomalySensor(coordinator, description)
+        for description in ANOMALY_BINARY_SENSOR_DESCRIPTIONS
+        if connected.issuperset(ANOMALY_SENSORS[description.key])
+    )
     async_add_entities(entities)
 
 
-class EcoalBinarySensor(CoordinatorEntity[EcoalCoordinator], BinarySensorEntity):
+class EcoalBinarySensor(EcoalEntity, BinarySensorEntity):
     entity_description: EcoalBinarySensorDescription
-    _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: EcoalCoordinator,
         description: EcoalBinarySensorDescription,
-        entry: ConfigEntry,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
+        self._value = attrgetter(description.value_key)
+        self._mask = description.mask
+
+    @property
+    def is_on(self) -> bool | None:
+        if self.coordinator.data is None:
+            return None
+        value = self._value(self.coordinator.data)
+        if self._mask:
+            return bool(value & self._mask)
+        return value
+
+
+class EcoalAnomalySensor(EcoalEntity, BinarySensorEntity):
+    """On while the coordinator's anomaly rule of the same key is raised."""
+
+    def __init__(
+        self,
+        coordinator: EcoalCoordinator,
+        description: BinarySensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, f"anomaly_{description.key}")
         self.entity_description = description
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="eCoal",
-            manufacturer="eCoal",
-            model="Furnace Controller",
-            sw_version=coordinator.firmware_version,
-        )
 
     @property
     def is_on(self) -> bool | None:
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get(self.entity_description.value_key)
+        return self.entity_description.key in self.coordinator.anomalies.active
@@ -1,6 +1,7 @@
 """Climate entities for eCoal - CO heating, CWU hot water, floor heating."""
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -12,13 +13,12 @@ from homeassistant.components.climate import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .client import CWU_MODE_OFF, CWU_MODE_WINTER
+from .pyecoal import CWU_MODE_OFF, CWU_MODE_WINTER
 from .const import DOMAIN
 from .coordinator import EcoalCoordinator
+from .entity import EcoalEntity
 
 
 async def async_setup_entry(
@@ -28,18 +28,17 @@ async def async_setup_entry(
 ) -> None:
     coordinator: EcoalCoordinator = hass.data[DOMAIN][entry.entry_id]
     entities: list[ClimateEntity] = [
-        EcoalHeatingClimate(coordinator, entry),
-        EcoalCWUClimate(coordinator, entry),
+        EcoalHeatingClimate(coordinator),
+        EcoalCWUClimate(coordinator),
     ]
     if "floor_temp" in coordinator.connected_sensors:
-        entities.append(EcoalFloorClimate(coordinator, entry))
+        entities.append(EcoalFloorClimate(coordinator))
     async_add_entities(entities)
 
 
-class EcoalHeatingClimate(CoordinatorEntity[EcoalCoordinator], ClimateEntity):
+class EcoalHeatingClimate(EcoalEntity, ClimateEntity):
     """Climate entity for the central heating (CO) circuit."""
 
-    _attr_has_entity_name = True
     _attr_name = "Heating"
     _attr_translation_key = "heating"
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
@@ -49,63 +48,67 @@ class EcoalHeatingClimate(CoordinatorEntity[EcoalCoordinator], ClimateEntity):
     _attr_max_temp = 80
     _attr_target_temperature_step = 1
 
-    def __init__(self, coordinator: EcoalCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_climate_co"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="eCoal",
-            manufacturer="eCoal",
-            model="Furnace Controller",
-            sw_version=coordinator.firmware_version,
-        )
+    def __init__(self, coordinator: EcoalCoordinator) -> None:
+        super().__init__(coordinator, "climate_co")
 
     @property
     def current_temperature(self) -> float | None:
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get("boiler_temp")
+        return self.coordinator.data.boiler_temp
 
     @property
     def target_temperature(self) -> float | None:
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get("target_boiler_temp")
+        return self.coordinator.data.target_boiler_temp
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        curve = self.coordinator.curve
+        if curve is None:
+            return None
+        return {f"curve_{key}": value for key, value in curve.as_dict().items()}
 
     @property
     def hvac_mode(self) -> HVACMode:
-        if self.coordinator.data and self.coordinator.data.get("auto_mode"):
+        if self.coordinator.data and self.coordinator.data.auto_mode:
             return HVACMode.HEAT
         return HVACMode.OFF
 
     @property
     def hvac_action(self) -> HVACAction | None:
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        if self.coordinator.data.get("air_pump") or self.coordinator.data.get("coal_feeder"):
+        if data.air_pump or data.coal_feeder:
             return HVACAction.HEATING
-        if self.coordinator.data.get("auto_mode"):
+        if data.auto_mode:
             return HVACAction.IDLE
         return HVACAction.OFF
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         temp = kwargs.get(ATTR_TEMPERATURE)
         if temp is not None:
-            await self.coordinator.client.set_target_boiler_temp(int(temp))
-            await self.coordinator.async_request_refresh()
+            target = int(temp)
+            await self.coordinator.async_traced_write(
+                "co_target_temp",
+                partial(self.coordinator.client.set_target_boiler_temp, target),
+                lambda status: status.target_boiler_temp == target,
+            )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        if hvac_mode == HVACMode.HEAT:
-            await self.coordinator.client.set_auto_mode(True)
-        else:
-            await self.coordinator.client.set_auto_mode(False)
-        await self.coordinator.async_request_refresh()
+        on = hvac_mode == HVACMode.HEAT
+        await self.coordinator.async_traced_write(
+            "auto_mode",
+            partial(self.coordinator.client.set_auto_mode, on),
+            lambda status: status.auto_mode == on,
+        )
 
 
-class EcoalCWUClimate(CoordinatorEntity[EcoalCoordinator], ClimateEntity):
+class EcoalCWUClimate(EcoalEntity, ClimateEntity):
     """Climate entity for domestic hot water (CWU) circuit."""
 
-    _attr_has_entity_name = True
     _attr_name = "Hot Water"
     _attr_translation_key = "hot_water"
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
@@ -115,34 +118,26 @@ class EcoalCWUClimate(CoordinatorEntity[EcoalCoordinator], ClimateEntity):
     _attr_max_temp = 65
     _attr_target_temperature_step = 1
 
-    def __init__(self, coordinator: EcoalCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_climate_cwu"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="eCoal",
-            manufacturer="eCoal",
-            model="Furnace Controller",
-            sw_version=coordinator.firmware_version,
-        )
+    def __init__(self, coordinator: EcoalCoordinator) -> None:
+        super().__init__(coordinator, "climate_cwu")
 
     @property
     def current_temperature(self) -> float | None:
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get("dhw_temp")
+        return self.coordinator.data.dhw_temp
 
     @property
     def target_temperature(self) -> float | None:
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get("target_dhw_temp")
+        return self.coordinator.data.target_dhw_temp
 
     @property
     def hvac_mode(self) -> HVACMode:
         if self.coordinator.data is None:
             return HVACMode.OFF
-        cwu_mode = self.coordinator.data.get("cwu_mode", 4)
+        cwu_mode = self.coordinator.data.cwu_mode
         if cwu_mode == CWU_MODE_OFF:
             return HVACMode.OFF
         return HVACMode.HEAT
@@ -151,9 +146,9 @@ class EcoalCWUClimate(CoordinatorEntity[EcoalCoordinator], ClimateEntity):
     def hvac_action(self) -> HVACAction | None:
         if self.coordinator.data is None:
             return None
-        if self.coordinator.data.get("dhw_pump"):
+        if self.coordinator.data.dhw_pump:
             return HVACAction.HEATING
-        cwu_mode = self.coordinator.data.get("cwu_mode", 4)
+        cwu_mode = self.coordinator.data.cwu_mode
         if cwu_mode == CWU_MODE_OFF:
             return HVACAction.OFF
         return HVACAction.IDLE
@@ -161,21 +156,25 @@ class EcoalCWUClimate(CoordinatorEntity[EcoalCoordinator], ClimateEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:
         temp = kwargs.get(ATTR_TEMPERATURE)
         if temp is not None:
-            await self.coordinator.client.set_target_dhw_temp(int(temp))
-            await self.coordinator.async_request_refresh()
+            target = int(temp)
+            await self.coordinator.async_traced_write(
+                "cwu_target_temp",
+                partial(self.coordinator.client.set_target_dhw_temp, target),
+                lambda status: status.target_dhw_temp == target,
+            )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        if hvac_mode == HVACMode.HEAT:
-            await self.coordinator.client.set_cwu_mode(CWU_MODE_WINTER)
-        else:
-            await self.coordinator.client.set_cwu_mode(CWU_MODE_OFF)
-        await self.coordinator.async_request_refresh()
+        mode = CWU_MODE_WINTER if hvac_mode == HVACMode.HEAT else CWU_MODE_OFF
+        await self.coordinator.async_traced_write(
+            "cwu_mode",
+            partial(self.coordinator.client.set_cwu_mode, mode),
+            lambda status: status.cwu_mode == mode,
+        )
 
 
-class EcoalFloorClimate(CoordinatorEntity[EcoalCoordinator], ClimateEntity):
+class EcoalFloorClimate(EcoalEntity, ClimateEntity):
     """Climate entity for the floor heating circuit (mixer/underfloor)."""
 
-    _attr_has_entity_name = True
     _attr_name = "Floor Heating"
     _attr_translation_key = "floor_heating"
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
@@ -185,34 +184,26 @@ class EcoalFloorClimate(CoordinatorEntity[EcoalCoordinator], ClimateEntity):
     _attr_max_temp = 55
     _attr_target_temperature_step = 1
 
-    def __init__(self, coordinator: EcoalCoordinator, entry: ConfigEntry) -> None:
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_climate_floor"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="eCoal",
-            manufacturer="eCoal",
-            model="Furnace Controller",
-            sw_version=coordinator.firmware_version,
-        )
+    def __init__(self, coordinator: EcoalCoordinator) -> None:
+        super().__init__(coordinator, "climate_floor")
 
     @property
     def current_temperature(self) -> float | None:
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get("floor_temp")
+        return self.coordinator.data.floor_temp
 
     @property
     def target_temperature(self) -> float | None:
         if self.coordinator.data is None:
             return None
-        if self.coordinator.data.get("floor_day_night", 0) == 1:
-            return self.coordinator.data.get("floor_night_temp")
-        return self.coordinator.data.get("floor_day_temp")
+        if self.coordinator.data.floor_day_night == 1:
+            return self.coordinator.data.floor_night_temp
+        return self.coordinator.data.floor_day_temp
 
     @property
     def hvac_mode(self) -> HVACMode:
-        if self.coordinator.data and self.coordinator.data.get("mixer_circuit", 0) > 0:
+        if self.coordinator.data and self.coordinator.data.mixer_circuit > 0:
             return HVACMode.HEAT
         return HVACMode.OFF
 
@@ -220,24 +211,34 @@ class EcoalFloorClimate(CoordinatorEntity[EcoalCoordinator], ClimateEntity):
     def hvac_action(self) -> HVACAction | None:
         if self.coordinator.data is None:
             return None
-        if self.coordinator.data.get("mixer_pump"):
+        if self.coordinator.data.mixer_pump:
             return HVACAction.HEATING
-        if self.coordinator.data.get("mixer_circuit", 0) > 0:
+        if self.coordinator.data.mixer_circuit > 0:
             return HVACAction.IDLE
         return HVACAction.OFF
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         temp = kwargs.get(ATTR_TEMPERATURE)
         if temp is not None:
-            if self.coordinator.data and self.coordinator.data.get("floor_day_night", 0) == 1:
-                await self.coordinator.client.set_floor_night_temp(int(temp))
+            target = int(temp)
+            client = self.coordinator.client
+            if self.coordinator.data and self.coordinator.data.floor_day_night == 1:
+                await self.coordinator.async_traced_write(
+                    "floor_night_temp",
+                    partial(client.set_floor_night_temp, target),
+                    lambda status: status.floor_night_temp == target,
+                )
             else:
-                await self.coordinator.client.set_floor_day_temp(int(temp))
-            await self.coordinator.async_request_refresh()
+                await self.coordinator.async_traced_write(
+                    "floor_day_temp",
+                    partial(client.set_floor_day_temp, target),
+                    lambda status: status.floor_day_temp == target,
+                )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        if hvac_mode == HVACMode.HEAT:
-            await self.coordinator.client.set_mixer_activation(True)
-        else:
-            await self.coordinator.client.set_mixer_activation(False)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_traced_write(
+            "mixer_activation",
+            partial(
+                self.coordinator.client.set_mixer_activation, hvac_mode == HVACMode.HEAT
+            ),
+        )
@@ -1,16 +1,68 @@
 """Config flow for eCoal."""
 from __future__ import annotations
 
+import re
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    SOURCE_INTEGRATION_DISCOVERY,
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_HOST, CONF_USERNAME, CONF_PASSWORD
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
-from .const import DOMAIN
-from .client import EcoalClient
+from .const import (
+    CONF_CAPTURE,
+    CONF_CURVE,
+    CONF_CURVE_ROOM_GAIN,
+    CONF_CURVE_ROOM_TEMP,
+    CONF_CURVE_SHIFT,
+    CONF_CURVE_SLOPE,
+    CONF_EFFICIENCY,
+    CONF_FEED_RATE,
+    CONF_FILTER,
+    CONF_FUEL_KWH,
+    CONF_GATEWAY_URL,
+    CONF_GRACE_FAILURES,
+    CONF_GRACE_SECONDS,
+    CONF_SLOW_COMMAND,
+    CONF_TELEMETRY,
+    CONF_TELEMETRY_KEEP_DAYS,
+    CONF_WATCH_INTERVAL,
+    DEFAULT_CURVE_ROOM_GAIN,
+    DEFAULT_CURVE_ROOM_TEMP,
+    DEFAULT_CURVE_SHIFT,
+    DEFAULT_CURVE_SLOPE,
+    DEFAULT_EFFICIENCY,
+    DEFAULT_FEED_RATE,
+    DEFAULT_FILTER,
+    DEFAULT_FUEL_KWH,
+    DEFAULT_GRACE_FAILURES,
+    DEFAULT_GRACE_SECONDS,
+    DEFAULT_SLOW_COMMAND,
+    DEFAULT_TELEMETRY_KEEP_DAYS,
+    DEFAULT_WATCH_INTERVAL,
+    DOMAIN,
+)
+from .coordinator import UPDATE_INTERVAL, async_get_status_cache
+from .pyecoal import EcoalClient
+from .pyecoal.discovery import discover, validate_hosts
+
+CONF_NETWORK = "network"
+CONF_HOSTS = "hosts"
+
+_CREDENTIALS_SCHEMA = {
+    vol.Required(CONF_USERNAME): str,
+    vol.Required(CONF_PASSWORD): str,
+}
 
 
 class EcoalConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -18,8 +70,25 @@ class EcoalConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        self._credentials: dict[str, str] = {}
+        self._found: dict[str, str] = {}
+        self._discovered: dict[str, str] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> EcoalOptionsFlow:
+        return EcoalOptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        return self.async_show_menu(
+            step_id="user", menu_options=["manual", "discover", "bulk"]
+        )
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         errors = {}
         if user_input is not None:
@@ -29,8 +98,11 @@ class EcoalConfigFlow(ConfigFlow, domain=DOMAIN):
                 user_input[CONF_USERNAME],
                 user_input[CONF_PASSWORD],
                 session,
+                status_cache=async_get_status_cache(self.hass),
             )
-            if await client.test_connection():
+            # A frame polled by a loaded entry within the last poll window
+            # counts, so re-adding a host does not send a second status read
+            if await client.test_connection(UPDATE_INTERVAL.total_seconds()):
                 await self.async_set_unique_id(user_input[CONF_HOST])
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(
@@ -40,13 +112,240 @@ class EcoalConfigFlow(ConfigFlow, domain=DOMAIN):
             errors["base"] = "cannot_connect"
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
+            data_schema=vol.Schema({vol.Required(CONF_HOST): str, **_CREDENTIALS_SCHEMA}),
+            errors=errors,
+        )
+
+    async def async_step_discover(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Scan a network for controllers that accept the given credentials."""
+        errors = {}
+        if user_input is not None:
+            self._credentials = {
+                CONF_USERNAME: user_input[CONF_USERNAME],
+                CONF_PASSWORD: user_input[CONF_PASSWORD],
+            }
+            try:
+                found = await discover(
+                    user_input[CONF_NETWORK],
+                    user_input[CONF_USERNAME],
+                    user_input[CONF_PASSWORD],
+                    async_get_clientsession(self.hass),
+                )
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                configured = self._async_current_ids()
+                self._found = {
+                    host: version
+                    for host, version in found.items()
+                    if host not in configured
+                }
+                if self._found:
+                    return await self.async_step_pick()
+                errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_NETWORK): str, **_CREDENTIALS_SCHEMA}
+            ),
+            errors=errors,
+        )
+
+    async def async_step_pick(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        errors = {}
+        if user_input is not None:
+            if user_input[CONF_HOSTS]:
+                return await self._async_create_entries(user_input[CONF_HOSTS])
+            errors["base"] = "no_hosts"
+
+        return self.async_show_form(
+            step_id="pick",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_HOST): str,
-                    vol.Required(CONF_USERNAME): str,
-                    vol.Required(CONF_PASSWORD): str,
+                    vol.Required(CONF_HOSTS, default=list(self._found)): cv.multi_select(
+                        {
+                            host: f"{host} ({version})"
+                            for host, version in self._found.items()
+                        }
+                    ),
                 }
             ),
             errors=errors,
         )
+
+    async def async_step_bulk(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Add many hosts at once, validated in parallel."""
+        errors = {}
+        placeholders = {"hosts": ""}
+        if user_input is not None:
+            configured = self._async_current_ids()
+            hosts = [
+                host
+                for host in dict.fromkeys(re.split(r"[\s,;]+", user_input[CONF_HOSTS]))
+                if host and host not in configured
+            ]
+            if not hosts:
+                errors[CONF_HOSTS] = "no_hosts"
+            else:
+                versions = await validate_hosts(
+                    hosts,
+                    user_input[CONF_USERNAME],
+                    user_input[CONF_PASSWORD],
+                    async_get_clientsession(self.hass),
+                )
+                failed = [host for host, version in versions.items() if version is None]
+                if not failed:
+                    self._credentials = {
+                        CONF_USERNAME: user_input[CONF_USERNAME],
+                        CONF_PASSWORD: user_input[CONF_PASSWORD],
+                    }
+                    return await self._async_create_entries(hosts)
+                errors["base"] = "cannot_connect_hosts"
+                placeholders["hosts"] = ", ".join(failed)
+
+        return self.async_show_form(
+            step_id="bulk",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOSTS): TextSelector(
+                        TextSelectorConfig(multiline=True)
+                    ),
+                    **_CREDENTIALS_SCHEMA,
+                }
+            ),
+            errors=errors,
+            description_placeholders=placeholders,
+        )
+
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> ConfigFlowResult:
+        """Offer one more host validated by discovery or bulk add."""
+        await self.async_set_unique_id(discovery_info[CONF_HOST])
+        self._abort_if_unique_id_configured()
+        self._discovered = dict(discovery_info)
+        self.context["title_placeholders"] = {"host": discovery_info[CONF_HOST]}
+        return await self.async_step_confirm()
+
+    async def async_step_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        if user_input is not None:
+            return self.async_create_entry(
+                title=f"eCoal ({self._discovered[CONF_HOST]})", data=self._discovered
+            )
+        return self.async_show_form(
+            step_id="confirm",
+            description_placeholders={"host": self._discovered[CONF_HOST]},
+        )
+
+    async def _async_create_entries(self, hosts: list[str]) -> ConfigFlowResult:
+        """Finish this flow with the first host; offer each other host in its own
+        discovered flow for the user to confirm."""
+        first, *rest = hosts
+        for host in rest:
+            self.hass.async_create_task(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": SOURCE_INTEGRATION_DISCOVERY},
+                    data={CONF_HOST: host, **self._credentials},
+                )
+            )
+        await self.async_set_unique_id(first)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=f"eCoal ({first})", data={CONF_HOST: first, **self._credentials}
+        )
+
+
+class EcoalOptionsFlow(OptionsFlow):
+    """Handle eCoal options."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        self._config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_WATCH_INTERVAL,
+                        default=options.get(CONF_WATCH_INTERVAL, DEFAULT_WATCH_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=29)),
+                    vol.Required(
+                        CONF_GRACE_FAILURES,
+                        default=options.get(CONF_GRACE_FAILURES, DEFAULT_GRACE_FAILURES),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=20)),
+                    vol.Required(
+                        CONF_GRACE_SECONDS,
+                        default=options.get(CONF_GRACE_SECONDS, DEFAULT_GRACE_SECONDS),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Required(
+                        CONF_FILTER, default=options.get(CONF_FILTER, DEFAULT_FILTER)
+                    ): bool,
+                    vol.Required(
+                        CONF_CAPTURE, default=options.get(CONF_CAPTURE, False)
+                    ): bool,
+                    vol.Optional(
+                        CONF_GATEWAY_URL, default=options.get(CONF_GATEWAY_URL, "")
+                    ): str,
+                    vol.Required(
+                        CONF_TELEMETRY, default=options.get(CONF_TELEMETRY, False)
+                    ): bool,
+                    vol.Required(
+                        CONF_TELEMETRY_KEEP_DAYS,
+                        default=options.get(
+                            CONF_TELEMETRY_KEEP_DAYS, DEFAULT_TELEMETRY_KEEP_DAYS
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3650)),
+                    vol.Required(
+                        CONF_SLOW_COMMAND,
+                        default=options.get(CONF_SLOW_COMMAND, DEFAULT_SLOW_COMMAND),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=600)),
+                    vol.Required(CONF_CURVE, default=options.get(CONF_CURVE, False)): bool,
+                    vol.Required(
+                        CONF_CURVE_SLOPE,
+                        default=options.get(CONF_CURVE_SLOPE, DEFAULT_CURVE_SLOPE),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.2, max=4)),
+                    vol.Required(
+                        CONF_CURVE_SHIFT,
+                        default=options.get(CONF_CURVE_SHIFT, DEFAULT_CURVE_SHIFT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=-15, max=15)),
+                    vol.Required(
+                        CONF_CURVE_ROOM_TEMP,
+                        default=options.get(CONF_CURVE_ROOM_TEMP, DEFAULT_CURVE_ROOM_TEMP),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=10, max=30)),
+                    vol.Required(
+                        CONF_CURVE_ROOM_GAIN,
+                        default=options.get(CONF_CURVE_ROOM_GAIN, DEFAULT_CURVE_ROOM_GAIN),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+                    vol.Required(
+                        CONF_FEED_RATE,
+                        default=options.get(CONF_FEED_RATE, DEFAULT_FEED_RATE),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                    vol.Required(
+                        CONF_FUEL_KWH,
+                        default=options.get(CONF_FUEL_KWH, DEFAULT_FUEL_KWH),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1, max=10)),
+                    vol.Required(
+                        CONF_EFFICIENCY,
+                        default=options.get(CONF_EFFICIENCY, DEFAULT_EFFICIENCY),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=100)),
+                }
+            ),
+        )
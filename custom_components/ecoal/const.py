@@ -1,3 +1,58 @@
 """Constants for eCoal integration."""
 
 DOMAIN = "ecoal"
+
+# hass.data key of the StatusCache shared by all entries and config flows
+DATA_STATUS_CACHE = f"{DOMAIN}_status_cache"
+# hass.data key of the counter Stores by entry id, kept across reloads so a
+# reload reads the totals its predecessor has not flushed yet
+DATA_COUNTER_STORES = f"{DOMAIN}_counter_stores"
+
+EVENT_ALARM = "ecoal_alarm"
+EVENT_ANOMALY = "ecoal_anomaly"
+EVENT_SLOW_COMMAND = "ecoal_slow_command"
+
+CONF_WATCH_INTERVAL = "watch_interval"
+DEFAULT_WATCH_INTERVAL = 0
+
+CONF_CAPTURE = "capture"
+
+CONF_GATEWAY_URL = "gateway_url"
+
+CONF_TELEMETRY = "telemetry"
+# Days of telemetry files kept (0 = keep all)
+CONF_TELEMETRY_KEEP_DAYS = "telemetry_keep_days"
+DEFAULT_TELEMETRY_KEEP_DAYS = 30
+
+# Median/rate-limit filter on probe temperatures before entities see them
+CONF_FILTER = "filter"
+DEFAULT_FILTER = True
+
+# Failed polls served from the last good status before entities go unavailable
+CONF_GRACE_FAILURES = "grace_failures"
+DEFAULT_GRACE_FAILURES = 3
+CONF_GRACE_SECONDS = "grace_seconds"
+DEFAULT_GRACE_SECONDS = 300
+
+# Local heating curve writing the CO setpoint from the outdoor temperature
+CONF_CURVE = "curve"
+CONF_CURVE_SLOPE = "curve_slope"
+DEFAULT_CURVE_SLOPE = 1.5
+CONF_CURVE_SHIFT = "curve_shift"
+DEFAULT_CURVE_SHIFT = 0.0
+CONF_CURVE_ROOM_TEMP = "curve_room_temp"
+DEFAULT_CURVE_ROOM_TEMP = 21.0
+CONF_CURVE_ROOM_GAIN = "curve_room_gain"
+DEFAULT_CURVE_ROOM_GAIN = 0.0
+
+# Commands slower than this (seconds, call to confirmed state) fire an event
+CONF_SLOW_COMMAND = "slow_command"
+DEFAULT_SLOW_COMMAND = 0
+
+# Fuel and heat estimate from feeder runtime (feed rate 0 = no estimate)
+CONF_FEED_RATE = "feed_rate"
+DEFAULT_FEED_RATE = 0.0
+CONF_FUEL_KWH = "fuel_kwh"
+DEFAULT_FUEL_KWH = 7.5
+CONF_EFFICIENCY = "efficiency"
+DEFAULT_EFFICIENCY = 80
@@ -1,38 +1,673 @@
 """Data update coordinator for eCoal controller."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
-from typing import Any
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .client import SENSOR_NAMES, EcoalClient
+from .pyecoal import (
+    ALARM2_NAMES,
+    ALARM_NAMES,
+    SENSOR_NAMES,
+    EcoalClient,
+    EcoalStatus,
+    StatusCache,
+)
+from .pyecoal.anomaly import AnomalyDetector
+from .pyecoal.codec import encode_program
+from .pyecoal.filters import StatusFilter
+from .pyecoal.params import ParamSpec
+from .pyecoal.profiles import FEATURE_WEEKLY_PROGRAM
+from .pyecoal.schedule import PROGRAMS, ScheduleIndex
+from .pyecoal.trace import CommandTrace, TraceLog, activate, span
+from .const import (
+    CONF_FILTER,
+    CONF_GRACE_FAILURES,
+    CONF_GRACE_SECONDS,
+    CONF_SLOW_COMMAND,
+    DATA_STATUS_CACHE,
+    DEFAULT_FILTER,
+    DEFAULT_GRACE_FAILURES,
+    DEFAULT_GRACE_SECONDS,
+    DEFAULT_SLOW_COMMAND,
+    DOMAIN,
+    EVENT_ALARM,
+    EVENT_ANOMALY,
+    EVENT_SLOW_COMMAND,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.storage import Store
+
+    from .pyecoal.counters import RuntimeCounters
+    from .pyecoal.curve import CurveController
+    from .pyecoal.telemetry import TelemetryWriter
 
 _LOGGER = logging.getLogger(__name__)
 
+# ALARMY in bits 0-15, ALARMY2 in bits 16-31
+_ALARM_BITS = ALARM_NAMES + ALARM2_NAMES
+
+# Weight of each new sample in the smoothed clock drift
+_DRIFT_ALPHA = 0.2
+
+UPDATE_INTERVAL = timedelta(seconds=30)
+
+# Seconds a parameter or weekly program read outside the status frame is
+# reused before re-reading
+_PARAM_MAX_AGE = 3600
+
+# Weekly program writes: attempts and pause between them, in seconds
+_PROGRAM_WRITE_ATTEMPTS = 3
+_PROGRAM_RETRY_DELAY = 2
+
+# Seconds to wait before reconnecting to a gateway after the stream breaks
+_GATEWAY_RETRY = 30
+# While following a gateway, how often parameters and weekly programs that
+# entities track are checked (each is still only re-read after _PARAM_MAX_AGE)
+_PUSH_REFRESH_INTERVAL = timedelta(minutes=5)
+
+# Seconds a traced command waits for a status confirming it
+_TRACE_TIMEOUT = 120
+# Traced commands waiting for confirmation at most (oldest dropped)
+_TRACE_PENDING = 16
+
+# Longest time telemetry records wait in memory before being written
+_TELEMETRY_FLUSH_INTERVAL = timedelta(minutes=5)
+
+# How often runtime and energy counters are saved to storage
+_COUNTERS_SAVE_INTERVAL = timedelta(minutes=5)
 
-class EcoalCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+
+@callback
+def async_get_status_cache(hass: HomeAssistant) -> StatusCache:
+    """Status cache shared by every client of this HA instance."""
+    if DATA_STATUS_CACHE not in hass.data:
+        hass.data[DATA_STATUS_CACHE] = StatusCache()
+    return hass.data[DATA_STATUS_CACHE]
+
+
+class EcoalCoordinator(DataUpdateCoordinator[EcoalStatus]):
     """Coordinator that polls furnace status every 30 seconds."""
 
-    def __init__(self, hass: HomeAssistant, client: EcoalClient) -> None:
+    def __init__(
+        self, hass: HomeAssistant, client: EcoalClient, entry: ConfigEntry
+    ) -> None:
         super().__init__(
-            hass, _LOGGER, name="eCoal", update_interval=timedelta(seconds=30)
+            hass, _LOGGER, name="eCoal", update_interval=UPDATE_INTERVAL
         )
         self.client = client
+        self.entry_id = entry.entry_id
         self.firmware_version: str | None = None
         self.connected_sensors: set[str] = set()
+        self._alarm_mask: int | None = None
+        self._watch_busy = False
+        # Smoothed controller clock minus HA local time, in seconds
+        self.clock_drift: float | None = None
+        # Parameters not in the status frame that entities want kept current
+        self._polled_params: dict[str, ParamSpec] = {}
+        # Weekly programs (by name) that entities evaluate, with reader counts
+        self._tracked_programs: Counter[str] = Counter()
+        self._program_reads: dict[int, float] = {}
+        self._schedules: dict[str, tuple[list[str], ScheduleIndex]] = {}
+        self._telemetry_flushing = False
+        # Probe glitch filter applied to every new status; anomaly rules get the raw one
+        self.status_filter = (
+            StatusFilter() if entry.options.get(CONF_FILTER, DEFAULT_FILTER) else None
+        )
+        self.anomalies = AnomalyDetector()
+        self.curve: CurveController | None = None
+        self.counters: RuntimeCounters | None = None
+        # Last-known-good serving: consecutive failed polls and when the
+        # last good status was read (monotonic)
+        self.failures = 0
+        self._last_good: float | None = None
+        self._grace_failures = entry.options.get(CONF_GRACE_FAILURES, DEFAULT_GRACE_FAILURES)
+        self._grace_seconds = entry.options.get(CONF_GRACE_SECONDS, DEFAULT_GRACE_SECONDS)
+        # Command traces: finished ones, and written ones awaiting a status
+        self.traces = TraceLog()
+        self._pending_traces: list[
+            tuple[CommandTrace, Callable[[EcoalStatus], bool] | None, float]
+        ] = []
+        self._slow_command = entry.options.get(CONF_SLOW_COMMAND, DEFAULT_SLOW_COMMAND)
+        self._curve_writing = False
+        # Shared by every entity of this entry; sw_version filled on first poll
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="eCoal",
+            manufacturer="eCoal",
+            model="Furnace Controller",
+        )
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_update_data(self) -> EcoalStatus:
         status = await self.client.get_status()
         if status is None:
-            raise UpdateFailed("Failed to get status from furnace")
+            return self._stale_or_fail()
+        # Detected only once the controller answers, so a poll against a
+        # controller that is down costs one timeout; until then the default
+        # (v0.2) profile is used
         if self.firmware_version is None:
-            self.firmware_version = await self.client.get_firmware_version()
+            self.firmware_version = await self.client.detect_profile()
+            self.device_info["sw_version"] = self.firmware_version
+        raw, status = status, self._filter(status)
+        self.failures = 0
+        self._last_good = time.monotonic()
+        self._confirm_traces(status)
         if not self.connected_sensors:
             self.connected_sensors = {
                 name for name in SENSOR_NAMES
-                if status.get(f"{name}_state", 1) == 0
+                if getattr(status, f"{name}_state") == 0
             }
+        self._fire_alarm_edges(status)
+        self._update_clock_drift(status)
+        self._check_anomalies(raw)
+        await self._async_read_tracked()
         return status
+
+    async def _async_read_tracked(self) -> None:
+        """Re-read the parameters and weekly programs entities track, if stale."""
+        if self._polled_params:
+            await self.client.read_param_values(
+                self._polled_params.values(), _PARAM_MAX_AGE
+            )
+        if self._tracked_programs:
+            await self._async_read_programs()
+
+    def _filter(self, status: EcoalStatus) -> EcoalStatus:
+        """Status with glitch-filtered temperatures (the shared one is untouched)."""
+        if self.status_filter is None:
+            return status
+        return self.status_filter.apply(time.time(), status)
+
+    def _stale_or_fail(self) -> EcoalStatus:
+        """Keep serving the last good status within the grace window.
+
+        Entities stay available (and unchanged) until grace_failures polls in
+        a row have failed or the last good status is older than
+        grace_seconds; only then is UpdateFailed raised.
+        """
+        self.failures += 1
+        if self.data is not None and self._last_good is not None:
+            age = time.monotonic() - self._last_good
+            if self.failures < self._grace_failures and age <= self._grace_seconds:
+                _LOGGER.debug(
+                    "Status read from %s failed (%d in a row), serving %.0f s old status",
+                    self.client.host,
+                    self.failures,
+                    age,
+                )
+                return self.data
+        raise UpdateFailed(
+            f"Failed to get status from furnace ({self.failures} failures in a row)"
+        )
+
+    @property
+    def data_age(self) -> float:
+        """Seconds the served status is behind, 0 while polls succeed."""
+        if not self.failures or self._last_good is None:
+            return 0
+        return round(time.monotonic() - self._last_good)
+
+    async def async_traced_write(
+        self,
+        command: str,
+        write: Callable[[], Awaitable[bool]],
+        confirm: Callable[[EcoalStatus], bool] | None = None,
+        refresh: bool = True,
+    ) -> bool:
+        """Run a write and trace it until a status confirms it.
+
+        Spans: "call" (the whole entity call), "write" (with the client's
+        "build" and "http"), then "refresh" up to the next status read and
+        "confirm" up to the first status for which confirm holds. Without
+        refresh the trace ends with the write.
+        """
+        trace = CommandTrace(command)
+        trace.begin("call")
+        with activate(trace), span("write"):
+            ok = await write()
+        if not ok or not refresh:
+            trace.ok = ok
+            trace.end("call")
+            self._finish_trace(trace)
+            return ok
+        trace.begin("refresh")
+        trace.begin("confirm")
+        if len(self._pending_traces) >= _TRACE_PENDING:
+            self._pending_traces.pop(0)
+        self._pending_traces.append((trace, confirm, time.monotonic() + _TRACE_TIMEOUT))
+        await self.async_request_refresh()
+        trace.end("call")
+        return True
+
+    def _confirm_traces(self, status: EcoalStatus) -> None:
+        """Close the refresh span of pending traces and confirm those that match."""
+        if not self._pending_traces:
+            return
+        now = time.monotonic()
+        pending = []
+        for trace, confirm, deadline in self._pending_traces:
+            trace.end("refresh")
+            if confirm is None or confirm(status):
+                trace.end("confirm")
+                trace.confirmed = confirm is not None
+            elif now > deadline:
+                trace.confirmed = False
+            else:
+                pending.append((trace, confirm, deadline))
+                continue
+            if trace.is_open("call"):
+                # Finished by the refresh inside async_traced_write
+                trace.end("call")
+            self._finish_trace(trace)
+        self._pending_traces = pending
+
+    def _finish_trace(self, trace: CommandTrace) -> None:
+        self.traces.add(trace)
+        if self._slow_command and trace.total >= self._slow_command:
+            self.hass.bus.async_fire(
+                EVENT_SLOW_COMMAND, {"entry_id": self.entry_id, **trace.as_dict()}
+            )
+
+    @callback
+    def async_track_param(self, spec: ParamSpec) -> Callable[[], None]:
+        """Keep spec's value current with the polls until the callback is called."""
+        self._polled_params[spec.key] = spec
+
+        @callback
+        def _untrack() -> None:
+            self._polled_params.pop(spec.key, None)
+
+        return _untrack
+
+    @callback
+    def async_track_program(self, name: str) -> Callable[[], None]:
+        """Keep weekly program name read until the callback is called."""
+        self._tracked_programs[name] += 1
+
+        @callback
+        def _untrack() -> None:
+            self._tracked_programs[name] -= 1
+            if self._tracked_programs[name] <= 0:
+                del self._tracked_programs[name]
+
+        return _untrack
+
+    async def _async_read_programs(self) -> None:
+        """Re-read tracked programs older than _PARAM_MAX_AGE.
+
+        Programs written through this client are already current; a failed
+        read keeps the last copy and is retried on the next poll.
+        """
+        client = self.client
+        if FEATURE_WEEKLY_PROGRAM not in client.profile.features:
+            return
+        now = time.monotonic()
+        for name in self._tracked_programs:
+            param = PROGRAMS[name]
+            read_at = self._program_reads.get(param)
+            if (
+                read_at is not None
+                and now - read_at < _PARAM_MAX_AGE
+                and param in client.weekly_programs
+            ):
+                continue
+            if await client.get_weekly_program(param) is not None:
+                self._program_reads[param] = now
+
+    def schedule_index(self, name: str) -> ScheduleIndex | None:
+        """Transition index of weekly program name, rebuilt only when it changes."""
+        days = self.client.weekly_programs.get(PROGRAMS[name])
+        if days is None:
+            return None
+        cached = self._schedules.get(name)
+        if cached is None or cached[0] != days:
+            cached = self._schedules[name] = (list(days), ScheduleIndex(days))
+        return cached[1]
+
+    def controller_now(self) -> datetime:
+        """Current time on the controller clock (naive local), from the drift."""
+        now = dt_util.now().replace(tzinfo=None)
+        if self.clock_drift is None:
+            return now
+        return now + timedelta(seconds=self.clock_drift)
+
+    async def async_edit_program(
+        self, param: int, edit: Callable[[list[str]], list[str]]
+    ) -> bool:
+        """Apply edit to a weekly program and write it if any slot changed.
+
+        Starts from the last program read or written by this client, so
+        edits only cost a read the first time. Each write is verified with
+        a read-back; returns False when the program already matched.
+        """
+        client = self.client
+        if FEATURE_WEEKLY_PROGRAM not in client.profile.features:
+            raise HomeAssistantError(
+                f"Firmware {self.firmware_version} on {client.host} has no weekly programs"
+            )
+        current = client.weekly_programs.get(param)
+        if current is None:
+            current = await client.get_weekly_program(param)
+            if current is None:
+                raise HomeAssistantError(
+                    f"Failed to read weekly program 0x{param:02x} from {client.host}"
+                )
+        target = edit(current)
+        if encode_program(target) == encode_program(current):
+            return False
+        for attempt in range(_PROGRAM_WRITE_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(_PROGRAM_RETRY_DELAY)
+            if not await client.set_weekly_program(param, target):
+                continue
+            readback = await client.get_weekly_program(param)
+            if readback is not None and encode_program(readback) == encode_program(target):
+                return True
+        raise HomeAssistantError(
+            f"Weekly program 0x{param:02x} on {client.host} did not verify "
+            f"after {_PROGRAM_WRITE_ATTEMPTS} attempts"
+        )
+
+    @callback
+    def async_start_watch(self, interval: timedelta) -> Callable[[], None]:
+        """Probe outputs and alarms every interval between full polls."""
+        return async_track_time_interval(self.hass, self._async_watch, interval)
+
+    async def _async_watch(self, now: datetime) -> None:
+        if self._watch_busy or self.data is None:
+            return
+        self._watch_busy = True
+        try:
+            status = await self.client.probe_status(self.data.raw_status)
+        finally:
+            self._watch_busy = False
+        if status is None:
+            return
+        raw, status = status, self._filter(status)
+        self._fire_alarm_edges(status)
+        self._check_anomalies(raw)
+        self._confirm_traces(status)
+        # Not async_set_updated_data: that would push the next full poll back
+        # every time an output changes
+        self.data = status
+        self.async_update_listeners()
+
+    @callback
+    def async_start_gateway(self, entry: ConfigEntry, url: str) -> None:
+        """Follow status frames pushed by a gateway instead of polling.
+
+        Frames carry no parameters or weekly programs, so those are still
+        read directly while the stream replaces the status poll.
+        """
+        entry.async_create_background_task(
+            self.hass, self._async_follow_gateway(url), f"eCoal gateway {url}"
+        )
+        entry.async_on_unload(
+            async_track_time_interval(
+                self.hass, self._async_push_refresh, _PUSH_REFRESH_INTERVAL
+            )
+        )
+
+    async def _async_push_refresh(self, now: datetime) -> None:
+        # Polls do this themselves while the stream is down
+        if self.update_interval is not None or self.data is None:
+            return
+        await self._async_read_tracked()
+        self.async_update_listeners()
+
+    async def _async_follow_gateway(self, url: str) -> None:
+        """Apply pushed frames; fall back to polling while the stream is down."""
+        import aiohttp
+
+        from .pyecoal.gateway import subscribe
+
+        session = async_get_clientsession(self.hass)
+        while True:
+            try:
+                async for vals in subscribe(url, session):
+                    if len(vals) < self.client.profile.status_len:
+                        continue
+                    self.update_interval = None
+                    status = self.client.decode_status(vals)
+                    self.client.store_status(status)
+                    raw, status = status, self._filter(status)
+                    self.failures = 0
+                    self._last_good = time.monotonic()
+                    self._fire_alarm_edges(status)
+                    self._update_clock_drift(status)
+                    self._check_anomalies(raw)
+                    self._confirm_traces(status)
+                    self.async_set_updated_data(status)
+            except (aiohttp.ClientError, TimeoutError) as err:
+                _LOGGER.debug("eCoal gateway %s unavailable: %s", url, err)
+            except (ValueError, IndexError, KeyError, TypeError) as err:
+                # A frame of the right length that still fails to decode
+                _LOGGER.warning(
+                    "Undecodable frame from eCoal gateway %s, reconnecting: %s", url, err
+                )
+            if self.update_interval is None:
+                self.update_interval = UPDATE_INTERVAL
+                await self.async_request_refresh()
+            await asyncio.sleep(_GATEWAY_RETRY)
+
+    @callback
+    def async_start_telemetry(self, writer: TelemetryWriter) -> Callable[[], None]:
+        """Append every new status to writer; writes happen in the executor.
+
+        Records are flushed once flush_records are queued and at least every
+        few minutes; the returned callback stops recording and flushes the
+        rest.
+        """
+        last: EcoalStatus | None = None
+
+        @callback
+        def _append() -> None:
+            nonlocal last
+            status = self.data
+            if status is None or status is last:
+                return
+            last = status
+            writer.append(time.time(), status.raw_status)
+            if writer.pending >= writer.flush_records:
+                self.hass.async_create_task(self._async_flush_telemetry(writer))
+
+        @callback
+        def _flush(now: datetime) -> None:
+            if writer.pending:
+                self.hass.async_create_task(self._async_flush_telemetry(writer))
+
+        remove_listener = self.async_add_listener(_append)
+        cancel_timer = async_track_time_interval(
+            self.hass, _flush, _TELEMETRY_FLUSH_INTERVAL
+        )
+
+        @callback
+        def _stop() -> None:
+            remove_listener()
+            cancel_timer()
+            self.hass.async_add_executor_job(writer.flush)
+
+        return _stop
+
+    @callback
+    def async_start_curve(self, curve: CurveController) -> Callable[[], None]:
+        """Write the CO setpoint computed by curve after each new status.
+
+        Needs a connected outdoor sensor; the indoor sensor is used when
+        connected. Returns a callback that stops the curve.
+        """
+        self.curve = curve
+        use_indoor = "indoor_temp" in self.connected_sensors
+
+        @callback
+        def _evaluate() -> None:
+            status = self.data
+            if (
+                status is None
+                or not self.last_update_success
+                or self.failures
+                or self._curve_writing
+                or status.outdoor_temp_state != 0
+            ):
+                return
+            indoor = (
+                status.indoor_temp
+                if use_indoor and status.indoor_temp_state == 0
+                else None
+            )
+            setpoint = curve.update(
+                time.monotonic(), status.outdoor_temp, indoor, status.target_boiler_temp
+            )
+            if setpoint is not None:
+                self._curve_writing = True
+                self.hass.async_create_task(self._async_write_curve(curve, setpoint))
+
+        remove_listener = self.async_add_listener(_evaluate)
+
+        @callback
+        def _stop() -> None:
+            remove_listener()
+            self.curve = None
+
+        return _stop
+
+    async def _async_write_curve(self, curve: CurveController, setpoint: int) -> None:
+        try:
+            written = await self.async_traced_write(
+                "curve",
+                partial(self.client.set_target_boiler_temp, setpoint),
+                lambda status: status.target_boiler_temp == setpoint,
+            )
+        finally:
+            self._curve_writing = False
+        if not written:
+            _LOGGER.warning(
+                "Failed to write curve setpoint %d to %s", setpoint, self.client.host
+            )
+            return
+        curve.written(time.monotonic())
+        _LOGGER.debug("Curve setpoint %d written to %s", setpoint, self.client.host)
+
+    async def async_start_counters(
+        self, counters: RuntimeCounters, store: Store[dict]
+    ) -> Callable[[], None]:
+        """Restore counters from store and integrate every new status into them.
+
+        Totals are saved every few minutes, on HA stop and when stopped,
+        never per poll. Returns a callback that stops counting.
+        """
+        if (saved := await store.async_load()) is not None:
+            counters.restore(saved)
+        self.counters = counters
+        last: EcoalStatus | None = None
+
+        @callback
+        def _integrate() -> None:
+            nonlocal last
+            status = self.data
+            # Stale statuses carry no new information about the outputs
+            if status is None or status is last or self.failures:
+                return
+            last = status
+            counters.update(time.monotonic(), status)
+
+        @callback
+        def _save(_: datetime | Event | None = None) -> None:
+            store.async_delay_save(counters.as_dict)
+
+        remove_listener = self.async_add_listener(_integrate)
+        cancel_timer = async_track_time_interval(
+            self.hass, _save, _COUNTERS_SAVE_INTERVAL
+        )
+        remove_stop = self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _save)
+
+        @callback
+        def _stop() -> None:
+            remove_listener()
+            cancel_timer()
+            remove_stop()
+            _save()
+            self.counters = None
+
+        return _stop
+
+    async def _async_flush_telemetry(self, writer: TelemetryWriter) -> None:
+        if self._telemetry_flushing:
+            return
+        self._telemetry_flushing = True
+        try:
+            await self.hass.async_add_executor_job(writer.flush)
+        except OSError as err:
+            _LOGGER.warning("Failed to write eCoal telemetry: %s", err)
+        finally:
+            self._telemetry_flushing = False
+        if writer.dropped:
+            _LOGGER.debug("eCoal telemetry dropped %d records so far", writer.dropped)
+
+    def _update_clock_drift(self, status: EcoalStatus) -> None:
+        if status.controller_clock is None:
+            return
+        now = dt_util.now().replace(tzinfo=None)
+        sample = (status.controller_clock - now).total_seconds()
+        if self.clock_drift is None:
+            self.clock_drift = sample
+        else:
+            self.clock_drift += _DRIFT_ALPHA * (sample - self.clock_drift)
+
+    def _fire_alarm_edges(self, status: EcoalStatus) -> None:
+        """Fire an event for every alarm bit that flipped since the last poll.
+
+        The first poll only records the baseline, so a restart does not
+        replay alarms that were already active.
+        """
+        mask = status.alarms_raw | (status.alarms2_raw << 16)
+        previous, self._alarm_mask = self._alarm_mask, mask
+        if previous is None:
+            return
+        changed = mask ^ previous
+        while changed:
+            low = changed & -changed
+            self.hass.bus.async_fire(
+                EVENT_ALARM,
+                {
+                    "entry_id": self.entry_id,
+                    "alarm": _ALARM_BITS[low.bit_length() - 1],
+                    "state": "fired" if mask & low else "cleared",
+                },
+            )
+            changed ^= low
+
+    def _check_anomalies(self, status: EcoalStatus) -> None:
+        """Feed the unfiltered status to the anomaly rules, fire an event per change."""
+        for anomaly, active in self.anomalies.update(time.time(), status):
+            _LOGGER.log(
+                logging.WARNING if active else logging.INFO,
+                "eCoal %s: anomaly %s %s",
+                self.client.host,
+                anomaly,
+                "raised" if active else "cleared",
+            )
+            self.hass.bus.async_fire(
+                EVENT_ANOMALY,
+                {
+                    "entry_id": self.entry_id,
+                    "anomaly": anomaly,
+                    "state": "raised" if active else "cleared",
+                },
+            )
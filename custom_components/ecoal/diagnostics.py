@@ -0,0 +1,79 @@
+"""Diagnostics support for eCoal.
+
+Everything here comes from buffers the client and coordinator already keep;
+downloading diagnostics never sends a request to the controller.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import EcoalCoordinator
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    coordinator: EcoalCoordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.client
+    status = coordinator.data
+    cache = client.status_cache
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "firmware_version": coordinator.firmware_version,
+        "profile": client.profile.name,
+        "connected_sensors": sorted(coordinator.connected_sensors),
+        "clock_drift": coordinator.clock_drift,
+        "probe_filter": (
+            None if coordinator.status_filter is None else coordinator.status_filter.as_dict()
+        ),
+        "anomalies": coordinator.anomalies.as_dict(),
+        "counters": None if coordinator.counters is None else coordinator.counters.as_dict(),
+        "curve": None if coordinator.curve is None else coordinator.curve.as_dict(),
+        "last_update_success": coordinator.last_update_success,
+        "consecutive_failures": coordinator.failures,
+        "data_age": coordinator.data_age,
+        "status_cache_age": None if cache is None else cache.age(client.cache_key),
+        "status": None if status is None else {
+            key: value
+            for key, value in asdict(status).items()
+            if key not in ("raw_status", "controller_clock")
+        },
+        "recent_frames": [
+            {
+                "time": datetime.fromtimestamp(ts, timezone.utc).isoformat(),
+                "command": cmd,
+                "response": vals,
+            }
+            for ts, cmd, vals in client.recent_frames
+        ],
+        "settings_frame": client.settings_frame,
+        "param_values": {
+            f"0x{param:02x}": value for param, (_, value) in client.param_values.items()
+        },
+        "weekly_programs": {
+            f"0x{param:02x}": days for param, days in client.weekly_programs.items()
+        },
+        "command_stats": {
+            kind: stats.as_dict() for kind, stats in client.command_stats.items()
+        },
+        "decode_stats": client.decode_stats.as_dict(),
+        "timeouts": None if client.timeouts is None else client.timeouts.as_dict(),
+        "command_traces": {
+            "summary": coordinator.traces.summary(),
+            "recent": [trace.as_dict() for trace in list(coordinator.traces.traces)[-16:]],
+        },
+    }
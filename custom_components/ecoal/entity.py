@@ -0,0 +1,66 @@
+"""Base entity for eCoal."""
+from __future__ import annotations
+
+from functools import partial
+from operator import attrgetter
+
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import EcoalCoordinator
+from .pyecoal.params import ParamSpec
+
+
+class EcoalEntity(CoordinatorEntity[EcoalCoordinator]):
+    """Entity bound to the shared eCoal device of a config entry."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: EcoalCoordinator, unique_key: str) -> None:
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.entry_id}_{unique_key}"
+        self._attr_device_info = coordinator.device_info
+
+
+class EcoalParamEntity(EcoalEntity):
+    """Entity for one registry parameter, read from the status frame when it
+    carries the value and otherwise from the client's parameter cache."""
+
+    def __init__(self, coordinator: EcoalCoordinator, spec: ParamSpec) -> None:
+        super().__init__(coordinator, f"param_{spec.key}")
+        self._spec = spec
+        self._status_value = (
+            attrgetter(spec.status_field) if spec.status_field is not None else None
+        )
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if self._status_value is None:
+            self.async_on_remove(self.coordinator.async_track_param(self._spec))
+
+    @property
+    def param_value(self) -> int | float | None:
+        if self._status_value is not None:
+            data = self.coordinator.data
+            return None if data is None else self._status_value(data)
+        cached = self.coordinator.client.param_values.get(self._spec.param)
+        return None if cached is None else cached[1]
+
+    async def async_write_param(self, value: int) -> None:
+        client = self.coordinator.client
+        try:
+            value = self._spec.validate(value)
+        except ValueError as err:
+            raise ServiceValidationError(str(err)) from err
+        status_value = self._status_value
+        # Values outside the status frame need no refresh to show
+        written = await self.coordinator.async_traced_write(
+            self._spec.key,
+            partial(client.write_param_value, self._spec, value),
+            None if status_value is None else lambda status: status_value(status) == value,
+            refresh=status_value is not None,
+        )
+        if not written:
+            raise HomeAssistantError(f"Failed to write {self._spec.key} on {client.host}")
+        if status_value is None:
+            self.async_write_ha_state()
@@ -0,0 +1,91 @@
+"""Number entities for eCoal, generated from the parameter registry."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.components.number import (
+    NumberDeviceClass,
+    NumberEntity,
+    NumberEntityDescription,
+    NumberMode,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import EcoalCoordinator
+from .entity import EcoalParamEntity
+from .pyecoal.params import PARAMS, ParamSpec
+
+# Set through the climate entities instead
+_CLIMATE_PARAMS = {"co_target_temp", "cwu_target_temp"}
+
+_DEVICE_CLASSES = {
+    UnitOfTemperature.CELSIUS: NumberDeviceClass.TEMPERATURE,
+    UnitOfTime.SECONDS: NumberDeviceClass.DURATION,
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class EcoalNumberDescription(NumberEntityDescription):
+    spec: ParamSpec
+
+
+def _describe(spec: ParamSpec) -> EcoalNumberDescription:
+    return EcoalNumberDescription(
+        key=spec.key,
+        translation_key=spec.key,
+        spec=spec,
+        device_class=_DEVICE_CLASSES.get(spec.unit),
+        native_unit_of_measurement=spec.unit,
+        native_min_value=spec.min,
+        native_max_value=spec.max,
+        native_step=1,
+        mode=NumberMode.BOX,
+        entity_category=EntityCategory.CONFIG,
+        # Values outside the status frame cost a read of their own
+        entity_registry_enabled_default=spec.status_field is not None,
+    )
+
+
+NUMBER_DESCRIPTIONS: tuple[EcoalNumberDescription, ...] = tuple(
+    _describe(spec)
+    for spec in PARAMS
+    if spec.options is None and spec.key not in _CLIMATE_PARAMS
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    coordinator: EcoalCoordinator = hass.data[DOMAIN][entry.entry_id]
+    connected = coordinator.connected_sensors
+    async_add_entities(
+        EcoalNumber(coordinator, description)
+        for description in NUMBER_DESCRIPTIONS
+        if not description.spec.requires_sensor
+        or description.spec.requires_sensor in connected
+    )
+
+
+class EcoalNumber(EcoalParamEntity, NumberEntity):
+    entity_description: EcoalNumberDescription
+
+    def __init__(
+        self,
+        coordinator: EcoalCoordinator,
+        description: EcoalNumberDescription,
+    ) -> None:
+        super().__init__(coordinator, description.spec)
+        self.entity_description = description
+
+    @property
+    def native_value(self) -> float | None:
+        return self.param_value
+
+    async def async_set_native_value(self, value: float) -> None:
+        await self.async_write_param(round(value))
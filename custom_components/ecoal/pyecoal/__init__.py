@@ -0,0 +1,150 @@
+"""eCoal controller protocol library, independent of Home Assistant.
+
+Layers:
+- codec: frame builder, CRC, status/program decoders (pure, no I/O)
+- profiles: firmware-specific protocol profiles
+- params: declarative registry of writable parameters
+- schedule: weekly program editing and lookup helpers (pure)
+- anomaly: constant-memory anomaly rules over the status stream (pure)
+- curve: weather-compensated setpoint with write suppression (pure)
+- filters: per-probe median and rate-limit glitch filter (pure)
+- counters: output runtime and estimated fuel/heat totals (pure)
+- transport: aiohttp (async) and urllib (blocking) transports
+- client: EcoalClient (async) and EcoalSyncClient (blocking)
+- cache: shared single-flight status cache
+- trace: per-command latency spans and a ring buffer of finished traces
+- capture: protocol capture writer and replay transport
+- gateway: SSE gateway fanning one poll stream out to many consumers
+- telemetry: fixed-width binary status-frame files and an mmap range reader
+- discovery: network scan and controller fingerprinting
+
+Only codec and profiles are imported eagerly; client, transport, cache,
+capture, gateway and telemetry load on first attribute access, and aiohttp
+only when an AiohttpTransport is created.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .codec import (
+    ALARM2_NAMES,
+    ALARM_NAMES,
+    BITS_TABLE,
+    CMD_AUTO_OFF,
+    CMD_AUTO_ON,
+    CMD_SETTINGS,
+    CMD_STATUS,
+    CWU_MODE_AUTO_PROG,
+    CWU_MODE_AUTO_TEMP,
+    CWU_MODE_OFF,
+    CWU_MODE_SUMMER,
+    CWU_MODE_WINTER,
+    INPUT_NAMES,
+    OUTPUT_NAMES,
+    PARAM_CO_OBNIZONA,
+    PARAM_CO_ZADANA,
+    PARAM_CWU_OBNIZONA,
+    PARAM_CWU_TRYB,
+    PARAM_CWU_ZADANA,
+    PARAM_MIESZ_AKTYWACJA,
+    PARAM_PODL_DZIENNA,
+    PARAM_PODL_NOCNA,
+    PARAM_PROG_CO_TAB,
+    PARAM_PROG_CWU_TAB,
+    PARAM_PROG_PODL_TAB,
+    PARAM_TRYB_PRACY,
+    SENSOR_NAMES,
+    WATCH_BYTES,
+    EcoalStatus,
+)
+from .profiles import DEFAULT_PROFILE, PROFILES, ProtocolProfile, select_profile
+
+if TYPE_CHECKING:
+    from .cache import StatusCache
+    from .capture import (
+        CaptureRecord,
+        CaptureWriter,
+        ReplayClient,
+        ReplayTransport,
+        read_capture,
+    )
+    from .client import EcoalClient, EcoalSyncClient
+    from .gateway import EcoalGateway
+    from .telemetry import TelemetryReader, TelemetryWriter
+    from .transport import AiohttpTransport, BlockingTransport
+
+_LAZY_ATTRS = {
+    "AiohttpTransport": "transport",
+    "BlockingTransport": "transport",
+    "CaptureRecord": "capture",
+    "CaptureWriter": "capture",
+    "EcoalClient": "client",
+    "EcoalGateway": "gateway",
+    "EcoalSyncClient": "client",
+    "ReplayClient": "capture",
+    "ReplayTransport": "capture",
+    "StatusCache": "cache",
+    "TelemetryReader": "telemetry",
+    "TelemetryWriter": "telemetry",
+    "read_capture": "capture",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "ALARM2_NAMES",
+    "ALARM_NAMES",
+    "BITS_TABLE",
+    "CMD_AUTO_OFF",
+    "CMD_AUTO_ON",
+    "CMD_SETTINGS",
+    "CMD_STATUS",
+    "CWU_MODE_AUTO_PROG",
+    "CWU_MODE_AUTO_TEMP",
+    "CWU_MODE_OFF",
+    "CWU_MODE_SUMMER",
+    "CWU_MODE_WINTER",
+    "DEFAULT_PROFILE",
+    "INPUT_NAMES",
+    "OUTPUT_NAMES",
+    "PARAM_CO_OBNIZONA",
+    "PARAM_CO_ZADANA",
+    "PARAM_CWU_OBNIZONA",
+    "PARAM_CWU_TRYB",
+    "PARAM_CWU_ZADANA",
+    "PARAM_MIESZ_AKTYWACJA",
+    "PARAM_PODL_DZIENNA",
+    "PARAM_PODL_NOCNA",
+    "PARAM_PROG_CO_TAB",
+    "PARAM_PROG_CWU_TAB",
+    "PARAM_PROG_PODL_TAB",
+    "PARAM_TRYB_PRACY",
+    "PROFILES",
+    "SENSOR_NAMES",
+    "WATCH_BYTES",
+    "AiohttpTransport",
+    "BlockingTransport",
+    "CaptureRecord",
+    "CaptureWriter",
+    "EcoalClient",
+    "EcoalGateway",
+    "EcoalStatus",
+    "EcoalSyncClient",
+    "ProtocolProfile",
+    "ReplayClient",
+    "ReplayTransport",
+    "StatusCache",
+    "TelemetryReader",
+    "TelemetryWriter",
+    "read_capture",
+    "select_profile",
+]
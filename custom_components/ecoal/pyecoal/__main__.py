@@ -0,0 +1,6 @@
+"""Entry point for `python -m pyecoal`; in this repository use scripts/pyecoal_cli.py."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
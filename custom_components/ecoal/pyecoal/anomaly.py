@@ -0,0 +1,211 @@
+"""Streaming anomaly rules over the status stream.
+
+Each watched channel keeps an exponentially weighted mean, variance and
+slope (degrees per minute), so a detector holds a few floats per channel
+whatever the history length and costs O(1) per status. Rules combine
+channels with output states:
+
+- exhaust_rise_blower_off: exhaust keeps heating up although the blower has
+  been off for a while (uncontrolled draft, fire outside the grate)
+- feeder_burnback: feeder temperature well above its own baseline and still
+  rising (fire creeping back into the feeder)
+- return_delta_collapse: with the CH pump running, boiler minus return falls
+  to a fraction of its usual value (no heat drawn from the circuit)
+
+A rule is raised only after it holds for `hold` consecutive samples and
+cleared after the same number of samples without it, so single noisy
+readings neither raise nor clear it. The rules read unfiltered
+temperatures: the glitch filter's median and rate limit would delay and
+flatten exactly the fast rises they look for, so only readings outside the
+plausible probe range are skipped here.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from .codec import EcoalStatus
+from .filters import MAX_TEMP, MIN_TEMP
+
+ANOMALY_NAMES = ("exhaust_rise_blower_off", "feeder_burnback", "return_delta_collapse")
+
+# Sensors each rule reads; a rule is skipped while one is disconnected
+ANOMALY_SENSORS = {
+    "exhaust_rise_blower_off": ("exhaust_temp",),
+    "feeder_burnback": ("feeder_temp",),
+    "return_delta_collapse": ("boiler_temp", "return_temp"),
+}
+
+
+def _reading(status: EcoalStatus, name: str) -> float | None:
+    """Temperature of a connected probe, None if disconnected or implausible."""
+    if getattr(status, f"{name}_state") != 0:
+        return None
+    value = getattr(status, name)
+    return value if MIN_TEMP <= value <= MAX_TEMP else None
+
+
+class EwmaChannel:
+    """Exponentially weighted mean, variance and slope of one signal.
+
+    The slope is a weighted average of the per-minute change between
+    consecutive samples, so irregular sample intervals are handled. With
+    learn=False a sample moves the slope but not the mean and variance, which
+    keeps a baseline from following the excursion it is meant to detect.
+    """
+
+    __slots__ = ("alpha", "slope_alpha", "count", "mean", "var", "slope", "_last", "_time")
+
+    def __init__(self, alpha: float, slope_alpha: float = 0.3) -> None:
+        self.alpha = alpha
+        self.slope_alpha = slope_alpha
+        self.count = 0
+        self.mean = 0.0
+        self.var = 0.0
+        self.slope = 0.0
+        self._last = 0.0
+        self._time = 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.var)
+
+    def add(self, timestamp: float, value: float, learn: bool = True) -> None:
+        if self.count == 0:
+            self.mean = value
+        else:
+            elapsed = timestamp - self._time
+            if elapsed > 0:
+                rate = (value - self._last) * 60 / elapsed
+                self.slope += self.slope_alpha * (rate - self.slope)
+        if self.count and learn:
+            diff = value - self.mean
+            incr = self.alpha * diff
+            self.mean += incr
+            self.var = (1 - self.alpha) * (self.var + diff * incr)
+        self.count += 1
+        self._last = value
+        self._time = timestamp
+
+
+@dataclass(frozen=True, kw_only=True)
+class AnomalyThresholds:
+    """Limits of the built-in rules; temperatures in C, slopes in C/min."""
+
+    # Samples seen before any rule is evaluated
+    warmup: int = 10
+    # Consecutive samples a rule must hold (or not hold) to change state
+    hold: int = 3
+    # Seconds the blower must be off before exhaust should be cooling
+    blower_off_grace: float = 120.0
+    exhaust_slope: float = 1.5
+    feeder_slope: float = 0.5
+    # Feeder rise over its baseline: at least this many std devs and degrees
+    feeder_sigmas: float = 4.0
+    feeder_min_rise: float = 8.0
+    # Baseline boiler-return delta needed before a collapse is meaningful
+    delta_min_baseline: float = 5.0
+    delta_collapse_ratio: float = 0.3
+
+
+class AnomalyDetector:
+    """Evaluate the anomaly rules for one controller, one status at a time."""
+
+    def __init__(self, thresholds: AnomalyThresholds | None = None) -> None:
+        self.thresholds = thresholds or AnomalyThresholds()
+        self.exhaust = EwmaChannel(alpha=0.1)
+        # Slow baseline so a burn-back stands out from normal feeder warming
+        self.feeder = EwmaChannel(alpha=0.02)
+        self.delta = EwmaChannel(alpha=0.02)
+        self.delta_fast = EwmaChannel(alpha=0.3)
+        self.active: set[str] = set()
+        self._streaks = dict.fromkeys(ANOMALY_NAMES, 0)
+        self._blower_off_since: float | None = None
+
+    def update(self, timestamp: float, status: EcoalStatus) -> list[tuple[str, bool]]:
+        """Feed one status; returns the (rule, active) pairs that changed."""
+        limits = self.thresholds
+        candidates: dict[str, bool] = {}
+
+        if status.air_pump:
+            self._blower_off_since = None
+        elif self._blower_off_since is None:
+            self._blower_off_since = timestamp
+
+        if (exhaust_temp := _reading(status, "exhaust_temp")) is not None:
+            exhaust = self.exhaust
+            exhaust.add(timestamp, exhaust_temp)
+            if exhaust.count > limits.warmup:
+                candidates["exhaust_rise_blower_off"] = (
+                    self._blower_off_since is not None
+                    and timestamp - self._blower_off_since >= limits.blower_off_grace
+                    and exhaust.slope > limits.exhaust_slope
+                )
+
+        if (feeder_temp := _reading(status, "feeder_temp")) is not None:
+            feeder = self.feeder
+            # The baseline stands still while the feeder is heating up
+            feeder.add(timestamp, feeder_temp, learn=feeder.slope <= limits.feeder_slope)
+            rise = feeder_temp - feeder.mean
+            spread = feeder.std
+            if feeder.count > limits.warmup:
+                candidates["feeder_burnback"] = (
+                    feeder.slope > limits.feeder_slope
+                    and rise > max(limits.feeder_min_rise, limits.feeder_sigmas * spread)
+                )
+
+        boiler_temp = _reading(status, "boiler_temp")
+        return_temp = _reading(status, "return_temp")
+        if boiler_temp is not None and return_temp is not None:
+            value = boiler_temp - return_temp
+            self.delta_fast.add(timestamp, value)
+            if status.ch_pump:
+                baseline = self.delta.mean if self.delta.count else value
+                if self.delta.count > limits.warmup:
+                    candidates["return_delta_collapse"] = (
+                        baseline >= limits.delta_min_baseline
+                        and self.delta_fast.mean < limits.delta_collapse_ratio * baseline
+                    )
+                # Learn the usual delta only outside a collapse
+                if "return_delta_collapse" not in self.active:
+                    self.delta.add(timestamp, value)
+            elif "return_delta_collapse" in self.active:
+                candidates["return_delta_collapse"] = False
+
+        changes = []
+        for name, hit in candidates.items():
+            changes.extend(self._debounce(name, hit))
+        return changes
+
+    def _debounce(self, name: str, hit: bool) -> list[tuple[str, bool]]:
+        if hit == (name in self.active):
+            self._streaks[name] = 0
+            return []
+        self._streaks[name] += 1
+        if self._streaks[name] < self.thresholds.hold:
+            return []
+        self._streaks[name] = 0
+        if hit:
+            self.active.add(name)
+        else:
+            self.active.discard(name)
+        return [(name, hit)]
+
+    def as_dict(self) -> dict[str, object]:
+        """Channel state and active rules, for diagnostics."""
+
+        def channel(ch: EwmaChannel) -> dict[str, float | int]:
+            return {
+                "count": ch.count,
+                "mean": round(ch.mean, 2),
+                "std": round(ch.std, 2),
+                "slope_per_min": round(ch.slope, 3),
+            }
+
+        return {
+            "active": sorted(self.active),
+            "exhaust": channel(self.exhaust),
+            "feeder": channel(self.feeder),
+            "return_delta": channel(self.delta),
+            "return_delta_fast": channel(self.delta_fast),
+        }
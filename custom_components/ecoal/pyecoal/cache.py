@@ -0,0 +1,81 @@
+"""Shared status cache for clients talking to the same controller.
+
+Status reads for one key are single-flight: callers arriving while a read is
+in progress await that read instead of sending their own frame, and a
+decoded status is served to later callers until it is older than the TTL.
+Sending a command that changes controller state (a write, switch or mode
+change) invalidates the key, so a read after a write always reaches the
+controller; read-only commands leave it alone.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+
+from .codec import EcoalStatus
+
+DEFAULT_TTL = 5.0
+
+
+class StatusCache:
+    """Latest status per controller, with single-flight reads."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL) -> None:
+        self.ttl = ttl
+        self._frames: dict[Hashable, tuple[float, EcoalStatus]] = {}
+        self._inflight: dict[Hashable, asyncio.Future[EcoalStatus | None]] = {}
+
+    async def fetch(
+        self,
+        key: Hashable,
+        read: Callable[[], Awaitable[EcoalStatus | None]],
+        max_age: float | None = None,
+    ) -> EcoalStatus | None:
+        """Return a status no older than max_age (default ttl), reading if needed."""
+        cached = self.latest(key, self.ttl if max_age is None else max_age)
+        if cached is not None:
+            return cached
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(read())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._read_done(key, done))
+        # A cancelled caller must not cancel the read other callers share
+        return await asyncio.shield(task)
+
+    def latest(self, key: Hashable, max_age: float | None = None) -> EcoalStatus | None:
+        """Cached status for key without reading, or None if missing or too old."""
+        entry = self._frames.get(key)
+        if entry is None:
+            return None
+        if max_age is not None and time.monotonic() - entry[0] > max_age:
+            return None
+        return entry[1]
+
+    def age(self, key: Hashable) -> float | None:
+        """Seconds since the cached status for key was stored."""
+        entry = self._frames.get(key)
+        return None if entry is None else time.monotonic() - entry[0]
+
+    def put(self, key: Hashable, status: EcoalStatus) -> None:
+        """Store a status obtained outside fetch (probe, gateway push)."""
+        self._frames[key] = (time.monotonic(), status)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forget the cached status; an in-flight read is not stored either."""
+        self._frames.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def _read_done(self, key: Hashable, task: asyncio.Future[EcoalStatus | None]) -> None:
+        if self._inflight.get(key) is not task:
+            # Invalidated while reading: the result may predate a write
+            if not task.cancelled():
+                task.exception()
+            return
+        del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        status = task.result()
+        if status is not None:
+            self._frames[key] = (time.monotonic(), status)
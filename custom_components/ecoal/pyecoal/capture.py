@@ -0,0 +1,109 @@
+"""Protocol capture and replay for eCoal.
+
+Captures are UTF-8 text, one exchange per line:
+``<unix time>\\t<request hex>\\t<JSON-quoted response body>``.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+from .client import EcoalClient
+
+
+class CaptureRecord(NamedTuple):
+    timestamp: float
+    cmd: str
+    body: str
+
+
+class CaptureWriter:
+    """Append-only capture file, rotated to path.1..path.N past max_bytes."""
+
+    def __init__(self, path: str, max_bytes: int = 1_000_000, backups: int = 3) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+
+    async def async_write(self, cmd: str, body: str) -> None:
+        line = f"{time.time():.3f}\t{cmd}\t{json.dumps(body)}\n"
+        await asyncio.get_running_loop().run_in_executor(None, self.write_line, line)
+
+    def write_line(self, line: str) -> None:
+        with self._lock:
+            try:
+                size = os.path.getsize(self.path)
+            except OSError:
+                size = 0
+            if size and size + len(line) > self.max_bytes:
+                self._rotate()
+            with open(self.path, "a", encoding="utf-8") as fp:
+                fp.write(line)
+
+    def _rotate(self) -> None:
+        for idx in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{idx}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{idx + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+
+def read_capture(*paths: str) -> Iterator[CaptureRecord]:
+    """Yield records from capture files, oldest file first."""
+    for path in paths:
+        with open(path, encoding="utf-8") as fp:
+            for line in fp:
+                ts, cmd, body = line.rstrip("\n").split("\t", 2)
+                yield CaptureRecord(float(ts), cmd, json.loads(body))
+
+
+class ReplayTransport:
+    """Async transport that answers from captured records instead of the network.
+
+    Each command gets the next captured response for the same request hex.
+    speed=1 keeps the original timing, higher values replay faster and 0
+    replays without waiting. Commands with no records left fail like a
+    dropped connection.
+    """
+
+    def __init__(self, records: Iterable[CaptureRecord], speed: float = 0) -> None:
+        self._speed = speed
+        self._queues: dict[str, deque[CaptureRecord]] = {}
+        for record in records:
+            self._queues.setdefault(record.cmd, deque()).append(record)
+        starts = [queue[0].timestamp for queue in self._queues.values()]
+        self._first_ts = min(starts, default=0.0)
+        self._started: float | None = None
+
+    async def fetch(self, cmd: str) -> str | None:
+        queue = self._queues.get(cmd)
+        if not queue:
+            return None
+        record = queue.popleft()
+        if self._speed:
+            now = time.monotonic()
+            if self._started is None:
+                self._started = now
+            due = self._started + (record.timestamp - self._first_ts) / self._speed
+            if due > now:
+                await asyncio.sleep(due - now)
+        return record.body
+
+
+class ReplayClient(EcoalClient):
+    """EcoalClient wired to a ReplayTransport, usable with EcoalCoordinator."""
+
+    def __init__(
+        self, records: Iterable[CaptureRecord], speed: float = 0, host: str = "replay"
+    ) -> None:
+        super().__init__(host, transport=ReplayTransport(records, speed))
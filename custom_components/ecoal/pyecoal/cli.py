@@ -0,0 +1,284 @@
+"""Command line tool for eCoal controllers, without Home Assistant.
+
+Run from the repository root through scripts/pyecoal_cli.py, which keeps
+custom_components/ecoal (and its select.py) off the import path, e.g.:
+    python scripts/pyecoal_cli.py -u admin -p secret status 192.168.1.10 192.168.1.11
+    python scripts/pyecoal_cli.py -u admin -p secret status --hosts-file boilers.txt \\
+        --format csv --watch --interval 10 --concurrency 16
+    python scripts/pyecoal_cli.py -u admin -p secret read-param 192.168.1.10 0x28
+    python scripts/pyecoal_cli.py -u admin -p secret write-param 192.168.1.10 0x28 65
+    python scripts/pyecoal_cli.py -u admin -p secret get-program 192.168.1.10 co > co.txt
+    python scripts/pyecoal_cli.py -u admin -p secret set-program 192.168.1.10 co co.txt
+
+    python scripts/pyecoal_cli.py -u admin -p secret gateway 192.168.1.10 --port 8765
+    python scripts/pyecoal_cli.py -u admin -p secret discover 192.168.1.0/24 --concurrency 64
+    python scripts/pyecoal_cli.py telemetry /config/ecoal_telemetry/<entry_id> \\
+        --start 2024-01-01T00:00 --end 2024-01-02T00:00 --format csv
+
+Credentials may also come from ECOAL_USERNAME / ECOAL_PASSWORD.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import dataclasses
+import json
+import os
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+from .client import EcoalClient
+from .codec import EcoalStatus
+from .schedule import PROGRAMS
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# Columns written for each status; the raw frame and parsed clock are omitted
+STATUS_FIELDS = [
+    field.name
+    for field in dataclasses.fields(EcoalStatus)
+    if field.name not in ("raw_status", "controller_clock")
+]
+
+
+def _status_row(host: str, status: EcoalStatus | None) -> dict[str, Any]:
+    row: dict[str, Any] = {"time": round(time.time(), 3), "host": host}
+    if status is None:
+        row["error"] = "no response"
+        return row
+    for name in STATUS_FIELDS:
+        row[name] = getattr(status, name)
+    return row
+
+
+class _StatusWriter:
+    def __init__(self, fmt: str) -> None:
+        self._fmt = fmt
+        self._csv: csv.DictWriter | None = None
+
+    def write(self, row: dict[str, Any]) -> None:
+        if self._fmt == "jsonl":
+            sys.stdout.write(json.dumps(row) + "\n")
+        elif "error" in row:
+            print(f"{row['host']}: {row['error']}", file=sys.stderr)
+            return
+        else:
+            if self._csv is None:
+                self._csv = csv.DictWriter(sys.stdout, ["time", "host", *STATUS_FIELDS])
+                self._csv.writeheader()
+            self._csv.writerow(row)
+        sys.stdout.flush()
+
+
+async def _poll_once(
+    clients: list[EcoalClient], writer: _StatusWriter, limit: asyncio.Semaphore
+) -> None:
+    async def poll(client: EcoalClient) -> None:
+        async with limit:
+            status = await client.get_status()
+        writer.write(_status_row(client.host, status))
+
+    await asyncio.gather(*(poll(client) for client in clients))
+
+
+async def _cmd_status(args: argparse.Namespace, session: aiohttp.ClientSession) -> int:
+    hosts = list(args.hosts)
+    if args.hosts_file:
+        with open(args.hosts_file, encoding="utf-8") as fp:
+            hosts.extend(line.strip() for line in fp if line.strip())
+    if not hosts:
+        print("no hosts given", file=sys.stderr)
+        return 2
+    clients = [_client(args, session, host) for host in hosts]
+    limit = asyncio.Semaphore(args.concurrency)
+    writer = _StatusWriter(args.format)
+    if not args.watch:
+        await _poll_once(clients, writer, limit)
+        return 0
+    while True:
+        started = time.monotonic()
+        await _poll_once(clients, writer, limit)
+        await asyncio.sleep(max(0.0, args.interval - (time.monotonic() - started)))
+
+
+async def _cmd_read_param(args: argparse.Namespace, session: aiohttp.ClientSession) -> int:
+    data = await _client(args, session, args.host).read_param(args.param)
+    if data is None:
+        print(f"{args.host}: no response", file=sys.stderr)
+        return 1
+    print(json.dumps({"host": args.host, "param": args.param, "data": data}))
+    return 0
+
+
+async def _cmd_write_param(args: argparse.Namespace, session: aiohttp.ClientSession) -> int:
+    ok = await _client(args, session, args.host).set_param(args.param, args.value)
+    if not ok:
+        print(f"{args.host}: write failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+async def _cmd_get_program(args: argparse.Namespace, session: aiohttp.ClientSession) -> int:
+    days = await _client(args, session, args.host).get_weekly_program(PROGRAMS[args.program])
+    if days is None:
+        print(f"{args.host}: no response", file=sys.stderr)
+        return 1
+    print("\n".join(days))
+    return 0
+
+
+async def _cmd_set_program(args: argparse.Namespace, session: aiohttp.ClientSession) -> int:
+    with open(args.file, encoding="utf-8") if args.file != "-" else sys.stdin as fp:
+        days = [line.strip() for line in fp if line.strip()]
+    if len(days) != 7 or any(len(day) != 48 or set(day) - {"0", "1"} for day in days):
+        print("program must be 7 lines of 48 '0'/'1' characters", file=sys.stderr)
+        return 2
+    ok = await _client(args, session, args.host).set_weekly_program(
+        PROGRAMS[args.program], days
+    )
+    if not ok:
+        print(f"{args.host}: write failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+async def _cmd_gateway(args: argparse.Namespace, session: aiohttp.ClientSession) -> int:
+    from .gateway import EcoalGateway
+
+    gateway = EcoalGateway(_client(args, session, args.host), args.interval, args.heartbeat)
+    await gateway.run(args.bind, args.port)
+    return 0
+
+
+async def _cmd_discover(args: argparse.Namespace, session: aiohttp.ClientSession) -> int:
+    from .discovery import discover
+
+    try:
+        found = await discover(
+            args.network, args.username, args.password, session, args.concurrency
+        )
+    except ValueError as err:
+        print(err, file=sys.stderr)
+        return 2
+    for host, version in found.items():
+        print(json.dumps({"host": host, "firmware_version": version}))
+    return 0 if found else 1
+
+
+async def _cmd_telemetry(args: argparse.Namespace, session: None) -> int:
+    from datetime import datetime
+
+    from .telemetry import TelemetryReader
+
+    def timestamp(value: str | None) -> float | None:
+        return None if value is None else datetime.fromisoformat(value).timestamp()
+
+    writer = _StatusWriter(args.format)
+    reader = TelemetryReader(args.directory)
+    for ts, status in reader.statuses(timestamp(args.start), timestamp(args.end)):
+        row = _status_row(args.directory, status)
+        row["time"] = round(ts, 3)
+        writer.write(row)
+    return 0
+
+
+def _client(
+    args: argparse.Namespace, session: aiohttp.ClientSession, host: str
+) -> EcoalClient:
+    return EcoalClient(host, args.username, args.password, session)
+
+
+def _int(value: str) -> int:
+    return int(value, 0)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="eCoal controller tool")
+    parser.add_argument("-u", "--username", default=os.environ.get("ECOAL_USERNAME", ""))
+    parser.add_argument("-p", "--password", default=os.environ.get("ECOAL_PASSWORD", ""))
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    status = sub.add_parser("status", help="poll status of one or more hosts")
+    status.add_argument("hosts", nargs="*")
+    status.add_argument("--hosts-file", help="file with one host per line")
+    status.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    status.add_argument("--watch", action="store_true", help="poll until interrupted")
+    status.add_argument("--interval", type=float, default=30.0, help="seconds between polls")
+    status.add_argument("--concurrency", type=int, default=8, help="max parallel requests")
+    status.set_defaults(func=_cmd_status)
+
+    read_param = sub.add_parser("read-param", help="read raw parameter bytes")
+    read_param.add_argument("host")
+    read_param.add_argument("param", type=_int)
+    read_param.set_defaults(func=_cmd_read_param)
+
+    write_param = sub.add_parser("write-param", help="write a 16-bit parameter value")
+    write_param.add_argument("host")
+    write_param.add_argument("param", type=_int)
+    write_param.add_argument("value", type=_int)
+    write_param.set_defaults(func=_cmd_write_param)
+
+    get_program = sub.add_parser("get-program", help="print a weekly program")
+    get_program.add_argument("host")
+    get_program.add_argument("program", choices=PROGRAMS)
+    get_program.set_defaults(func=_cmd_get_program)
+
+    set_program = sub.add_parser("set-program", help="write a weekly program")
+    set_program.add_argument("host")
+    set_program.add_argument("program", choices=PROGRAMS)
+    set_program.add_argument("file", help="7 lines of 48 '0'/'1' chars, '-' for stdin")
+    set_program.set_defaults(func=_cmd_set_program)
+
+    gateway = sub.add_parser("gateway", help="poll one host and push frames over SSE")
+    gateway.add_argument("host")
+    gateway.add_argument(
+        "--bind",
+        default="127.0.0.1",
+        help="address to listen on; the gateway has no authentication, so only "
+        "use e.g. 0.0.0.0 on a trusted network",
+    )
+    gateway.add_argument("--port", type=int, default=8765)
+    gateway.add_argument("--interval", type=float, default=2.0, help="seconds between polls")
+    gateway.add_argument("--heartbeat", type=float, default=30.0, help="max seconds between pushes")
+    gateway.set_defaults(func=_cmd_gateway)
+
+    discover = sub.add_parser("discover", help="scan a network for controllers")
+    discover.add_argument("network", help="CIDR range, at most /22")
+    discover.add_argument("--concurrency", type=int, default=32, help="max parallel probes")
+    discover.set_defaults(func=_cmd_discover)
+
+    telemetry = sub.add_parser("telemetry", help="print statuses from telemetry files")
+    telemetry.add_argument("directory")
+    telemetry.add_argument("--start", help="ISO time, local unless an offset is given")
+    telemetry.add_argument("--end", help="ISO time, exclusive")
+    telemetry.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    telemetry.set_defaults(func=_cmd_telemetry, offline=True)
+    return parser
+
+
+async def _main(args: argparse.Namespace) -> int:
+    if getattr(args, "offline", False):
+        return await args.func(args, None)
+
+    import aiohttp
+
+    concurrency = getattr(args, "concurrency", 1)
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=concurrency)
+    ) as session:
+        return await args.func(args, session)
+
+
+def main() -> int:
+    args = _parser().parse_args()
+    try:
+        return asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,359 @@
+"""Async and blocking eCoal clients built on the codec and a transport."""
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from .codec import (
+    CMD_AUTO_OFF,
+    CMD_AUTO_ON,
+    CMD_SETTINGS,
+    PARAM_CO_OBNIZONA,
+    PARAM_CO_ZADANA,
+    PARAM_CWU_OBNIZONA,
+    PARAM_CWU_TRYB,
+    PARAM_CWU_ZADANA,
+    PARAM_MIESZ_AKTYWACJA,
+    PARAM_PODL_DZIENNA,
+    PARAM_PODL_NOCNA,
+    EcoalStatus,
+    build_frame,
+    build_read_cmd,
+    build_switch_cmd,
+    build_value_cmd,
+    decode_firmware_version,
+    decode_param_data,
+    decode_weekly_program,
+    encode_program,
+    parse_response,
+)
+from .profiles import (
+    DEFAULT_PROFILE,
+    FEATURE_WEEKLY_PROGRAM,
+    select_profile,
+)
+from .stats import AdaptiveTimeout, TimingStats, command_class
+from .trace import span
+from .transport import AiohttpTransport, AsyncTransport, BlockingTransport, SyncTransport
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from .cache import StatusCache
+    from .capture import CaptureWriter
+    from .params import ParamSpec
+
+# Responses kept for diagnostics
+RECENT_FRAMES = 16
+
+# Command classes that change controller state (param and program writes,
+# switches, auto mode); only these make a cached status stale
+_WRITE_CLASSES = frozenset({"write", "switch"})
+
+
+class EcoalClient:
+    """Client for communicating with furnace via eCoal HTTP protocol."""
+
+    def __init__(
+        self,
+        host: str,
+        username: str = "",
+        password: str = "",
+        session: aiohttp.ClientSession | None = None,
+        capture: CaptureWriter | None = None,
+        *,
+        transport: AsyncTransport | None = None,
+        status_cache: StatusCache | None = None,
+    ) -> None:
+        self.host = host
+        if transport is None:
+            transport = AiohttpTransport(host, username, password, session)
+        self._transport = transport
+        self._capture = capture
+        self.profile = DEFAULT_PROFILE
+        # Adaptive per-command-class timeouts, if the transport keeps them
+        self.timeouts: AdaptiveTimeout | None = getattr(transport, "timeouts", None)
+        self.status_cache = status_cache
+        # Credentials are part of the key so a cached frame is only handed to
+        # a client that could have read it itself
+        self.cache_key = (host, username, password)
+        # In-memory history for diagnostics; nothing here triggers a request
+        self.recent_frames: deque[tuple[float, str, list[int]]] = deque(
+            maxlen=RECENT_FRAMES
+        )
+        self.settings_frame: list[int] | None = None
+        self.weekly_programs: dict[int, list[str]] = {}
+        # Last value read or written per parameter, with its monotonic time
+        self.param_values: dict[int, tuple[float, int]] = {}
+        self.command_stats: dict[str, TimingStats] = {}
+        self.decode_stats = TimingStats()
+
+    async def _send(self, cmd: str) -> list[int] | None:
+        kind = command_class(cmd)
+        if self.status_cache is not None and kind in _WRITE_CLASSES:
+            self.status_cache.invalidate(self.cache_key)
+        started = time.perf_counter()
+        with span("http"):
+            body = await self._transport.fetch(cmd)
+        vals = None if body is None else parse_response(body)
+        stats = self.command_stats.get(kind)
+        if stats is None:
+            stats = self.command_stats[kind] = TimingStats()
+        stats.add(time.perf_counter() - started, vals is not None)
+        if body is None:
+            return None
+        if self._capture is not None:
+            await self._capture.async_write(cmd, body)
+        if vals is not None:
+            self.recent_frames.append((time.time(), cmd, vals))
+        return vals
+
+    def decode_status(self, vals: list[int]) -> EcoalStatus:
+        """Decode a status frame with the active profile, timing the decode."""
+        started = time.perf_counter()
+        status = self.profile.decode_status(vals)
+        self.decode_stats.add(time.perf_counter() - started)
+        return status
+
+    async def get_status(self, max_age: float | None = None) -> EcoalStatus | None:
+        """Read full furnace status (CMD 0x06). All fields decoded per JS CStatus.
+
+        With a status cache, a status younger than max_age (default: the
+        cache TTL) or a read already in flight for this controller is reused.
+        """
+        if self.status_cache is None:
+            return await self._read_status()
+        return await self.status_cache.fetch(self.cache_key, self._read_status, max_age)
+
+    def store_status(self, status: EcoalStatus) -> None:
+        """Share a status obtained without get_status through the cache."""
+        if self.status_cache is not None:
+            self.status_cache.put(self.cache_key, status)
+
+    async def _read_status(self) -> EcoalStatus | None:
+        profile = self.profile
+        vals = await self._send(profile.status_cmd)
+        if vals is None or len(vals) < profile.status_len:
+            return None
+        return self.decode_status(vals)
+
+    async def probe_status(self, previous: list[int]) -> EcoalStatus | None:
+        """Re-read status, decoding it only if the profile's watch bytes differ
+        from previous.
+
+        v0.2 has no reduced status read, so the full frame is fetched and the
+        watched bytes are compared before anything else is decoded.
+        """
+        profile = self.profile
+        vals = await self._send(profile.status_cmd)
+        if vals is None or len(vals) < profile.status_len:
+            return None
+        for idx in profile.watch_bytes:
+            if vals[idx] != previous[idx]:
+                status = self.decode_status(vals)
+                self.store_status(status)
+                return status
+        return None
+
+    async def get_firmware_version(self) -> str | None:
+        vals = await self._send(CMD_SETTINGS)
+        if vals is None:
+            return None
+        self.settings_frame = vals
+        return decode_firmware_version(vals)
+
+    async def detect_profile(self) -> str | None:
+        """Read the firmware version and switch to its protocol profile."""
+        version = await self.get_firmware_version()
+        if version is not None:
+            self.profile = select_profile(version)
+        return version
+
+    async def get_weekly_program(self, param: int) -> list[str] | None:
+        """Read 42-byte weekly program. Returns 7 strings of 48 '0'/'1' chars."""
+        if FEATURE_WEEKLY_PROGRAM not in self.profile.features:
+            return None
+        cmd = build_read_cmd(param)
+        vals = await self._send(cmd)
+        if vals is None:
+            return None
+        days = decode_weekly_program(vals)
+        if days is not None:
+            self.weekly_programs[param] = days
+        return days
+
+    async def set_weekly_program(self, param: int, days: list[str]) -> bool:
+        if FEATURE_WEEKLY_PROGRAM not in self.profile.features:
+            return False
+        data = encode_program(days)
+        cmd = build_frame(0x02, 0x00, param, data)
+        result = await self._send(cmd)
+        if result is None:
+            return False
+        self.weekly_programs[param] = list(days)
+        return True
+
+    async def set_switch(self, param: int, on: bool) -> bool:
+        with span("build"):
+            cmd = build_switch_cmd(param, on)
+        result = await self._send(cmd)
+        return result is not None
+
+    async def set_auto_mode(self, on: bool) -> bool:
+        cmd = CMD_AUTO_ON if on else CMD_AUTO_OFF
+        result = await self._send(cmd)
+        return result is not None
+
+    async def set_target_boiler_temp(self, temp: int) -> bool:
+        return await self.set_param(PARAM_CO_ZADANA, temp)
+
+    async def set_co_lowered_temp(self, temp: int) -> bool:
+        return await self.set_param(PARAM_CO_OBNIZONA, temp)
+
+    async def set_target_dhw_temp(self, temp: int) -> bool:
+        return await self.set_param(PARAM_CWU_ZADANA, temp)
+
+    async def set_cwu_lowered_temp(self, temp: int) -> bool:
+        return await self.set_param(PARAM_CWU_OBNIZONA, temp)
+
+    async def set_cwu_mode(self, mode: int) -> bool:
+        return await self.set_param(PARAM_CWU_TRYB, mode)
+
+    async def set_floor_day_temp(self, temp: int) -> bool:
+        return await self.set_param(PARAM_PODL_DZIENNA, temp)
+
+    async def set_floor_night_temp(self, temp: int) -> bool:
+        return await self.set_param(PARAM_PODL_NOCNA, temp)
+
+    async def set_mixer_activation(self, on: bool) -> bool:
+        return await self.set_param(PARAM_MIESZ_AKTYWACJA, 1 if on else 0)
+
+    async def set_param(self, param: int, value: int) -> bool:
+        with span("build"):
+            cmd = build_value_cmd(param, value)
+        result = await self._send(cmd)
+        if result is None:
+            return False
+        self.param_values[param] = (time.monotonic(), value)
+        return True
+
+    async def read_param(self, param: int) -> list[int] | None:
+        cmd = build_read_cmd(param)
+        vals = await self._send(cmd)
+        if vals is None:
+            return None
+        return decode_param_data(vals)
+
+    async def read_param_value(
+        self, spec: ParamSpec, max_age: float | None = None
+    ) -> int | None:
+        """Value of a registry parameter, reusing the last one read or written.
+
+        A cached value is returned unless it is older than max_age seconds.
+        """
+        cached = self.param_values.get(spec.param)
+        if cached is not None and (max_age is None or time.monotonic() - cached[0] <= max_age):
+            return cached[1]
+        data = await self.read_param(spec.param)
+        value = None if data is None else spec.decode(data)
+        if value is not None:
+            self.param_values[spec.param] = (time.monotonic(), value)
+        return value
+
+    async def read_param_values(
+        self, specs: Iterable[ParamSpec], max_age: float | None = None
+    ) -> dict[str, int]:
+        """Values of several registry parameters, keyed by spec key.
+
+        Only parameters without a cached value are read, one after another,
+        since the controller serves a single request at a time. Parameters
+        that failed to read are left out.
+        """
+        values = {}
+        for spec in specs:
+            value = await self.read_param_value(spec, max_age)
+            if value is not None:
+                values[spec.key] = value
+        return values
+
+    async def write_param_value(self, spec: ParamSpec, value: int) -> bool:
+        """Write a registry parameter; raises ValueError if value is out of range."""
+        return await self.set_param(spec.param, spec.validate(value))
+
+    async def test_connection(self, max_age: float | None = None) -> bool:
+        return await self.get_status(max_age) is not None
+
+
+class EcoalSyncClient:
+    """Blocking client for scripts and collectors that run without an event loop.
+
+    Covers reads, generic parameter writes and weekly programs; the async
+    EcoalClient has the full command set.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        username: str = "",
+        password: str = "",
+        *,
+        transport: SyncTransport | None = None,
+    ) -> None:
+        self.host = host
+        if transport is None:
+            transport = BlockingTransport(host, username, password)
+        self._transport = transport
+        self.profile = DEFAULT_PROFILE
+
+    def _send(self, cmd: str) -> list[int] | None:
+        body = self._transport.fetch(cmd)
+        if body is None:
+            return None
+        return parse_response(body)
+
+    def get_status(self) -> EcoalStatus | None:
+        profile = self.profile
+        vals = self._send(profile.status_cmd)
+        if vals is None or len(vals) < profile.status_len:
+            return None
+        return profile.decode_status(vals)
+
+    def get_firmware_version(self) -> str | None:
+        vals = self._send(CMD_SETTINGS)
+        if vals is None:
+            return None
+        return decode_firmware_version(vals)
+
+    def detect_profile(self) -> str | None:
+        version = self.get_firmware_version()
+        if version is not None:
+            self.profile = select_profile(version)
+        return version
+
+    def read_param(self, param: int) -> list[int] | None:
+        vals = self._send(build_read_cmd(param))
+        if vals is None:
+            return None
+        return decode_param_data(vals)
+
+    def set_param(self, param: int, value: int) -> bool:
+        return self._send(build_value_cmd(param, value)) is not None
+
+    def get_weekly_program(self, param: int) -> list[str] | None:
+        if FEATURE_WEEKLY_PROGRAM not in self.profile.features:
+            return None
+        vals = self._send(build_read_cmd(param))
+        if vals is None:
+            return None
+        return decode_weekly_program(vals)
+
+    def set_weekly_program(self, param: int, days: list[str]) -> bool:
+        if FEATURE_WEEKLY_PROGRAM not in self.profile.features:
+            return False
+        cmd = build_frame(0x02, 0x00, param, encode_program(days))
+        return self._send(cmd) is not None
+
+    def test_connection(self) -> bool:
+        return self.get_status() is not None
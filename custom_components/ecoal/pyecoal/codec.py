@@ -0,0 +1,378 @@
+"""Pure eCoal protocol codec: frames, CRC and response decoders (no I/O)."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+CRC_TABLE = (
+    0, 49, 98, 83, 196, 245, 166, 151, 185, 136, 219, 234, 125, 76, 31, 46,
+    67, 114, 33, 16, 135, 182, 229, 212, 250, 203, 152, 169, 62, 15, 92, 109,
+    134, 183, 228, 213, 66, 115, 32, 17, 63, 14, 93, 108, 251, 202, 153, 168,
+    197, 244, 167, 150, 1, 48, 99, 82, 124, 77, 30, 47, 184, 137, 218, 235,
+    61, 12, 95, 110, 249, 200, 155, 170, 132, 181, 230, 215, 64, 113, 34, 19,
+    126, 79, 28, 45, 186, 139, 216, 233, 199, 246, 165, 148, 3, 50, 97, 80,
+    187, 138, 217, 232, 127, 78, 29, 44, 2, 51, 96, 81, 198, 247, 164, 149,
+    248, 201, 154, 171, 60, 13, 94, 111, 65, 112, 35, 18, 133, 180, 231, 214,
+    122, 75, 24, 41, 190, 143, 220, 237, 195, 242, 161, 144, 7, 54, 101, 84,
+    57, 8, 91, 106, 253, 204, 159, 174, 128, 177, 226, 211, 68, 117, 38, 23,
+    252, 205, 158, 175, 56, 9, 90, 107, 69, 116, 39, 22, 129, 176, 227, 210,
+    191, 142, 221, 236, 123, 74, 25, 40, 6, 55, 100, 85, 194, 243, 160, 145,
+    71, 118, 37, 20, 131, 178, 225, 208, 254, 207, 156, 173, 58, 11, 88, 105,
+    4, 53, 102, 87, 192, 241, 162, 147, 189, 140, 223, 238, 121, 72, 27, 42,
+    193, 240, 163, 146, 5, 52, 103, 86, 120, 73, 26, 43, 188, 141, 222, 239,
+    130, 179, 224, 209, 70, 119, 36, 21, 59, 10, 89, 104, 255, 206, 157, 172,
+)
+
+# Pre-built commands
+CMD_STATUS = "02010006000000006103"
+CMD_SETTINGS = "02010005001600002403"
+CMD_AUTO_ON = "020100020033020001006503"
+CMD_AUTO_OFF = "020100020033020000009103"
+
+# ePARAM IDs (from firmware JS)
+PARAM_CO_ZADANA = 40       # 0x28
+PARAM_CO_OBNIZONA = 41     # 0x29
+PARAM_CWU_ZADANA = 17      # 0x11
+PARAM_CWU_OBNIZONA = 29    # 0x1D
+PARAM_PROG_CO_TAB = 24     # 0x18 - CO weekly program (42 bytes)
+PARAM_PROG_CWU_TAB = 25    # 0x19 - CWU weekly program (42 bytes)
+PARAM_CWU_TRYB = 16        # 0x10 - CWU work mode
+PARAM_MIESZ_AKTYWACJA = 19 # 0x13 - Mixer circuit activation (floor heating on/off)
+PARAM_TRYB_PRACY = 51      # 0x33 - auto/manual mode
+PARAM_PODL_DZIENNA = 84    # 0x54 - Floor day temperature setpoint
+PARAM_PODL_NOCNA = 85      # 0x55 - Floor night temperature setpoint
+PARAM_PROG_PODL_TAB = 87   # 0x57 - Floor weekly program (42 bytes)
+
+# CWU work modes
+CWU_MODE_WINTER = 0
+CWU_MODE_SUMMER = 1
+CWU_MODE_AUTO_TEMP = 2
+CWU_MODE_AUTO_PROG = 3
+CWU_MODE_OFF = 4
+
+SENSOR_NAMES = [
+    "floor_temp",    # 0: TEMP_PODLOG
+    "indoor_temp",   # 1: TEMP_WEW
+    "outdoor_temp",  # 2: TEMP_ZEW
+    "dhw_temp",      # 3: TEMP_CWU
+    "return_temp",   # 4: TEMP_POWR
+    "feeder_temp",   # 5: TEMP_POD
+    "boiler_temp",   # 6: TEMP_CO
+    "exhaust_temp",  # 7: TEMP_SPALIN
+]
+
+OUTPUT_NAMES = [
+    "air_pump",      # 0: OUT_DMUCHAWA
+    "coal_feeder",   # 1: OUT_PODAJNIK
+    "ch_pump",       # 2: OUT_POMPA_CO
+    "dhw_pump",      # 3: OUT_POMPA_CWU
+    "mixer_pump",    # 4: OUT_POMPA_MIESZ
+    "z1_pump",       # 5: OUT_POMPA_Z1
+    "valve_3d",      # 6: OUT_ZAWOR_3D
+    "cwu_mixer",     # 7: OUT_CWU_MIESZ
+]
+
+# Inputs bitmask (byte 61). Terminal labels differ per boiler, so inputs are
+# named by bit position.
+INPUT_NAMES = [f"input_{bit}" for bit in range(8)]
+
+# Byte value -> per-bit flags, bit 0 first. Shared by outputs and inputs.
+BITS_TABLE = tuple(tuple(bool((v >> bit) & 1) for bit in range(8)) for v in range(256))
+
+# Alarm bitmasks: ALARMY (bytes 40-41) and ALARMY2 (bytes 62-63), 16 bits each.
+# Bit meanings are not mapped for v0.2 yet, so bits are named by position.
+ALARM_NAMES = [f"alarm_{bit}" for bit in range(16)]
+ALARM2_NAMES = [f"alarm2_{bit}" for bit in range(16)]
+
+# Status bytes checked by the fast watch probe: outputs, ALARMY, ALARMY2
+WATCH_BYTES = (32, 40, 41, 62, 63)
+
+
+@dataclass(slots=True)
+class EcoalStatus:
+    """Decoded furnace status frame (CMD 0x06), one attribute per field."""
+
+    # Sensor states (bytes 8-15): 0=OK, 1=disconnected
+    floor_temp_state: int
+    indoor_temp_state: int
+    outdoor_temp_state: int
+    dhw_temp_state: int
+    return_temp_state: int
+    feeder_temp_state: int
+    boiler_temp_state: int
+    exhaust_temp_state: int
+    # Temperatures (bytes 16-31)
+    floor_temp: float
+    indoor_temp: float
+    outdoor_temp: float
+    dhw_temp: float
+    return_temp: float
+    feeder_temp: float
+    boiler_temp: float
+    exhaust_temp: float
+    # Outputs (byte 32)
+    air_pump: bool
+    coal_feeder: bool
+    ch_pump: bool
+    dhw_pump: bool
+    mixer_pump: bool
+    z1_pump: bool
+    valve_3d: bool
+    cwu_mixer: bool
+    # Inputs (byte 61)
+    input_0: bool
+    input_1: bool
+    input_2: bool
+    input_3: bool
+    input_4: bool
+    input_5: bool
+    input_6: bool
+    input_7: bool
+    # Control state (bytes 33-39)
+    heating: int
+    auto_mode: bool
+    setpoint_mode: int
+    cwu_mode: int
+    target_boiler_temp: int
+    target_dhw_temp: int
+    air_pump_power: int
+    # Alarms, mixer, auth (bytes 40-43)
+    alarms_raw: int
+    alarm_active: bool
+    mixer_circuit: int
+    auth_level: int
+    controller_datetime: str | None
+    controller_clock: datetime | None
+    # Mode flags (bytes 50-60)
+    co_lowered_active: bool
+    cwu_lowered_active: bool
+    room_heating: int
+    internal_setpoint: int
+    day_night: int
+    room_day_temp: float
+    room_night_temp: float
+    co_lowered_amount: int
+    cwu_lowered_amount: int
+    # Inputs and more alarms (bytes 61-63)
+    inputs_raw: int
+    alarms2_raw: int
+    # Feeder and fuel (bytes 64-77)
+    feeder_runtime: float
+    fuel_load_date: str | None
+    fuel_remaining: int
+    fuel_load_pct: int
+    feeding_pct: int
+    # Floor heating and final flags (bytes 78-83)
+    floor_day_temp: float
+    floor_night_temp: float
+    floor_day_night: int
+    is_summer: bool
+    raw_status: list[int]
+
+
+def calc_crc(payload: list[int]) -> int:
+    crc = 0
+    for b in payload:
+        crc = CRC_TABLE[crc ^ (b & 0xFF)]
+    return crc
+
+
+def decode_temp(lo: int, hi: int) -> float:
+    raw = (hi << 8) | lo
+    if raw > 32767:
+        raw -= 65536
+    return round(raw / 10.0, 1)
+
+
+def build_frame(cmd: int, cmd2: int, cmd3: int, data: list[int] | None = None) -> str:
+    if data is None:
+        data = []
+    dl = len(data)
+    payload = [0x01, 0x00, cmd, cmd2, cmd3, dl & 0xFF, (dl >> 8) & 0xFF] + data
+    crc = calc_crc(payload)
+    frame = [0x02] + payload + [crc, 0x03]
+    return "".join(f"{b:02x}" for b in frame)
+
+
+def build_switch_cmd(param: int, on: bool) -> str:
+    return build_frame(0x05, 0x00, param, [0x01 if on else 0x00])
+
+
+def build_value_cmd(param: int, value: int) -> str:
+    """Build CMD_SET_PARAM (0x02) frame. Always 2-byte LE per protocol."""
+    if value < 0:
+        value = value + 65536
+    data = [value & 0xFF, (value >> 8) & 0xFF]
+    return build_frame(0x02, 0x00, param, data)
+
+
+def build_read_cmd(param: int) -> str:
+    return build_frame(0x01, 0x00, param)
+
+
+def parse_program(data: list[int]) -> list[str]:
+    """Parse 42-byte weekly program into 7 day strings of 48 '0'/'1' chars.
+    Each day = 48 half-hour slots. '1'=normal temp, '0'=lowered.
+    Days: 0=Sunday..6=Saturday.
+    """
+    days = []
+    for day in range(7):
+        bits = ""
+        for byte_idx in range(6):
+            b = data[day * 6 + byte_idx]
+            for bit in range(8):
+                bits += "1" if (b >> bit) & 1 else "0"
+        days.append(bits)
+    return days
+
+
+def encode_program(days: list[str]) -> list[int]:
+    result = []
+    for day_bits in days:
+        for byte_idx in range(6):
+            b = 0
+            for bit in range(8):
+                idx = byte_idx * 8 + bit
+                if idx < len(day_bits) and day_bits[idx] == "1":
+                    b |= (1 << bit)
+            result.append(b)
+    return result
+
+
+def decode_datetime(raw: tuple[int, ...]) -> tuple[datetime | None, str | None]:
+    """Decode Y(+2000), M, D, H, Min[, Sec] bytes."""
+    try:
+        value = datetime(2000 + raw[0], *raw[1:])
+    except (ValueError, OverflowError):
+        return None, None
+    return value, value.isoformat()
+
+
+def decode_status(d: list[int]) -> EcoalStatus:
+    """Decode an 86-byte status frame into an EcoalStatus record."""
+    # Outputs (byte 32) and inputs (byte 61) bitmasks
+    outputs = BITS_TABLE[d[32]]
+    inputs = BITS_TABLE[d[61]]
+    # Alarms (bytes 40-41)
+    alarms_raw = (d[41] << 8) | d[40]
+    # Date/time (bytes 44-49)
+    clock, clock_iso = decode_datetime(tuple(d[44:50]))
+    # Feeder time (bytes 64-67): 32-bit LE seconds
+    feeder_secs = d[64] | (d[65] << 8) | (d[66] << 16) | (d[67] << 24)
+    return EcoalStatus(
+        # Sensor states (bytes 8-15): per sensor, 0=OK, 1=disconnected
+        floor_temp_state=d[8],
+        indoor_temp_state=d[9],
+        outdoor_temp_state=d[10],
+        dhw_temp_state=d[11],
+        return_temp_state=d[12],
+        feeder_temp_state=d[13],
+        boiler_temp_state=d[14],
+        exhaust_temp_state=d[15],
+        # Temperatures (bytes 16-31): 8x2 bytes, signed LE / 10
+        floor_temp=decode_temp(d[16], d[17]),
+        indoor_temp=decode_temp(d[18], d[19]),
+        outdoor_temp=decode_temp(d[20], d[21]),
+        dhw_temp=decode_temp(d[22], d[23]),
+        return_temp=decode_temp(d[24], d[25]),
+        feeder_temp=decode_temp(d[26], d[27]),
+        boiler_temp=decode_temp(d[28], d[29]),
+        exhaust_temp=decode_temp(d[30], d[31]),
+        air_pump=outputs[0],
+        coal_feeder=outputs[1],
+        ch_pump=outputs[2],
+        dhw_pump=outputs[3],
+        mixer_pump=outputs[4],
+        z1_pump=outputs[5],
+        valve_3d=outputs[6],
+        cwu_mixer=outputs[7],
+        input_0=inputs[0],
+        input_1=inputs[1],
+        input_2=inputs[2],
+        input_3=inputs[3],
+        input_4=inputs[4],
+        input_5=inputs[5],
+        input_6=inputs[6],
+        input_7=inputs[7],
+        # Control state (bytes 33-39)
+        heating=d[33],
+        auto_mode=d[34] == 1,
+        setpoint_mode=d[35],
+        cwu_mode=d[36],
+        target_boiler_temp=d[37],
+        target_dhw_temp=d[38],
+        air_pump_power=d[39],
+        alarms_raw=alarms_raw,
+        alarm_active=alarms_raw != 0,
+        # Mixer and auth (bytes 42-43)
+        mixer_circuit=d[42],
+        auth_level=d[43],
+        controller_datetime=clock_iso,
+        controller_clock=clock,
+        # Mode flags (bytes 50-54)
+        co_lowered_active=bool(d[50]),
+        cwu_lowered_active=bool(d[51]),
+        room_heating=d[52],
+        internal_setpoint=d[53],
+        day_night=d[54],
+        # Room temperature setpoints (bytes 55-58)
+        room_day_temp=decode_temp(d[55], d[56]),
+        room_night_temp=decode_temp(d[57], d[58]),
+        # Lowered amounts (bytes 59-60)
+        co_lowered_amount=d[59],
+        cwu_lowered_amount=d[60],
+        # Inputs bitmask (byte 61)
+        inputs_raw=d[61],
+        # More alarms (bytes 62-63)
+        alarms2_raw=(d[63] << 8) | d[62],
+        feeder_runtime=round(feeder_secs / 60.0, 1),
+        # Fuel load date (bytes 68-72)
+        fuel_load_date=decode_datetime(tuple(d[68:73]))[1],
+        # Fuel data (bytes 73-77)
+        fuel_remaining=d[73] | (d[74] << 8) | (d[77] << 16),
+        fuel_load_pct=d[75],
+        feeding_pct=d[76],
+        # Floor heating setpoints (bytes 78-81)
+        floor_day_temp=decode_temp(d[78], d[79]),
+        floor_night_temp=decode_temp(d[80], d[81]),
+        # Final flags (bytes 82-83)
+        floor_day_night=d[82],
+        is_summer=bool(d[83]),
+        raw_status=d,
+    )
+
+
+def parse_response(body: str) -> list[int] | None:
+    """Extract the integer array from a `[2,1,6,...]` response body."""
+    start = body.find("[")
+    end = body.find("]")
+    if start == -1 or end == -1:
+        return None
+    return [int(v.strip()) for v in body[start + 1 : end].split(",")]
+
+
+def decode_firmware_version(vals: list[int]) -> str | None:
+    """Firmware version string from a CMD_SETTINGS response."""
+    if len(vals) < 48:
+        return None
+    vlen = vals[38]
+    if vlen > 0 and 39 + vlen <= len(vals):
+        try:
+            return "".join(chr(v) for v in vals[39 : 39 + vlen])
+        except (ValueError, IndexError):
+            return None
+    return None
+
+
+def decode_param_data(vals: list[int]) -> list[int]:
+    """Data bytes of a parameter read response."""
+    data_len = vals[6] | (vals[7] << 8)
+    return vals[8 : 8 + data_len]
+
+
+def decode_weekly_program(vals: list[int]) -> list[str] | None:
+    """Weekly program from a parameter read response, None if too short."""
+    data_len = vals[6] | (vals[7] << 8)
+    if data_len < 42:
+        return None
+    return parse_program(vals[8 : 8 + 42])
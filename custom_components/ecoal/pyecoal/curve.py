@@ -0,0 +1,108 @@
+"""Weather-compensated boiler setpoint (heating curve).
+
+v0.2 firmware only holds a fixed CO setpoint. HeatingCurve maps the outdoor
+temperature (and optionally the room temperature) to a flow temperature,
+and CurveController decides when that is worth writing to the controller:
+
+- the outdoor reading is smoothed over time (time constant `outdoor_tau`
+  seconds, weighted by the time between samples, so watch or gateway
+  updates arriving faster than the poll do not shorten it), and sun on the
+  sensor or a short gust does not move the setpoint
+- the setpoint changes only once the curve is `hysteresis` degrees away from
+  it, so a target hovering around x.5 does not flip between two integers
+- each write moves at most `max_step` degrees and writes are at least
+  `min_interval` seconds apart
+- nothing is returned when the rounded target equals the controller's
+  current setpoint, so an unchanged curve never costs a write
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, kw_only=True)
+class HeatingCurve:
+    """Linear heating curve; temperatures in C.
+
+    At an outdoor temperature equal to room_temp the flow target is
+    room_temp + shift; every degree colder adds slope degrees. With
+    room_gain, every degree the room is below room_temp adds room_gain
+    degrees (and every degree above takes them off).
+    """
+
+    slope: float = 1.5
+    shift: float = 0.0
+    room_temp: float = 21.0
+    room_gain: float = 0.0
+    min_temp: int = 30
+    max_temp: int = 80
+
+    def target(self, outdoor: float, indoor: float | None = None) -> float:
+        value = self.room_temp + self.shift + self.slope * (self.room_temp - outdoor)
+        if indoor is not None and self.room_gain:
+            value += self.room_gain * (self.room_temp - indoor)
+        return min(max(value, self.min_temp), self.max_temp)
+
+
+class CurveController:
+    """Turn curve targets into setpoint writes, one status at a time."""
+
+    def __init__(
+        self,
+        curve: HeatingCurve,
+        *,
+        hysteresis: float = 1.0,
+        max_step: int = 3,
+        min_interval: float = 600.0,
+        outdoor_tau: float = 300.0,
+    ) -> None:
+        self.curve = curve
+        self.hysteresis = hysteresis
+        self.max_step = max_step
+        self.min_interval = min_interval
+        self.outdoor_tau = outdoor_tau
+        self.outdoor: float | None = None
+        self._outdoor_at: float | None = None
+        # Latest unrounded curve output, for display
+        self.target: float | None = None
+        self.writes = 0
+        self._last_write: float | None = None
+
+    def update(
+        self,
+        timestamp: float,
+        outdoor: float,
+        indoor: float | None,
+        current: int,
+    ) -> int | None:
+        """Setpoint to write now, or None to leave current in place."""
+        if self.outdoor is None or self._outdoor_at is None:
+            self.outdoor = outdoor
+            self._outdoor_at = timestamp
+        elif timestamp > self._outdoor_at:
+            alpha = 1 - math.exp((self._outdoor_at - timestamp) / self.outdoor_tau)
+            self.outdoor += alpha * (outdoor - self.outdoor)
+            self._outdoor_at = timestamp
+        target = self.target = self.curve.target(self.outdoor, indoor)
+        if abs(target - current) < self.hysteresis:
+            return None
+        if self._last_write is not None and timestamp - self._last_write < self.min_interval:
+            return None
+        step = max(-self.max_step, min(self.max_step, round(target) - current))
+        if step == 0:
+            return None
+        return current + step
+
+    def written(self, timestamp: float) -> None:
+        """Record a successful write made from update's result."""
+        self._last_write = timestamp
+        self.writes += 1
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Curve state for diagnostics and entity attributes."""
+        return {
+            "outdoor_smoothed": None if self.outdoor is None else round(self.outdoor, 1),
+            "target": None if self.target is None else round(self.target, 1),
+            "writes": self.writes,
+        }
@@ -0,0 +1,103 @@
+"""Find eCoal controllers on a network.
+
+Every address is first probed with a plain TCP connect to the HTTP port,
+which costs one SYN on hosts that are down. Only hosts that accept get a
+single CMD_SETTINGS read with the given credentials, and a controller is
+recognised by the firmware version in that response. Both stages share one
+semaphore, so at most `concurrency` addresses are in flight at a time.
+"""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from .client import EcoalClient
+from .transport import AiohttpTransport
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# Largest network scanned in one go (a /22)
+MAX_ADDRESSES = 1024
+
+DEFAULT_CONCURRENCY = 32
+PROBE_TIMEOUT = 1.0
+FINGERPRINT_TIMEOUT = 5.0
+
+
+def network_hosts(network: str) -> list[str]:
+    """Host addresses of a CIDR network; raises ValueError if invalid or too large."""
+    net = ipaddress.ip_network(network, strict=False)
+    if net.num_addresses > MAX_ADDRESSES:
+        raise ValueError(f"{network} has more than {MAX_ADDRESSES} addresses")
+    if net.num_addresses == 1:
+        return [str(net.network_address)]
+    return [str(host) for host in net.hosts()]
+
+
+async def probe_port(host: str, port: int = 80, timeout: float = PROBE_TIMEOUT) -> bool:
+    """True if host accepts a TCP connection on port within timeout."""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, TimeoutError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
+async def fingerprint(
+    host: str,
+    username: str,
+    password: str,
+    session: aiohttp.ClientSession,
+    timeout: float = FINGERPRINT_TIMEOUT,
+) -> str | None:
+    """Firmware version read with one CMD_SETTINGS request, None if not a controller."""
+    transport = AiohttpTransport(host, username, password, session, timeout=timeout)
+    return await EcoalClient(host, transport=transport).get_firmware_version()
+
+
+async def validate_hosts(
+    hosts: Iterable[str],
+    username: str,
+    password: str,
+    session: aiohttp.ClientSession,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[str, str | None]:
+    """Fingerprint every host in parallel; maps host to firmware version or None."""
+    limit = asyncio.Semaphore(concurrency)
+
+    async def check(host: str) -> str | None:
+        async with limit:
+            return await fingerprint(host, username, password, session)
+
+    hosts = list(dict.fromkeys(hosts))
+    versions = await asyncio.gather(*(check(host) for host in hosts))
+    return dict(zip(hosts, versions))
+
+
+async def discover(
+    network: str,
+    username: str,
+    password: str,
+    session: aiohttp.ClientSession,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[str, str]:
+    """Controllers answering on network, mapped to their firmware version."""
+    limit = asyncio.Semaphore(concurrency)
+
+    async def check(host: str) -> str | None:
+        async with limit:
+            if not await probe_port(host):
+                return None
+            return await fingerprint(host, username, password, session)
+
+    hosts = network_hosts(network)
+    versions = await asyncio.gather(*(check(host) for host in hosts))
+    return {host: version for host, version in zip(hosts, versions) if version}
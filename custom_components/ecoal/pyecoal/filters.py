@@ -0,0 +1,105 @@
+"""Glitch filtering of probe temperatures, one sample at a time.
+
+Each probe gets a ProbeFilter:
+
+- readings outside the plausible range (a broken probe decodes as -3276.8)
+  are dropped and the previous output is held
+- the output is the median of the last three plausible readings, so a
+  single-poll spike never shows, at the cost of delaying a real step by one
+  reading
+- the output moves at most max_rate degrees per minute from the previous
+  output, which bounds what a two-poll burst can do
+
+Every step is O(1); a filter keeps three readings and a few scalars.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import replace
+
+from .codec import SENSOR_NAMES, EcoalStatus
+
+# Plausible probe range in C; anything outside is a decoding or wiring fault
+MIN_TEMP = -50.0
+MAX_TEMP = 150.0
+
+# Largest believable change per minute; exhaust swings hard when the blower starts
+MAX_RATES = {"exhaust_temp": 60.0}
+DEFAULT_MAX_RATE = 20.0
+
+_WINDOW = 3
+
+
+class ProbeFilter:
+    """Range check, running median of three and rate limit for one probe."""
+
+    __slots__ = ("max_rate", "rejected", "_window", "_value", "_time")
+
+    def __init__(self, max_rate: float = DEFAULT_MAX_RATE) -> None:
+        self.max_rate = max_rate
+        self.rejected = 0
+        self._window: deque[float] = deque(maxlen=_WINDOW)
+        self._value: float | None = None
+        self._time = 0.0
+
+    def add(self, timestamp: float, value: float) -> float | None:
+        """Filtered value after this reading; None until a plausible one arrives."""
+        if not MIN_TEMP <= value <= MAX_TEMP:
+            self.rejected += 1
+            return self._value
+        window = self._window
+        window.append(value)
+        if len(window) == _WINDOW:
+            a, b, c = window
+            median = max(min(a, b), min(max(a, b), c))
+        else:
+            median = value
+        previous = self._value
+        if previous is not None:
+            limit = self.max_rate * max(timestamp - self._time, 0.0) / 60
+            if abs(median - previous) > limit:
+                self.rejected += 1
+                median = previous + (limit if median > previous else -limit)
+        self._value = round(median, 1)
+        self._time = timestamp
+        return self._value
+
+    def reset(self) -> None:
+        self._window.clear()
+        self._value = None
+
+
+class StatusFilter:
+    """ProbeFilters for every temperature probe of one controller."""
+
+    def __init__(self) -> None:
+        self.probes = {
+            name: ProbeFilter(MAX_RATES.get(name, DEFAULT_MAX_RATE)) for name in SENSOR_NAMES
+        }
+        # Unfiltered readings of the last status, by probe name
+        self.raw: dict[str, float] = {}
+
+    def apply(self, timestamp: float, status: EcoalStatus) -> EcoalStatus:
+        """Copy of status with filtered temperatures; status itself is untouched.
+
+        Disconnected probes pass through and restart their filter when they
+        come back.
+        """
+        changes: dict[str, float] = {}
+        for name, probe in self.probes.items():
+            value = getattr(status, name)
+            self.raw[name] = value
+            if getattr(status, f"{name}_state") != 0:
+                probe.reset()
+                continue
+            filtered = probe.add(timestamp, value)
+            if filtered is not None and filtered != value:
+                changes[name] = filtered
+        return replace(status, **changes) if changes else status
+
+    def as_dict(self) -> dict[str, dict[str, float | int]]:
+        """Raw reading and count of dropped or clamped readings per probe."""
+        return {
+            name: {"raw": self.raw.get(name), "rejected": probe.rejected}
+            for name, probe in self.probes.items()
+        }
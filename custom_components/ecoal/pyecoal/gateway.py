@@ -0,0 +1,157 @@
+"""Polling gateway that shares one controller poll stream with many consumers.
+
+The gateway polls a controller at a short interval and pushes raw status
+frames over server-sent events:
+
+    GET /events   text/event-stream, one `data: {"ts": ..., "raw": [...]}`
+                  per changed frame, plus a heartbeat frame when idle
+    GET /status   latest frame as JSON
+
+A frame is pushed when any byte outside the clock (44-49) changes, or after
+`heartbeat` seconds without a push. Consumers decode frames with the codec,
+so they see exactly what a direct poll would return.
+
+There is no authentication, so the gateway listens on localhost unless
+another address is given explicitly.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from .client import EcoalClient
+
+if TYPE_CHECKING:
+    import aiohttp
+    from aiohttp import web
+
+_LOGGER = logging.getLogger(__name__)
+
+# Status bytes ignored when deciding whether a frame changed (clock)
+_CLOCK = slice(44, 50)
+# Pending frames kept per subscriber; older ones are dropped for slow readers
+_QUEUE_SIZE = 8
+
+
+class EcoalGateway:
+    """Poll one controller and fan its status frames out to SSE subscribers."""
+
+    def __init__(
+        self, client: EcoalClient, interval: float = 2.0, heartbeat: float = 30.0
+    ) -> None:
+        self.client = client
+        self.interval = interval
+        self.heartbeat = heartbeat
+        self._latest: dict | None = None
+        self._subscribers: set[asyncio.Queue[str]] = set()
+
+    async def run(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """Serve until cancelled."""
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get("/events", self._handle_events)
+        app.router.add_get("/status", self._handle_status)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        _LOGGER.info("eCoal gateway for %s listening on %s:%s", self.client.host, host, port)
+        try:
+            await self._poll_loop()
+        finally:
+            await runner.cleanup()
+
+    async def _poll_loop(self) -> None:
+        await self.client.detect_profile()
+        previous: list[int] | None = None
+        pushed = 0.0
+        while True:
+            started = time.monotonic()
+            status = await self.client.get_status()
+            if status is not None:
+                vals = status.raw_status
+                changed = previous is None or (
+                    vals[: _CLOCK.start] != previous[: _CLOCK.start]
+                    or vals[_CLOCK.stop :] != previous[_CLOCK.stop :]
+                )
+                if changed or started - pushed >= self.heartbeat:
+                    self._publish({"ts": round(time.time(), 3), "raw": vals})
+                    pushed = started
+                previous = vals
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def _publish(self, frame: dict) -> None:
+        self._latest = frame
+        message = f"data: {json.dumps(frame)}\n\n"
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    async def _handle_status(self, request: web.Request) -> web.Response:
+        from aiohttp import web
+
+        if self._latest is None:
+            raise web.HTTPServiceUnavailable(text="no frame yet")
+        return web.json_response(self._latest)
+
+    async def _handle_events(self, request: web.Request) -> web.StreamResponse:
+        from aiohttp import web
+
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+        )
+        await response.prepare(request)
+        queue: asyncio.Queue[str] = asyncio.Queue(_QUEUE_SIZE)
+        if self._latest is not None:
+            queue.put_nowait(f"data: {json.dumps(self._latest)}\n\n")
+        self._subscribers.add(queue)
+        try:
+            while True:
+                await response.write((await queue.get()).encode())
+        except ConnectionResetError:
+            pass
+        finally:
+            self._subscribers.discard(queue)
+        return response
+
+
+def parse_frame(payload: bytes) -> list[int] | None:
+    """Raw status bytes of one SSE data payload, None if it is not a frame."""
+    try:
+        frame = json.loads(payload)
+    except ValueError:
+        return None
+    raw = frame.get("raw") if isinstance(frame, dict) else None
+    if not isinstance(raw, list) or not all(
+        isinstance(byte, int) and 0 <= byte <= 0xFF for byte in raw
+    ):
+        return None
+    return raw
+
+
+async def subscribe(
+    url: str, session: aiohttp.ClientSession, heartbeat: float = 30.0
+) -> AsyncIterator[list[int]]:
+    """Yield raw status frames pushed by a gateway at url.
+
+    Ends with aiohttp.ClientError or TimeoutError if the stream breaks or
+    stays silent for three heartbeats. Malformed payloads are skipped.
+    """
+    import aiohttp
+
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=heartbeat * 3)
+    async with session.get(f"{url.rstrip('/')}/events", timeout=timeout) as resp:
+        resp.raise_for_status()
+        async for line in resp.content:
+            if not line.startswith(b"data: "):
+                continue
+            raw = parse_frame(line[6:])
+            if raw is None:
+                _LOGGER.debug("Skipping malformed frame from %s: %r", url, line[:80])
+                continue
+            yield raw
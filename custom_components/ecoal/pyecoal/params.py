@@ -0,0 +1,161 @@
+"""Declarative registry of writable controller parameters.
+
+Each ParamSpec describes how a parameter is read (CMD 0x01, width bytes
+little endian) and which values may be written (CMD 0x02, always 2 bytes
+LE). Parameters mirrored in the status frame name that field, so their
+value comes with every status poll instead of a separate read.
+
+Ranges are conservative limits chosen for the UI, not values reported by
+the controller.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .codec import (
+    CWU_MODE_AUTO_PROG,
+    CWU_MODE_AUTO_TEMP,
+    CWU_MODE_OFF,
+    CWU_MODE_SUMMER,
+    CWU_MODE_WINTER,
+    PARAM_CO_OBNIZONA,
+    PARAM_CO_ZADANA,
+    PARAM_CWU_OBNIZONA,
+    PARAM_CWU_TRYB,
+    PARAM_CWU_ZADANA,
+    PARAM_PODL_DZIENNA,
+    PARAM_PODL_NOCNA,
+)
+
+PARAM_AIR_PUMP_POWER = 0x08
+PARAM_MANUAL_FEED_TIME = 0x52
+PARAM_MANUAL_AIR_PUMP_POWER = 0x61
+PARAM_MANUAL_STOP_TIME = 0x76
+
+
+@dataclass(frozen=True, slots=True)
+class ParamSpec:
+    key: str
+    param: int
+    width: int = 1
+    signed: bool = False
+    min: int = 0
+    max: int = 255
+    unit: str | None = None
+    # (value, option key) pairs for enumerated parameters
+    options: tuple[tuple[int, str], ...] | None = None
+    # EcoalStatus field carrying the current value, if any
+    status_field: str | None = None
+    # Probe that must be connected for the parameter to matter
+    requires_sensor: str | None = None
+
+    def decode(self, data: list[int]) -> int | None:
+        """Value from the data bytes of a read response, None if too short."""
+        if len(data) < self.width:
+            return None
+        return int.from_bytes(bytes(data[: self.width]), "little", signed=self.signed)
+
+    def validate(self, value: int) -> int:
+        """Return value if it may be written, otherwise raise ValueError."""
+        if self.options is not None:
+            if value not in (option for option, _ in self.options):
+                raise ValueError(f"{value} is not a valid {self.key} option")
+        elif not self.min <= value <= self.max:
+            raise ValueError(f"{self.key} must be within {self.min}..{self.max}, got {value}")
+        return value
+
+
+PARAMS: tuple[ParamSpec, ...] = (
+    ParamSpec(
+        key="co_target_temp",
+        param=PARAM_CO_ZADANA,
+        min=30,
+        max=80,
+        unit="°C",
+        status_field="target_boiler_temp",
+    ),
+    ParamSpec(
+        key="co_lowered_amount",
+        param=PARAM_CO_OBNIZONA,
+        max=30,
+        unit="°C",
+        status_field="co_lowered_amount",
+    ),
+    ParamSpec(
+        key="cwu_target_temp",
+        param=PARAM_CWU_ZADANA,
+        min=30,
+        max=65,
+        unit="°C",
+        status_field="target_dhw_temp",
+    ),
+    ParamSpec(
+        key="cwu_lowered_amount",
+        param=PARAM_CWU_OBNIZONA,
+        max=30,
+        unit="°C",
+        status_field="cwu_lowered_amount",
+    ),
+    ParamSpec(
+        key="cwu_mode",
+        param=PARAM_CWU_TRYB,
+        options=(
+            (CWU_MODE_WINTER, "winter"),
+            (CWU_MODE_SUMMER, "summer"),
+            (CWU_MODE_AUTO_TEMP, "auto_temp"),
+            (CWU_MODE_AUTO_PROG, "auto_prog"),
+            (CWU_MODE_OFF, "off"),
+        ),
+        status_field="cwu_mode",
+    ),
+    ParamSpec(
+        key="floor_day_temp",
+        param=PARAM_PODL_DZIENNA,
+        width=2,
+        signed=True,
+        min=20,
+        max=55,
+        unit="°C",
+        status_field="floor_day_temp",
+        requires_sensor="floor_temp",
+    ),
+    ParamSpec(
+        key="floor_night_temp",
+        param=PARAM_PODL_NOCNA,
+        width=2,
+        signed=True,
+        min=20,
+        max=55,
+        unit="°C",
+        status_field="floor_night_temp",
+        requires_sensor="floor_temp",
+    ),
+    ParamSpec(
+        key="air_pump_power",
+        param=PARAM_AIR_PUMP_POWER,
+        max=100,
+        unit="%",
+    ),
+    ParamSpec(
+        key="manual_air_pump_power",
+        param=PARAM_MANUAL_AIR_PUMP_POWER,
+        max=100,
+        unit="%",
+    ),
+    ParamSpec(
+        key="manual_feed_time",
+        param=PARAM_MANUAL_FEED_TIME,
+        width=2,
+        max=600,
+        unit="s",
+    ),
+    ParamSpec(
+        key="manual_stop_time",
+        param=PARAM_MANUAL_STOP_TIME,
+        width=2,
+        max=3600,
+        unit="s",
+    ),
+)
+
+PARAMS_BY_KEY = {spec.key: spec for spec in PARAMS}
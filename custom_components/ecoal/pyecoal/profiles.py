@@ -0,0 +1,58 @@
+"""Firmware-specific protocol profiles for eCoal controllers."""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .codec import CMD_STATUS, WATCH_BYTES, EcoalStatus, decode_status
+
+_LOGGER = logging.getLogger(__name__)
+
+# Optional commands a profile may support
+FEATURE_WEEKLY_PROGRAM = "weekly_program"
+
+
+@dataclass(frozen=True, slots=True)
+class ProtocolProfile:
+    """Protocol details that differ between eCoal firmware families."""
+
+    name: str
+    version_prefixes: tuple[str, ...]
+    # Cheapest command returning a frame that decode_status understands
+    status_cmd: str
+    status_len: int
+    decode_status: Callable[[list[int]], EcoalStatus]
+    watch_bytes: tuple[int, ...]
+    features: frozenset[str]
+
+
+PROFILE_V02 = ProtocolProfile(
+    name="v0.2",
+    version_prefixes=("0.2",),
+    status_cmd=CMD_STATUS,
+    status_len=86,
+    decode_status=decode_status,
+    watch_bytes=WATCH_BYTES,
+    features=frozenset({FEATURE_WEEKLY_PROGRAM}),
+)
+
+# Only v0.2 is mapped so far. v0.3 and Pello v3.5+ (getregister.cgi) need
+# their own layouts before they can be added here.
+PROFILES: list[ProtocolProfile] = [PROFILE_V02]
+DEFAULT_PROFILE = PROFILE_V02
+
+
+def select_profile(firmware_version: str | None) -> ProtocolProfile:
+    """Pick the profile whose version prefix matches, else DEFAULT_PROFILE."""
+    if firmware_version:
+        version = firmware_version.strip().lstrip("vV")
+        for profile in PROFILES:
+            if version.startswith(profile.version_prefixes):
+                return profile
+        _LOGGER.warning(
+            "Unknown eCoal firmware %s, using %s protocol profile",
+            firmware_version,
+            DEFAULT_PROFILE.name,
+        )
+    return DEFAULT_PROFILE
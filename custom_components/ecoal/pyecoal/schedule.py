@@ -0,0 +1,133 @@
+"""Weekly program editing on the 7 x 48 slot day strings from parse_program.
+
+Days are indexed as on the controller (0=Sunday..6=Saturday) and slots are
+half hours ('1' = normal temperature, '0' = lowered). Every function returns
+a new list and leaves its input untouched. ScheduleIndex answers lookups on
+a program without scanning its slots.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import datetime
+
+from .codec import PARAM_PROG_CO_TAB, PARAM_PROG_CWU_TAB, PARAM_PROG_PODL_TAB
+
+PROGRAMS = {
+    "co": PARAM_PROG_CO_TAB,
+    "cwu": PARAM_PROG_CWU_TAB,
+    "floor": PARAM_PROG_PODL_TAB,
+}
+
+# Weekday names in controller day order
+DAY_NAMES = ("sun", "mon", "tue", "wed", "thu", "fri", "sat")
+
+SLOTS_PER_DAY = 48
+SLOT_MINUTES = 30
+WEEK_MINUTES = 7 * SLOTS_PER_DAY * SLOT_MINUTES
+
+
+def time_to_slot(hour: int, minute: int) -> int:
+    """Slot starting at hour:minute; minute must be 0 or 30."""
+    if minute % SLOT_MINUTES:
+        raise ValueError(f"{hour:02d}:{minute:02d} is not on a half-hour boundary")
+    return hour * 2 + minute // SLOT_MINUTES
+
+
+def week_minute(when: datetime) -> float:
+    """Minutes since Sunday 00:00 (controller day order) of a naive local time."""
+    day = (when.weekday() + 1) % 7
+    return day * 1440 + when.hour * 60 + when.minute + when.second / 60
+
+
+def set_slots(
+    days: list[str], day_indexes: Iterable[int], start: int, end: int, normal: bool
+) -> list[str]:
+    """Set slots [start, end) of the given days.
+
+    An end at or before the start runs past midnight: the slots from midnight
+    to end are set on the following day, Saturday carrying into Sunday.
+    """
+    length = end - start if end > start else SLOTS_PER_DAY - start + end
+    mark = "1" if normal else "0"
+    week = list("".join(days))
+    for day in day_indexes:
+        first = day * SLOTS_PER_DAY + start
+        for slot in range(first, first + length):
+            week[slot % len(week)] = mark
+    return _split_week(week)
+
+
+def shift_slots(days: list[str], day_indexes: Iterable[int], slots: int) -> list[str]:
+    """Move the given days later by slots (earlier if negative).
+
+    Slots pushed past midnight land on the neighbouring day (Saturday and
+    Sunday are neighbours) and the slots they leave behind take the
+    neighbouring day's edge, as if the week were moved along in time over
+    the span of each selected day.
+    """
+    old = "".join(days)
+    week = list(old)
+    for day in day_indexes:
+        first = day * SLOTS_PER_DAY + min(slots, 0)
+        last = (day + 1) * SLOTS_PER_DAY + max(slots, 0)
+        for slot in range(first, last):
+            week[slot % len(week)] = old[(slot - slots) % len(old)]
+    return _split_week(week)
+
+
+def _split_week(week: list[str]) -> list[str]:
+    return [
+        "".join(week[day : day + SLOTS_PER_DAY])
+        for day in range(0, len(week), SLOTS_PER_DAY)
+    ]
+
+
+def copy_day(days: list[str], source: int, targets: Iterable[int]) -> list[str]:
+    """Copy the source day's slots to every target day."""
+    result = list(days)
+    for day in targets:
+        result[day] = days[source]
+    return result
+
+
+class ScheduleIndex:
+    """Sorted transitions of one weekly program.
+
+    Built once per program; state_at and next_transition bisect the list of
+    transition minutes, so a lookup is O(log n) in the number of changes
+    instead of a scan of the 336 slots. The week wraps from Saturday back to
+    Sunday.
+    """
+
+    __slots__ = ("starts", "states", "_constant")
+
+    def __init__(self, days: list[str]) -> None:
+        bits = "".join(days)
+        # Minute of the week each run of equal slots starts at, and its state
+        self.starts: list[int] = []
+        self.states: list[bool] = []
+        for slot, bit in enumerate(bits):
+            if bit != bits[slot - 1]:
+                self.starts.append(slot * SLOT_MINUTES)
+                self.states.append(bit == "1")
+        self._constant = bool(bits) and bits[0] == "1"
+
+    def state_at(self, minute: float) -> bool:
+        """True (normal temperature) or False (lowered) at minute of the week."""
+        if not self.starts:
+            return self._constant
+        # -1 picks the last run, which wraps over the start of the week
+        return self.states[bisect_right(self.starts, minute) - 1]
+
+    def next_transition(self, minute: float) -> tuple[float, bool] | None:
+        """Minutes until the next change after minute and the state it sets.
+
+        None if the program never changes.
+        """
+        if not self.starts:
+            return None
+        index = bisect_right(self.starts, minute)
+        if index == len(self.starts):
+            return self.starts[0] + WEEK_MINUTES - minute, self.states[0]
+        return self.starts[index] - minute, self.states[index]
@@ -0,0 +1,164 @@
+"""Constant-memory timing statistics kept by the clients and transports."""
+from __future__ import annotations
+
+from bisect import insort
+
+from .codec import CMD_SETTINGS
+
+# Command classes by the command byte of a frame (hex chars 6-7)
+_COMMAND_CLASSES = {"01": "read", "02": "write", "05": "switch", "06": "status", "07": "clock"}
+
+
+def command_class(cmd: str) -> str:
+    """Coarse class of a command frame, used to group timing statistics."""
+    if cmd == CMD_SETTINGS:
+        return "settings"
+    return _COMMAND_CLASSES.get(cmd[6:8], "other")
+
+
+class TimingStats:
+    """Count, failures and min/mean/max/last duration of an operation."""
+
+    __slots__ = ("count", "failures", "total", "min", "max", "last")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.failures = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+        self.last: float | None = None
+
+    def add(self, seconds: float, ok: bool = True) -> None:
+        self.count += 1
+        if not ok:
+            self.failures += 1
+        self.total += seconds
+        self.last = seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        """Summary in milliseconds, for diagnostics and logs."""
+
+        def ms(value: float | None) -> float | None:
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "mean_ms": ms(self.total / self.count) if self.count else None,
+            "min_ms": ms(self.min),
+            "max_ms": ms(self.max),
+            "last_ms": ms(self.last),
+        }
+
+
+class P2Quantile:
+    """Streaming estimate of one quantile with the P-square algorithm.
+
+    Keeps five markers whatever the number of samples (Jain & Chlamtac,
+    1985); the middle marker tracks the p-quantile.
+    """
+
+    __slots__ = ("p", "count", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, p: float) -> None:
+        self.p = p
+        self.count = 0
+        self._heights: list[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._increments = (0.0, p / 2, p, (1 + p) / 2, 1.0)
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        q = self._heights
+        if len(q) < 5:
+            insort(q, x)
+            return
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        desired = self._desired
+        for i in range(5):
+            desired[i] += self._increments[i]
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                # Piecewise-parabolic prediction, linear if it leaves the bracket
+                candidate = q[i] + step / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = candidate
+                n[i] += step
+
+    @property
+    def value(self) -> float | None:
+        q = self._heights
+        if not q:
+            return None
+        if len(q) < 5:
+            return q[min(len(q) - 1, int(self.p * len(q)))]
+        return q[2]
+
+
+class AdaptiveTimeout:
+    """Read timeout per command class from the observed p99 latency.
+
+    The timeout is p99 x margin clamped to [floor, ceiling], and stays at
+    the ceiling until warmup samples of that class were seen. A request
+    that timed out is recorded at its budget, so a link that got slower
+    pushes the estimate up instead of failing forever.
+    """
+
+    def __init__(
+        self,
+        floor: float = 1.0,
+        ceiling: float = 10.0,
+        margin: float = 3.0,
+        warmup: int = 20,
+    ) -> None:
+        self.floor = floor
+        self.ceiling = ceiling
+        self.margin = margin
+        self.warmup = warmup
+        self._p99: dict[str, P2Quantile] = {}
+
+    def timeout(self, kind: str) -> float:
+        estimate = self._p99.get(kind)
+        if estimate is None or estimate.count < self.warmup:
+            return self.ceiling
+        return min(self.ceiling, max(self.floor, estimate.value * self.margin))
+
+    def observe(self, kind: str, seconds: float) -> None:
+        estimate = self._p99.get(kind)
+        if estimate is None:
+            estimate = self._p99[kind] = P2Quantile(0.99)
+        estimate.add(seconds)
+
+    def as_dict(self) -> dict[str, dict[str, float | int | None]]:
+        return {
+            kind: {
+                "samples": estimate.count,
+                "p99_ms": None if estimate.value is None else round(estimate.value * 1000, 3),
+                "timeout_s": round(self.timeout(kind), 3),
+            }
+            for kind, estimate in self._p99.items()
+        }
@@ -0,0 +1,214 @@
+"""Compact on-disk telemetry of raw status frames.
+
+Files hold fixed-width binary records, one UTC day per file
+(`<prefix>-YYYYMMDD.ectl`):
+
+    header  b"ECTL", version (u8), reserved (u8), frame length (u16 LE)
+    record  timestamp (f64 LE, Unix seconds) + frame bytes
+
+A raw frame already carries every decoded field in 86 bytes, so records are
+decoded with the codec on read. Fixed-width records with increasing
+timestamps let the reader memory-map a file and bisect straight to a time
+range without parsing anything before it.
+
+TelemetryWriter.append is cheap and does no I/O, so it can run on an event
+loop; flush does the blocking writes and is meant for a worker thread. With
+keep_days, starting a new daily file removes the files older than that.
+"""
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import threading
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from .codec import EcoalStatus
+from .profiles import DEFAULT_PROFILE, ProtocolProfile
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"ECTL"
+VERSION = 1
+SUFFIX = ".ectl"
+_HEADER = struct.Struct("<4sBBH")
+_TIMESTAMP = struct.Struct("<d")
+
+# Status bytes ignored when comparing frames for changes_only (clock)
+_CLOCK = slice(44, 50)
+
+
+def _day(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y%m%d")
+
+
+class TelemetryWriter:
+    """Buffer status frames in memory and append them to daily files on flush.
+
+    At most max_buffer records wait for a flush; beyond that the oldest are
+    dropped and counted in `dropped`. With changes_only, a frame equal to
+    the previous one apart from the clock bytes is not stored. With
+    keep_days, files of days more than keep_days before the day being
+    started are deleted.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        prefix: str = "ecoal",
+        frame_len: int = DEFAULT_PROFILE.status_len,
+        *,
+        changes_only: bool = False,
+        flush_records: int = 64,
+        max_buffer: int = 4096,
+        keep_days: int | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.frame_len = frame_len
+        self.changes_only = changes_only
+        self.flush_records = flush_records
+        self.keep_days = keep_days
+        self.dropped = 0
+        self._record = struct.Struct(f"<d{frame_len}s")
+        self._buffer: deque[tuple[str, bytes]] = deque(maxlen=max_buffer)
+        self._last: bytes | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def append(self, timestamp: float, raw: list[int]) -> bool:
+        """Queue one frame; returns False if it was skipped as unchanged."""
+        frame = bytes(raw[: self.frame_len])
+        if len(frame) < self.frame_len:
+            return False
+        if self.changes_only:
+            last = self._last
+            if (
+                last is not None
+                and frame[: _CLOCK.start] == last[: _CLOCK.start]
+                and frame[_CLOCK.stop :] == last[_CLOCK.stop :]
+            ):
+                return False
+            self._last = frame
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append((_day(timestamp), self._record.pack(timestamp, frame)))
+        return True
+
+    def flush(self) -> int:
+        """Write all queued records (blocking); returns the number written."""
+        with self._lock:
+            written = 0
+            handle = None
+            current_day = None
+            try:
+                while self._buffer:
+                    day, record = self._buffer.popleft()
+                    if day != current_day:
+                        if handle is not None:
+                            handle.close()
+                        handle = self._open(day)
+                        current_day = day
+                    handle.write(record)
+                    written += 1
+            finally:
+                if handle is not None:
+                    handle.close()
+            return written
+
+    def _open(self, day: str):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{self.prefix}-{day}{SUFFIX}"
+        handle = open(path, "ab")
+        if handle.tell() == 0:
+            handle.write(_HEADER.pack(MAGIC, VERSION, 0, self.frame_len))
+            if self.keep_days:
+                self._prune(day)
+        return handle
+
+    def _prune(self, day: str) -> None:
+        start = datetime.strptime(day, "%Y%m%d").replace(tzinfo=timezone.utc)
+        oldest = _day((start - timedelta(days=self.keep_days)).timestamp())
+        for path in self.directory.glob(f"{self.prefix}-*{SUFFIX}"):
+            if path.stem.rpartition("-")[2] >= oldest:
+                continue
+            try:
+                path.unlink()
+            except OSError as err:
+                _LOGGER.debug("Failed to remove old telemetry file %s: %s", path, err)
+
+
+class TelemetryReader:
+    """Range queries over the files written by TelemetryWriter."""
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        prefix: str = "ecoal",
+        profile: ProtocolProfile = DEFAULT_PROFILE,
+    ) -> None:
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.profile = profile
+
+    def files(self) -> list[Path]:
+        return sorted(self.directory.glob(f"{self.prefix}-*{SUFFIX}"))
+
+    def frames(
+        self, start: float | None = None, end: float | None = None
+    ) -> Iterator[tuple[float, list[int]]]:
+        """Yield (timestamp, raw frame) with start <= timestamp < end."""
+        first_day = None if start is None else _day(start)
+        last_day = None if end is None else _day(end)
+        for path in self.files():
+            day = path.stem.rpartition("-")[2]
+            if (first_day and day < first_day) or (last_day and day > last_day):
+                continue
+            yield from self._read_file(path, start, end)
+
+    def statuses(
+        self, start: float | None = None, end: float | None = None
+    ) -> Iterator[tuple[float, EcoalStatus]]:
+        """Yield (timestamp, decoded status) with start <= timestamp < end."""
+        decode = self.profile.decode_status
+        for timestamp, raw in self.frames(start, end):
+            yield timestamp, decode(raw)
+
+    @staticmethod
+    def _read_file(
+        path: Path, start: float | None, end: float | None
+    ) -> Iterator[tuple[float, list[int]]]:
+        with open(path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size <= _HEADER.size:
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                magic, _, _, frame_len = _HEADER.unpack_from(data, 0)
+                if magic != MAGIC:
+                    _LOGGER.warning("%s is not an eCoal telemetry file", path)
+                    return
+                width = _TIMESTAMP.size + frame_len
+                count = (size - _HEADER.size) // width
+
+                def timestamp_at(index: int) -> float:
+                    return _TIMESTAMP.unpack_from(data, _HEADER.size + index * width)[0]
+
+                index = 0 if start is None else bisect_left(
+                    range(count), start, key=timestamp_at
+                )
+                while index < count:
+                    offset = _HEADER.size + index * width
+                    timestamp = _TIMESTAMP.unpack_from(data, offset)[0]
+                    if end is not None and timestamp >= end:
+                        return
+                    body = offset + _TIMESTAMP.size
+                    yield timestamp, list(data[body : body + frame_len])
+                    index += 1
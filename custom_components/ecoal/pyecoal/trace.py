@@ -0,0 +1,129 @@
+"""Latency traces of single commands, from the caller to confirmed state.
+
+A CommandTrace is a list of named spans measured against one start time.
+The caller opens a trace and makes it current with `activate`; the client
+then records its own spans ("build", "http") through `span`, which costs a
+context variable lookup and nothing else when no trace is active.
+TraceLog keeps the last finished traces in a ring buffer and summarises them
+on demand.
+"""
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_current: ContextVar[CommandTrace | None] = ContextVar("ecoal_trace", default=None)
+
+
+class CommandTrace:
+    """Spans of one command as (name, start, end) seconds from its start."""
+
+    __slots__ = ("command", "started_at", "spans", "ok", "confirmed", "_start", "_open")
+
+    def __init__(self, command: str) -> None:
+        self.command = command
+        self.started_at = time.time()
+        self.spans: list[tuple[str, float, float]] = []
+        self.ok = True
+        self.confirmed: bool | None = None
+        self._start = time.perf_counter()
+        self._open: dict[str, float] = {}
+
+    def now(self) -> float:
+        return time.perf_counter() - self._start
+
+    def begin(self, name: str) -> None:
+        """Open a span that ends in a later call to end (e.g. another task)."""
+        self._open[name] = self.now()
+
+    def end(self, name: str) -> None:
+        start = self._open.pop(name, None)
+        if start is not None:
+            self.spans.append((name, start, self.now()))
+
+    def is_open(self, name: str) -> bool:
+        return name in self._open
+
+    @property
+    def total(self) -> float:
+        return max((end for _, _, end in self.spans), default=0.0)
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "command": self.command,
+            "started_at": self.started_at,
+            "ok": self.ok,
+            "confirmed": self.confirmed,
+            "total_ms": round(self.total * 1000, 1),
+            "spans": {
+                name: {"start_ms": round(start * 1000, 1), "ms": round((end - start) * 1000, 1)}
+                for name, start, end in self.spans
+            },
+        }
+
+
+@contextmanager
+def activate(trace: CommandTrace) -> Iterator[CommandTrace]:
+    """Make trace current for the spans recorded inside the block."""
+    token = _current.set(trace)
+    try:
+        yield trace
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Record a span on the current trace, if any."""
+    trace = _current.get()
+    if trace is None:
+        yield
+        return
+    start = trace.now()
+    try:
+        yield
+    finally:
+        trace.spans.append((name, start, trace.now()))
+
+
+def _percentile(ordered: list[float], p: float) -> float:
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+class TraceLog:
+    """Ring buffer of finished traces with percentile summaries."""
+
+    def __init__(self, size: int = 128) -> None:
+        self.traces: deque[CommandTrace] = deque(maxlen=size)
+
+    def add(self, trace: CommandTrace) -> None:
+        self.traces.append(trace)
+
+    def summary(self) -> dict[str, dict[str, dict[str, float | int]]]:
+        """p50/p90/p99/max in ms of the total and of each span, per command.
+
+        Computed from the buffer when asked, so keeping traces costs only
+        the append.
+        """
+        samples: dict[str, dict[str, list[float]]] = {}
+        for trace in self.traces:
+            by_span = samples.setdefault(trace.command, {})
+            by_span.setdefault("total", []).append(trace.total)
+            for name, start, end in trace.spans:
+                by_span.setdefault(name, []).append(end - start)
+        result: dict[str, dict[str, dict[str, float | int]]] = {}
+        for command, by_span in samples.items():
+            result[command] = {}
+            for name, values in by_span.items():
+                values.sort()
+                result[command][name] = {
+                    "count": len(values),
+                    "p50_ms": round(_percentile(values, 0.5) * 1000, 1),
+                    "p90_ms": round(_percentile(values, 0.9) * 1000, 1),
+                    "p99_ms": round(_percentile(values, 0.99) * 1000, 1),
+                    "max_ms": round(values[-1] * 1000, 1),
+                }
+        return result
@@ -0,0 +1,126 @@
+"""Transports that carry eCoal command frames over HTTP.
+
+A transport sends one hex frame as `GET /?com=<frame>` and returns the raw
+response body, or None on any failure. aiohttp is imported on first use so
+the codec and blocking transport work without it; urllib is likewise only
+imported by the blocking transport.
+
+The aiohttp transport bounds connecting and reading separately. The read
+budget adapts per command class to the latency observed on this host, so a
+hung request fails after a few times the usual response time instead of
+the full ceiling.
+"""
+from __future__ import annotations
+
+import base64
+import logging
+import time
+from typing import TYPE_CHECKING, Protocol
+
+from .stats import AdaptiveTimeout, command_class
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_CONNECT_TIMEOUT = 3
+
+
+class AsyncTransport(Protocol):
+    async def fetch(self, cmd: str) -> str | None: ...
+
+
+class SyncTransport(Protocol):
+    def fetch(self, cmd: str) -> str | None: ...
+
+
+class AiohttpTransport:
+    """Async transport on an aiohttp session (created on demand if not given)."""
+
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        session: aiohttp.ClientSession | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    ) -> None:
+        import aiohttp
+
+        self.host = host
+        self._url = f"http://{host}"
+        self._auth = aiohttp.BasicAuth(username, password)
+        self._session = session
+        self._owns_session = session is None
+        self._connect_timeout = connect_timeout
+        # timeout is the ceiling of the adaptive read budget
+        self.timeouts = AdaptiveTimeout(ceiling=timeout)
+
+    async def fetch(self, cmd: str) -> str | None:
+        import aiohttp
+
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        url = f"{self._url}/?com={cmd}"
+        kind = command_class(cmd)
+        read_timeout = self.timeouts.timeout(kind)
+        timeout = aiohttp.ClientTimeout(
+            total=self._connect_timeout + read_timeout,
+            sock_connect=self._connect_timeout,
+            sock_read=read_timeout,
+        )
+        started = time.monotonic()
+        try:
+            async with self._session.get(url, auth=self._auth, timeout=timeout) as resp:
+                if resp.status != 200:
+                    return None
+                body = await resp.text()
+        except TimeoutError:
+            _LOGGER.debug(
+                "Furnace at %s did not answer %s within %.1f s", self.host, kind, read_timeout
+            )
+            self.timeouts.observe(kind, read_timeout)
+            return None
+        except aiohttp.ClientError as err:
+            _LOGGER.debug("Error communicating with furnace at %s: %s", self.host, err)
+            return None
+        self.timeouts.observe(kind, time.monotonic() - started)
+        return body
+
+    async def close(self) -> None:
+        """Close the session if this transport created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class BlockingTransport:
+    """Blocking transport on urllib, for scripts and threads without a loop."""
+
+    def __init__(
+        self, host: str, username: str, password: str, timeout: float = DEFAULT_TIMEOUT
+    ) -> None:
+        self.host = host
+        self._url = f"http://{host}"
+        token = base64.b64encode(f"{username}:{password}".encode()).decode()
+        self._headers = {"Authorization": f"Basic {token}"}
+        self._timeout = timeout
+
+    def fetch(self, cmd: str) -> str | None:
+        import urllib.error
+        import urllib.request
+
+        request = urllib.request.Request(
+            f"{self._url}/?com={cmd}", headers=self._headers
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout) as resp:
+                if resp.status != 200:
+                    return None
+                return resp.read().decode("utf-8", errors="replace")
+        except (urllib.error.URLError, OSError) as err:
+            _LOGGER.debug("Error communicating with furnace at %s: %s", self.host, err)
+            return None
@@ -0,0 +1,72 @@
+"""Select entities for eCoal, generated from the parameter registry."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.components.select import SelectEntity, SelectEntityDescription
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import EcoalCoordinator
+from .entity import EcoalParamEntity
+from .pyecoal.params import PARAMS, ParamSpec
+
+
+@dataclass(frozen=True, kw_only=True)
+class EcoalSelectDescription(SelectEntityDescription):
+    spec: ParamSpec
+
+
+SELECT_DESCRIPTIONS: tuple[EcoalSelectDescription, ...] = tuple(
+    EcoalSelectDescription(
+        key=spec.key,
+        translation_key=spec.key,
+        spec=spec,
+        options=[option for _, option in spec.options],
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=spec.status_field is not None,
+    )
+    for spec in PARAMS
+    if spec.options is not None
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    coordinator: EcoalCoordinator = hass.data[DOMAIN][entry.entry_id]
+    connected = coordinator.connected_sensors
+    async_add_entities(
+        EcoalSelect(coordinator, description)
+        for description in SELECT_DESCRIPTIONS
+        if not description.spec.requires_sensor
+        or description.spec.requires_sensor in connected
+    )
+
+
+class EcoalSelect(EcoalParamEntity, SelectEntity):
+    entity_description: EcoalSelectDescription
+
+    def __init__(
+        self,
+        coordinator: EcoalCoordinator,
+        description: EcoalSelectDescription,
+    ) -> None:
+        super().__init__(coordinator, description.spec)
+        self.entity_description = description
+        self._option_by_value = dict(description.spec.options)
+        self._value_by_option = {
+            option: value for value, option in description.spec.options
+        }
+
+    @property
+    def current_option(self) -> str | None:
+        return self._option_by_value.get(self.param_value)
+
+    async def async_select_option(self, option: str) -> None:
+        await self.async_write_param(self._value_by_option[option])
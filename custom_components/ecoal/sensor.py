@@ -1,7 +1,10 @@
 """Sensors for eCoal."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+from operator import attrgetter
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -10,20 +13,32 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTemperature, UnitOfTime
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfEnergy,
+    UnitOfMass,
+    UnitOfTemperature,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import EcoalCoordinator
+from .entity import EcoalEntity
+from .pyecoal import OUTPUT_NAMES
+from .pyecoal.counters import RuntimeCounters
+from .pyecoal.profiles import FEATURE_WEEKLY_PROGRAM
+from .pyecoal.schedule import week_minute
 
 
 @dataclass(frozen=True, kw_only=True)
 class EcoalSensorDescription(SensorEntityDescription):
     value_key: str
     requires_sensor: str | None = None
+    coordinator_value: bool = False
 
 
 SENSOR_DESCRIPTIONS: tuple[EcoalSensorDescription, ...] = (
@@ -267,6 +282,28 @@ DIAG_DESCRIPTIONS: tuple[EcoalSensorDescription, ...] = (
         icon="mdi:clock-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
+    EcoalSensorDescription(
+        key="clock_drift",
+        value_key="clock_drift",
+        translation_key="clock_drift",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        icon="mdi:clock-alert-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        coordinator_value=True,
+    ),
+    EcoalSensorDescription(
+        key="data_age",
+        value_key="data_age",
+        translation_key="data_age",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        icon="mdi:timer-sand",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        coordinator_value=True,
+    ),
     EcoalSensorDescription(
         key="fuel_load_date",
         value_key="fuel_load_date",
@@ -284,6 +321,101 @@ DIAG_DESCRIPTIONS: tuple[EcoalSensorDescription, ...] = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class EcoalScheduleSensorDescription(SensorEntityDescription):
+    program: str
+    next_change: bool = False
+    requires_sensor: str | None = None
+
+
+# Weekly program state now and its next change, on the controller clock
+SCHEDULE_DESCRIPTIONS: tuple[EcoalScheduleSensorDescription, ...] = tuple(
+    description
+    for program, requires_sensor in (
+        ("co", None),
+        ("cwu", "dhw_temp"),
+        ("floor", "floor_temp"),
+    )
+    for description in (
+        EcoalScheduleSensorDescription(
+            key=f"{program}_schedule",
+            translation_key=f"{program}_schedule",
+            device_class=SensorDeviceClass.ENUM,
+            options=["normal", "lowered"],
+            icon="mdi:calendar-clock",
+            program=program,
+            requires_sensor=requires_sensor,
+        ),
+        EcoalScheduleSensorDescription(
+            key=f"{program}_schedule_next_change",
+            translation_key=f"{program}_schedule_next_change",
+            device_class=SensorDeviceClass.TIMESTAMP,
+            icon="mdi:calendar-arrow-right",
+            program=program,
+            next_change=True,
+            requires_sensor=requires_sensor,
+        ),
+    )
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class EcoalCounterSensorDescription(SensorEntityDescription):
+    value_fn: Callable[[RuntimeCounters], float]
+    # Only meaningful with a calibrated feed rate
+    needs_feed_rate: bool = False
+
+
+# Outputs without a manual switch; their runtimes start disabled like their
+# binary sensors, since not every boiler has them wired
+_EXTRA_OUTPUTS = {"z1_pump", "valve_3d", "cwu_mixer"}
+
+
+def _runtime_hours(name: str) -> Callable[[RuntimeCounters], float]:
+    return lambda counters: round(counters.seconds[name] / 3600, 3)
+
+
+# Counters integrated by the coordinator and kept in HA storage
+COUNTER_DESCRIPTIONS: tuple[EcoalCounterSensorDescription, ...] = (
+    *(
+        EcoalCounterSensorDescription(
+            key=f"{name}_runtime",
+            translation_key=f"{name}_runtime",
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.HOURS,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            suggested_display_precision=1,
+            icon="mdi:timer-outline",
+            value_fn=_runtime_hours(name),
+            entity_registry_enabled_default=name not in _EXTRA_OUTPUTS,
+        )
+        for name in OUTPUT_NAMES
+    ),
+    EcoalCounterSensorDescription(
+        key="fuel_used",
+        translation_key="fuel_used",
+        device_class=SensorDeviceClass.WEIGHT,
+        native_unit_of_measurement=UnitOfMass.KILOGRAMS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=1,
+        icon="mdi:fire",
+        value_fn=lambda counters: round(counters.fuel_kg, 3),
+        needs_feed_rate=True,
+    ),
+    EcoalCounterSensorDescription(
+        key="heat_energy",
+        translation_key="heat_energy",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        suggested_display_precision=1,
+        icon="mdi:radiator",
+        value_fn=lambda counters: round(counters.heat_kwh, 3),
+        needs_feed_rate=True,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -295,35 +427,124 @@ async def async_setup_entry(
     for description in SENSOR_DESCRIPTIONS:
         if description.requires_sensor and description.requires_sensor not in connected:
             continue
-        entities.append(EcoalSensor(coordinator, description, entry))
+        entities.append(EcoalSensor(coordinator, description))
     for description in DIAG_DESCRIPTIONS:
-        entities.append(EcoalSensor(coordinator, description, entry))
+        entities.append(EcoalSensor(coordinator, description))
+    if (counters := coordinator.counters) is not None:
+        entities.extend(
+            EcoalCounterSensor(coordinator, description)
+            for description in COUNTER_DESCRIPTIONS
+            if counters.feed_rate or not description.needs_feed_rate
+        )
+    if FEATURE_WEEKLY_PROGRAM in coordinator.client.profile.features:
+        entities.extend(
+            EcoalScheduleSensor(coordinator, description)
+            for description in SCHEDULE_DESCRIPTIONS
+            if not description.requires_sensor
+            or description.requires_sensor in connected
+        )
     async_add_entities(entities)
 
 
-class EcoalSensor(CoordinatorEntity[EcoalCoordinator], SensorEntity):
+class EcoalSensor(EcoalEntity, SensorEntity):
     entity_description: EcoalSensorDescription
-    _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: EcoalCoordinator,
         description: EcoalSensorDescription,
-        entry: ConfigEntry,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="eCoal",
-            manufacturer="eCoal",
-            model="Furnace Controller",
-            sw_version=coordinator.firmware_version,
-        )
+        self._value = attrgetter(description.value_key)
 
     @property
     def native_value(self) -> float | int | str | None:
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get(self.entity_description.value_key)
+        if self.entity_description.coordinator_value:
+            return self._value(self.coordinator)
+        return self._value(self.coordinator.data)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float] | None:
+        status_filter = self.coordinator.status_filter
+        if status_filter is None:
+            return None
+        raw = status_filter.raw.get(self.entity_description.value_key)
+        if raw is None:
+            return None
+        return {"raw_value": raw}
+
+
+class EcoalScheduleSensor(EcoalEntity, SensorEntity):
+    """Weekly program state now, or the time of its next change."""
+
+    entity_description: EcoalScheduleSensorDescription
+
+    def __init__(
+        self,
+        coordinator: EcoalCoordinator,
+        description: EcoalScheduleSensorDescription,
+    ) -> None:
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_track_program(self.entity_description.program)
+        )
+        if self.coordinator.schedule_index(self.entity_description.program) is None:
+            await self.coordinator.async_request_refresh()
+
+    def _lookup(self) -> tuple[bool, tuple[float, bool] | None] | None:
+        """Program state now and (minutes to, state of) its next change."""
+        index = self.coordinator.schedule_index(self.entity_description.program)
+        if index is None:
+            return None
+        minute = week_minute(self.coordinator.controller_now())
+        return index.state_at(minute), index.next_transition(minute)
+
+    @property
+    def native_value(self) -> str | datetime | None:
+        if (lookup := self._lookup()) is None:
+            return None
+        normal, upcoming = lookup
+        if not self.entity_description.next_change:
+            return "normal" if normal else "lowered"
+        if upcoming is None:
+            return None
+        # Minutes counted on the controller clock land at the same offset
+        # from HA now; whole minutes keep drift jitter out of the state
+        change = dt_util.now() + timedelta(minutes=upcoming[0], seconds=30)
+        return change.replace(second=0, microsecond=0)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, str] | None:
+        if not self.entity_description.next_change:
+            return None
+        if (lookup := self._lookup()) is None or lookup[1] is None:
+            return None
+        return {"next_state": "normal" if lookup[1][1] else "lowered"}
+
+
+class EcoalCounterSensor(EcoalEntity, SensorEntity):
+    """Runtime or energy total integrated by the coordinator."""
+
+    entity_description: EcoalCounterSensorDescription
+
+    def __init__(
+        self,
+        coordinator: EcoalCoordinator,
+        description: EcoalCounterSensorDescription,
+    ) -> None:
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
+
+    @property
+    def native_value(self) -> float | None:
+        counters = self.coordinator.counters
+        if counters is None:
+            return None
+        return self.entity_description.value_fn(counters)
@@ -0,0 +1,150 @@
+"""Services for eCoal."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN
+from .coordinator import EcoalCoordinator
+from .pyecoal.schedule import (
+    DAY_NAMES,
+    PROGRAMS,
+    SLOT_MINUTES,
+    copy_day,
+    set_slots,
+    shift_slots,
+    time_to_slot,
+)
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_PROGRAM = "program"
+ATTR_DAYS = "days"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_STATE = "state"
+ATTR_MINUTES = "minutes"
+ATTR_SOURCE_DAY = "source_day"
+
+STATE_NORMAL = "normal"
+STATE_LOWERED = "lowered"
+
+SERVICE_SET_SCHEDULE = "set_schedule"
+SERVICE_SHIFT_SCHEDULE = "shift_schedule"
+SERVICE_COPY_SCHEDULE = "copy_schedule"
+
+_PROGRAM_SCHEMA = {
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required(ATTR_PROGRAM): vol.In(PROGRAMS),
+}
+_DAYS = vol.All(cv.ensure_list, [vol.In(DAY_NAMES)])
+
+SET_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        **_PROGRAM_SCHEMA,
+        vol.Optional(ATTR_DAYS, default=list(DAY_NAMES)): _DAYS,
+        vol.Required(ATTR_START): cv.time,
+        vol.Required(ATTR_END): cv.time,
+        vol.Required(ATTR_STATE): vol.In((STATE_NORMAL, STATE_LOWERED)),
+    }
+)
+
+SHIFT_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        **_PROGRAM_SCHEMA,
+        vol.Optional(ATTR_DAYS, default=list(DAY_NAMES)): _DAYS,
+        vol.Required(ATTR_MINUTES): vol.All(
+            vol.Coerce(int), vol.Range(min=-720, max=720)
+        ),
+    }
+)
+
+COPY_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        **_PROGRAM_SCHEMA,
+        vol.Required(ATTR_SOURCE_DAY): vol.In(DAY_NAMES),
+        vol.Required(ATTR_DAYS): _DAYS,
+    }
+)
+
+
+def _get_coordinators(hass: HomeAssistant, call: ServiceCall) -> list[EcoalCoordinator]:
+    """Coordinators targeted by a call: one entry if given, otherwise all."""
+    coordinators: dict[str, EcoalCoordinator] = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is None:
+        return list(coordinators.values())
+    if entry_id not in coordinators:
+        raise ServiceValidationError(f"eCoal entry {entry_id} is not loaded")
+    return [coordinators[entry_id]]
+
+
+def _day_indexes(call: ServiceCall) -> list[int]:
+    return [DAY_NAMES.index(day) for day in call.data[ATTR_DAYS]]
+
+
+async def _async_edit_programs(
+    call: ServiceCall, edit: Callable[[list[str]], list[str]]
+) -> None:
+    """Apply edit to the selected program on every targeted controller at once."""
+    param = PROGRAMS[call.data[ATTR_PROGRAM]]
+    await asyncio.gather(
+        *(
+            coordinator.async_edit_program(param, edit)
+            for coordinator in _get_coordinators(call.hass, call)
+        )
+    )
+
+
+async def _async_set_schedule(call: ServiceCall) -> None:
+    try:
+        start = time_to_slot(call.data[ATTR_START].hour, call.data[ATTR_START].minute)
+        end = time_to_slot(call.data[ATTR_END].hour, call.data[ATTR_END].minute)
+    except ValueError as err:
+        raise ServiceValidationError(str(err)) from err
+    days = _day_indexes(call)
+    normal = call.data[ATTR_STATE] == STATE_NORMAL
+    await _async_edit_programs(
+        call, lambda program: set_slots(program, days, start, end, normal)
+    )
+
+
+async def _async_shift_schedule(call: ServiceCall) -> None:
+    minutes = call.data[ATTR_MINUTES]
+    if minutes % SLOT_MINUTES:
+        raise ServiceValidationError(
+            f"Shift of {minutes} minutes is not a multiple of {SLOT_MINUTES}"
+        )
+    days = _day_indexes(call)
+    await _async_edit_programs(
+        call, lambda program: shift_slots(program, days, minutes // SLOT_MINUTES)
+    )
+
+
+async def _async_copy_schedule(call: ServiceCall) -> None:
+    source = DAY_NAMES.index(call.data[ATTR_SOURCE_DAY])
+    days = _day_indexes(call)
+    await _async_edit_programs(call, lambda program: copy_day(program, source, days))
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register eCoal services once for all config entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_SET_SCHEDULE):
+        return
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_SCHEDULE, _async_set_schedule, schema=SET_SCHEDULE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SHIFT_SCHEDULE,
+        _async_shift_schedule,
+        schema=SHIFT_SCHEDULE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_COPY_SCHEDULE, _async_copy_schedule, schema=COPY_SCHEDULE_SCHEMA
+    )
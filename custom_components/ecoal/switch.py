@@ -2,17 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import EcoalCoordinator
+from .entity import EcoalEntity
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -78,51 +79,43 @@ async def async_setup_entry(
     coordinator: EcoalCoordinator = hass.data[DOMAIN][entry.entry_id]
     connected = coordinator.connected_sensors
     async_add_entities(
-        EcoalSwitch(coordinator, description, entry)
+        EcoalSwitch(coordinator, description)
         for description in SWITCH_DESCRIPTIONS
         if not description.requires_sensor or description.requires_sensor in connected
     )
 
 
-class EcoalSwitch(CoordinatorEntity[EcoalCoordinator], SwitchEntity):
+class EcoalSwitch(EcoalEntity, SwitchEntity):
     entity_description: EcoalSwitchDescription
-    _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: EcoalCoordinator,
         description: EcoalSwitchDescription,
-        entry: ConfigEntry,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, description.key)
         self.entity_description = description
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="eCoal",
-            manufacturer="eCoal",
-            model="Furnace Controller",
-            sw_version=coordinator.firmware_version,
-        )
+        self._value = attrgetter(description.value_key)
 
     @property
     def is_on(self) -> bool | None:
         if self.coordinator.data is None:
             return None
-        return self.coordinator.data.get(self.entity_description.value_key)
+        return self._value(self.coordinator.data)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        desc = self.entity_description
-        if desc.is_auto_mode:
-            await self.coordinator.client.set_auto_mode(True)
-        else:
-            await self.coordinator.client.set_switch(desc.param, True)
-        await self.coordinator.async_request_refresh()
+        await self._async_switch(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
+        await self._async_switch(False)
+
+    async def _async_switch(self, on: bool) -> None:
         desc = self.entity_description
+        client = self.coordinator.client
         if desc.is_auto_mode:
-            await self.coordinator.client.set_auto_mode(False)
+            write = partial(client.set_auto_mode, on)
         else:
-            await self.coordinator.client.set_switch(desc.param, False)
-        await self.coordinator.async_request_refresh()
+            write = partial(client.set_switch, desc.param, on)
+        await self.coordinator.async_traced_write(
+            desc.key, write, lambda status: self._value(status) == on
+        )
@@ -0,0 +1,64 @@
+"""Report import time of the eCoal protocol library or the integration.
+
+Runs `python -X importtime` in a fresh interpreter and prints the slowest
+modules by cumulative time, plus whether aiohttp got imported.
+
+    python scripts/import_profile.py                      # pyecoal (HA-free)
+    python scripts/import_profile.py pyecoal.client
+    python scripts/import_profile.py custom_components.ecoal --top 30
+
+pyecoal modules are loaded through scripts/pyecoal_cli.py, so the integration
+directory (whose select.py shadows the stdlib module) stays off sys.path.
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def profile(module: str) -> list[tuple[int, int, str]]:
+    """Return (self_us, cumulative_us, name) for every module imported."""
+    if module.startswith("custom_components"):
+        code, cwd = f"import {module}", ROOT
+    else:
+        code = f"import pyecoal_cli; pyecoal_cli.install(); import {module}"
+        cwd = ROOT / "scripts"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode:
+        sys.exit(proc.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:") :].split("|")
+        rows.append((int(self_us), int(cumulative), name.strip()))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default="pyecoal")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    rows = profile(args.module)
+    total = next((cum for _, cum, name in rows if name == args.module), 0)
+    print(f"{args.module}: {total / 1000:.1f} ms, {len(rows)} modules")
+    print(f"aiohttp imported: {any(name == 'aiohttp' for _, _, name in rows)}")
+    print(f"{'cumulative ms':>14} {'self ms':>8}  module")
+    for self_us, cumulative, name in sorted(rows, key=lambda r: r[1], reverse=True)[: args.top]:
+        print(f"{cumulative / 1000:14.1f} {self_us / 1000:8.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
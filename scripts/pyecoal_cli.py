@@ -0,0 +1,64 @@
+"""Run the pyecoal command line tool, or load pyecoal, without Home Assistant.
+
+custom_components/ecoal cannot go on sys.path (its select.py platform would
+shadow the stdlib select module, which asyncio imports), and importing
+custom_components.ecoal.pyecoal runs the integration's __init__, which needs
+Home Assistant. This shim loads the pyecoal package straight from its
+directory under the top-level name `pyecoal`:
+
+    python scripts/pyecoal_cli.py -u admin -p secret status 192.168.1.10
+
+or, from Python code:
+
+    sys.path.insert(0, "scripts")
+    from pyecoal_cli import load_pyecoal
+
+    pyecoal = load_pyecoal()
+"""
+from __future__ import annotations
+
+import importlib
+import importlib.abc
+import importlib.util
+import sys
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import ModuleType
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "ecoal" / "pyecoal"
+
+
+class _PyecoalFinder(importlib.abc.MetaPathFinder):
+    """Resolve the top-level name pyecoal to the bundled package directory."""
+
+    def find_spec(
+        self, name: str, path: object = None, target: object = None
+    ) -> ModuleSpec | None:
+        if name != "pyecoal":
+            return None
+        return importlib.util.spec_from_file_location(
+            name, PACKAGE_DIR / "__init__.py", submodule_search_locations=[str(PACKAGE_DIR)]
+        )
+
+
+def install() -> None:
+    """Make `import pyecoal` work; submodules are found through its __path__."""
+    if not any(isinstance(finder, _PyecoalFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _PyecoalFinder())
+
+
+def load_pyecoal() -> ModuleType:
+    """Import custom_components/ecoal/pyecoal as the top-level package pyecoal."""
+    install()
+    return importlib.import_module("pyecoal")
+
+
+def main() -> int:
+    load_pyecoal()
+    from pyecoal.cli import main as cli_main
+
+    return cli_main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
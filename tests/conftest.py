@@ -0,0 +1,48 @@
+"""Shared fixtures; pyecoal is loaded by path, without Home Assistant."""
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import pyecoal_cli  # noqa: E402
+
+pyecoal_cli.install()
+
+from pyecoal.codec import EcoalStatus, decode_status  # noqa: E402
+
+STATUS_LEN = 86
+
+
+def _temp(value: float) -> list[int]:
+    raw = round(value * 10) & 0xFFFF
+    return [raw & 0xFF, raw >> 8]
+
+
+@pytest.fixture
+def make_frame() -> Callable[..., list[int]]:
+    """Build a raw status frame; keyword arguments set temperatures by name."""
+
+    def _make(
+        *, outputs: int = 0, clock: tuple[int, ...] = (24, 1, 10, 12, 0, 0), **temps: float
+    ) -> list[int]:
+        frame = [0] * STATUS_LEN
+        for offset, name in enumerate(
+            ("floor", "indoor", "outdoor", "dhw", "return", "feeder", "boiler", "exhaust")
+        ):
+            frame[16 + 2 * offset : 18 + 2 * offset] = _temp(temps.get(name, 20.0))
+        frame[32] = outputs
+        frame[44:50] = clock
+        return frame
+
+    return _make
+
+
+@pytest.fixture
+def make_status(make_frame) -> Callable[..., EcoalStatus]:
+    """Like make_frame, decoded."""
+    return lambda **kwargs: decode_status(make_frame(**kwargs))
@@ -0,0 +1,75 @@
+from dataclasses import replace
+
+from pyecoal.anomaly import AnomalyDetector, EwmaChannel
+
+BLOWER = 0b001
+CH_PUMP = 0b100
+
+
+def _run(detector, statuses, interval=30.0):
+    """Feed statuses at a fixed interval; returns every change with its index."""
+    changes = []
+    for n, status in enumerate(statuses):
+        changes += [(n, name, active) for name, active in detector.update(n * interval, status)]
+    return changes
+
+
+def test_ewma_channel_slope_per_minute():
+    channel = EwmaChannel(alpha=0.5, slope_alpha=1.0)
+    channel.add(0, 20.0)
+    channel.add(30, 21.0)
+
+    assert channel.slope == 2.0
+    assert channel.mean == 20.5
+
+
+def test_exhaust_rise_with_blower_off(make_status):
+    steady = [make_status(exhaust=120.0, outputs=BLOWER)] * 15
+    rising = [make_status(exhaust=120.0 + 2 * n, outputs=0) for n in range(10)]
+
+    changes = _run(AnomalyDetector(), steady + rising)
+
+    assert changes[0][1:] == ("exhaust_rise_blower_off", True)
+    # Raised only after the blower grace and the hold samples
+    assert changes[0][0] >= 15 + 4 + 2
+
+
+def test_exhaust_cooling_with_blower_off_is_quiet(make_status):
+    statuses = [make_status(exhaust=150.0 - n, outputs=0) for n in range(40)]
+
+    assert _run(AnomalyDetector(), statuses) == []
+
+
+def test_feeder_burnback_raised_and_cleared(make_status):
+    steady = [make_status(feeder=30.0)] * 30
+    rising = [make_status(feeder=30.0 + 2 * n) for n in range(1, 15)]
+    settled = [make_status(feeder=58.0)] * 20
+
+    changes = _run(AnomalyDetector(), steady + rising + settled)
+
+    assert [change[1:] for change in changes] == [
+        ("feeder_burnback", True),
+        ("feeder_burnback", False),
+    ]
+
+
+def test_return_delta_collapse(make_status):
+    normal = [make_status(boiler=70.0, **{"return": 55.0}, outputs=CH_PUMP)] * 30
+    collapsed = [make_status(boiler=70.0, **{"return": 69.0}, outputs=CH_PUMP)] * 10
+
+    detector = AnomalyDetector()
+    changes = _run(detector, normal + collapsed)
+
+    assert [change[1:] for change in changes] == [("return_delta_collapse", True)]
+    assert detector.active == {"return_delta_collapse"}
+
+
+def test_disconnected_and_implausible_probes_are_skipped(make_status):
+    detector = AnomalyDetector()
+    status = make_status(exhaust=-3276.8, feeder=30.0, outputs=0)
+    disconnected = replace(status, feeder_temp_state=1)
+
+    _run(detector, [disconnected] * 20)
+
+    assert detector.exhaust.count == 0
+    assert detector.feeder.count == 0
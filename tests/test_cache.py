@@ -0,0 +1,93 @@
+import asyncio
+
+from pyecoal.cache import StatusCache
+from pyecoal.capture import CaptureRecord, ReplayTransport
+from pyecoal.client import EcoalClient
+from pyecoal.codec import CMD_STATUS, build_read_cmd, build_value_cmd
+
+
+class _Reads:
+    """Counting read callback that waits on an event before answering."""
+
+    def __init__(self, status):
+        self.status = status
+        self.count = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.count += 1
+        await self.release.wait()
+        return self.status
+
+
+def test_concurrent_fetches_share_one_read(make_status):
+    async def run():
+        cache = StatusCache()
+        reads = _Reads(make_status())
+        waiting = [asyncio.ensure_future(cache.fetch("host", reads)) for _ in range(3)]
+        await asyncio.sleep(0)
+        reads.release.set()
+        results = await asyncio.gather(*waiting)
+        return reads.count, results, cache
+
+    count, results, cache = asyncio.run(run())
+
+    assert count == 1
+    assert results[0] is results[1] is results[2]
+    assert cache.latest("host") is results[0]
+
+
+def test_fresh_status_is_reused_until_max_age(make_status):
+    async def run():
+        cache = StatusCache(ttl=60)
+        reads = _Reads(make_status())
+        reads.release.set()
+        await cache.fetch("host", reads)
+        await cache.fetch("host", reads)
+        await cache.fetch("host", reads, max_age=0)
+        return reads.count
+
+    assert asyncio.run(run()) == 2
+
+
+def test_invalidate_during_read_drops_the_result(make_status):
+    async def run():
+        cache = StatusCache()
+        reads = _Reads(make_status())
+        pending = asyncio.ensure_future(cache.fetch("host", reads))
+        await asyncio.sleep(0)
+        cache.invalidate("host")
+        reads.release.set()
+        status = await pending
+        return status, cache.latest("host")
+
+    status, cached = asyncio.run(run())
+
+    assert status is not None
+    assert cached is None
+
+
+def _client(cache, make_frame, *cmds):
+    body = "[" + ",".join(map(str, make_frame())) + "]"
+    records = [CaptureRecord(0.0, CMD_STATUS, body)]
+    records += [CaptureRecord(0.0, cmd, "[2,1,0,1,0,40,2,0,60,0,0,3]") for cmd in cmds]
+    return EcoalClient("host", transport=ReplayTransport(records), status_cache=cache)
+
+
+def test_only_writes_invalidate_the_client_key(make_frame):
+    read_cmd = build_read_cmd(0x28)
+    write_cmd = build_value_cmd(0x28, 60)
+
+    async def run():
+        cache = StatusCache(ttl=60)
+        client = _client(cache, make_frame, read_cmd, write_cmd)
+        await client.get_status()
+        await client.read_param(0x28)
+        after_read = cache.latest(client.cache_key)
+        await client.set_param(0x28, 60)
+        return after_read, cache.latest(client.cache_key)
+
+    after_read, after_write = asyncio.run(run())
+
+    assert after_read is not None
+    assert after_write is None
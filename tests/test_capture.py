@@ -0,0 +1,63 @@
+import asyncio
+
+from pyecoal.capture import (
+    CaptureRecord,
+    CaptureWriter,
+    ReplayClient,
+    ReplayTransport,
+    read_capture,
+)
+from pyecoal.codec import CMD_STATUS
+
+
+def _body(frame: list[int]) -> str:
+    return "[" + ",".join(map(str, frame)) + "]"
+
+
+def test_writer_round_trip(tmp_path):
+    path = str(tmp_path / "capture.txt")
+    writer = CaptureWriter(path)
+    asyncio.run(writer.async_write("0201", 'odd "body"\twith tab'))
+
+    (record,) = read_capture(path)
+
+    assert record.cmd == "0201"
+    assert record.body == 'odd "body"\twith tab'
+
+
+def test_writer_rotates(tmp_path):
+    path = tmp_path / "capture.txt"
+    writer = CaptureWriter(str(path), max_bytes=100, backups=2)
+    for n in range(10):
+        writer.write_line(f"{n}\tcmd\t{'x' * 40}\n")
+
+    assert (tmp_path / "capture.txt.1").exists()
+    assert (tmp_path / "capture.txt.2").exists()
+    assert not (tmp_path / "capture.txt.3").exists()
+    assert path.stat().st_size <= 100
+
+
+def test_replay_transport_answers_per_command_in_order():
+    transport = ReplayTransport(
+        [
+            CaptureRecord(1.0, "a", "first"),
+            CaptureRecord(2.0, "b", "other"),
+            CaptureRecord(3.0, "a", "second"),
+        ]
+    )
+
+    async def fetch_all():
+        return [await transport.fetch(cmd) for cmd in ("a", "a", "b", "a", "c")]
+
+    assert asyncio.run(fetch_all()) == ["first", "second", "other", None, None]
+
+
+def test_replay_client_decodes_captured_status(make_frame):
+    frame = make_frame(boiler=71.5)
+    client = ReplayClient([CaptureRecord(0.0, CMD_STATUS, _body(frame))])
+
+    status = asyncio.run(client.get_status())
+
+    assert status is not None
+    assert status.boiler_temp == 71.5
+    assert asyncio.run(client.get_status()) is None
@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from pyecoal.codec import (
+    BITS_TABLE,
+    INPUT_NAMES,
+    OUTPUT_NAMES,
+    build_read_cmd,
+    decode_datetime,
+    decode_status,
+    decode_temp,
+    encode_program,
+    parse_program,
+    parse_response,
+)
+
+
+def test_bits_table_matches_shifts():
+    assert len(BITS_TABLE) == 256
+    for value in range(256):
+        assert BITS_TABLE[value] == tuple(bool(value >> bit & 1) for bit in range(8))
+
+
+def test_decode_temp_is_signed():
+    assert decode_temp(0xD7, 0x00) == 21.5
+    assert decode_temp(0x9C, 0xFF) == -10.0
+
+
+def test_decode_status(make_frame):
+    frame = make_frame(boiler=65.3, outdoor=-4.5, outputs=0b0000_0101)
+    frame[61] = 0b1000_0000
+    frame[40], frame[41] = 0x01, 0x02
+    frame[64:68] = [0x10, 0x0E, 0, 0]  # 3600 s
+
+    status = decode_status(frame)
+
+    assert status.boiler_temp == 65.3
+    assert status.outdoor_temp == -4.5
+    assert [getattr(status, name) for name in OUTPUT_NAMES] == [
+        True, False, True, False, False, False, False, False
+    ]
+    assert [getattr(status, name) for name in INPUT_NAMES][-1] is True
+    assert status.inputs_raw == 0x80
+    assert status.alarms_raw == 0x0201
+    assert status.alarm_active is True
+    assert status.feeder_runtime == 60.0
+    assert status.controller_clock == datetime(2024, 1, 10, 12, 0, 0)
+    assert status.raw_status is frame
+
+
+def test_decode_datetime_rejects_invalid():
+    assert decode_datetime((24, 13, 1, 0, 0)) == (None, None)
+    assert decode_datetime((24, 2, 29, 6, 30))[1] == "2024-02-29T06:30:00"
+
+
+def test_program_round_trip():
+    days = ["1" * 12 + "0" * 36, "01" * 24] + ["0" * 48] * 5
+    data = encode_program(days)
+    assert len(data) == 42
+    assert parse_program(data) == days
+
+
+def test_parse_response():
+    assert parse_response("[2, 1, 6,3]") == [2, 1, 6, 3]
+    assert parse_response("error") is None
+
+
+def test_build_read_cmd_frame():
+    frame = bytes.fromhex(build_read_cmd(0x18))
+    assert frame[0] == 0x02 and frame[-1] == 0x03
+    assert frame[3:6] == bytes([0x01, 0x00, 0x18])
@@ -0,0 +1,58 @@
+import pytest
+
+from pyecoal.codec import decode_status
+from pyecoal.counters import RuntimeCounters
+
+BLOWER = 0b01
+FEEDER = 0b10
+
+
+def _frame(make_frame, outputs, feeder_seconds=0):
+    frame = make_frame(outputs=outputs)
+    frame[64:68] = feeder_seconds.to_bytes(4, "little")
+    return frame
+
+
+def test_outputs_integrate_previous_state(make_status):
+    counters = RuntimeCounters()
+    counters.update(0, make_status(outputs=BLOWER))
+    counters.update(30, make_status(outputs=FEEDER))
+    counters.update(60, make_status(outputs=0))
+
+    assert counters.seconds["air_pump"] == 30
+    assert counters.seconds["coal_feeder"] == 30
+    assert counters.seconds["ch_pump"] == 0
+
+
+def test_gap_over_max_gap_adds_nothing(make_status):
+    counters = RuntimeCounters(max_gap=300)
+    counters.update(0, make_status(outputs=BLOWER))
+    counters.update(301, make_status(outputs=BLOWER))
+    counters.update(331, make_status(outputs=BLOWER))
+
+    assert counters.seconds["air_pump"] == 30
+
+
+def test_fuel_and_heat_from_feeder_counter(make_frame):
+    counters = RuntimeCounters(feed_rate=6.0, kwh_per_kg=7.5, efficiency=0.8)
+    counters.update(0, decode_status(_frame(make_frame, 0, 600)))
+    # 10 minutes of feeding, seen across a polling gap longer than max_gap
+    counters.update(900, decode_status(_frame(make_frame, 0, 1200)))
+    # Counter reset on fuel load restarts the baseline
+    counters.update(930, decode_status(_frame(make_frame, 0, 60)))
+    counters.update(960, decode_status(_frame(make_frame, 0, 120)))
+
+    assert counters.fuel_kg == pytest.approx(1.1)
+    assert counters.heat_kwh == pytest.approx(1.1 * 7.5 * 0.8)
+
+
+def test_restore_round_trip(make_status):
+    counters = RuntimeCounters()
+    counters.update(0, make_status(outputs=BLOWER))
+    counters.update(30, make_status(outputs=BLOWER))
+    counters.fuel_kg = 2.5
+
+    restored = RuntimeCounters()
+    restored.restore({**counters.as_dict(), "unknown": 1})
+
+    assert restored.as_dict() == counters.as_dict()
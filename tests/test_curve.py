@@ -0,0 +1,65 @@
+import math
+
+import pytest
+
+from pyecoal.curve import CurveController, HeatingCurve
+
+
+def test_heating_curve():
+    curve = HeatingCurve(slope=1.5, shift=2.0, room_temp=20.0, room_gain=2.0, min_temp=0)
+
+    assert curve.target(20.0) == 22.0
+    assert curve.target(0.0) == 52.0
+    assert curve.target(0.0, indoor=19.0) == 54.0
+    assert curve.target(-60.0) == 80
+    assert curve.target(40.0) == 0
+
+
+def test_controller_limits_step_and_interval():
+    controller = CurveController(
+        HeatingCurve(slope=1.5, room_temp=20.0), max_step=3, min_interval=600
+    )
+
+    assert controller.update(0, 0.0, None, 40) == 43
+    controller.written(0)
+    assert controller.update(300, 0.0, None, 43) is None
+    assert controller.update(600, 0.0, None, 43) == 46
+    assert controller.writes == 1
+
+
+def test_controller_hysteresis_and_no_op():
+    controller = CurveController(HeatingCurve(slope=1.0, room_temp=20.0), hysteresis=1.0)
+
+    # Target 40.6 is within the hysteresis of 40
+    assert controller.update(0, -0.6, None, 40) is None
+    # Target 40.4 rounds to the current setpoint
+    controller = CurveController(
+        HeatingCurve(slope=1.0, room_temp=20.0), hysteresis=0.2
+    )
+    assert controller.update(0, -0.4, None, 40) is None
+
+
+def test_outdoor_smoothing_does_not_depend_on_sample_rate():
+    slow = CurveController(HeatingCurve(), outdoor_tau=300)
+    fast = CurveController(HeatingCurve(), outdoor_tau=300)
+    slow.update(0, 0.0, None, 50)
+    fast.update(0, 0.0, None, 50)
+
+    for t in range(30, 301, 30):
+        slow.update(t, 10.0, None, 50)
+    for t in range(1, 301):
+        fast.update(t, 10.0, None, 50)
+
+    assert slow.outdoor == pytest.approx(fast.outdoor)
+    # One time constant covers 1 - 1/e of the step
+    assert slow.outdoor == pytest.approx(10.0 * (1 - 1 / math.e))
+
+
+def test_outdoor_sample_without_elapsed_time_is_ignored():
+    controller = CurveController(HeatingCurve())
+    controller.update(10, 0.0, None, 50)
+    controller.update(10, 20.0, None, 50)
+    controller.update(5, 20.0, None, 50)
+
+    assert controller.outdoor == 0.0
+    assert controller.as_dict()["outdoor_smoothed"] == 0.0
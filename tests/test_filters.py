@@ -0,0 +1,49 @@
+from dataclasses import replace
+
+from pyecoal.filters import ProbeFilter, StatusFilter
+
+
+def test_single_spike_is_removed():
+    probe = ProbeFilter()
+    outputs = [probe.add(t * 30, value) for t, value in enumerate((60.0, 60.2, 95.0, 60.4))]
+
+    assert outputs == [60.0, 60.2, 60.2, 60.4]
+
+
+def test_implausible_reading_holds_the_previous_value():
+    probe = ProbeFilter()
+    assert probe.add(0, -3276.8) is None
+    probe.add(30, 50.0)
+
+    assert probe.add(60, -3276.8) == 50.0
+    assert probe.rejected == 2
+
+
+def test_rate_limit():
+    probe = ProbeFilter(max_rate=20.0)
+    for t in range(3):
+        probe.add(t * 30, 40.0)
+
+    # A sustained step is let through at 10 degrees per 30 s
+    assert [probe.add(90 + t * 30, 80.0) for t in range(5)] == [40.0, 50.0, 60.0, 70.0, 80.0]
+
+
+def test_status_filter_leaves_input_untouched(make_status):
+    status_filter = StatusFilter()
+    for t in range(3):
+        status_filter.apply(t * 30, make_status(boiler=60.0))
+
+    spike = make_status(boiler=99.0)
+    filtered = status_filter.apply(90, spike)
+
+    assert filtered.boiler_temp == 60.0
+    assert spike.boiler_temp == 99.0
+    assert status_filter.as_dict()["boiler_temp"]["raw"] == 99.0
+
+
+def test_status_filter_restarts_reconnected_probe(make_status):
+    status_filter = StatusFilter()
+    status_filter.apply(0, make_status(boiler=60.0))
+    status_filter.apply(30, replace(make_status(boiler=0.0), boiler_temp_state=1))
+
+    assert status_filter.apply(60, make_status(boiler=20.0)).boiler_temp == 20.0
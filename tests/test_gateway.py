@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+from pyecoal.gateway import parse_frame
+
+
+def test_parse_frame():
+    assert parse_frame(json.dumps({"ts": 1.0, "raw": [2, 1, 255]}).encode()) == [2, 1, 255]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"not json",
+        b"[1, 2, 3]",
+        b'{"ts": 1.0}',
+        b'{"raw": "0201"}',
+        b'{"raw": [1, 256]}',
+        b'{"raw": [1, "2"]}',
+    ],
+)
+def test_parse_frame_rejects_malformed_payloads(payload):
+    assert parse_frame(payload) is None
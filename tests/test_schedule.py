@@ -0,0 +1,117 @@
+from datetime import datetime
+
+import pytest
+
+from pyecoal.schedule import (
+    SLOTS_PER_DAY,
+    WEEK_MINUTES,
+    ScheduleIndex,
+    copy_day,
+    set_slots,
+    shift_slots,
+    time_to_slot,
+    week_minute,
+)
+
+EMPTY = ["0" * SLOTS_PER_DAY] * 7
+
+
+def test_time_to_slot():
+    assert time_to_slot(6, 30) == 13
+    with pytest.raises(ValueError):
+        time_to_slot(6, 15)
+
+
+def test_set_slots_within_a_day():
+    days = set_slots(EMPTY, [1, 3], time_to_slot(6, 0), time_to_slot(8, 0), True)
+
+    assert days[1] == "0" * 12 + "1" * 4 + "0" * 32
+    assert days[3] == days[1]
+    assert days[2] == EMPTY[2]
+    assert days is not EMPTY and EMPTY[1] == "0" * SLOTS_PER_DAY
+
+
+def test_set_slots_past_midnight_continues_next_day():
+    days = set_slots(EMPTY, [6], time_to_slot(22, 0), time_to_slot(2, 0), True)
+
+    # Saturday evening carries into Sunday morning
+    assert days[6] == "0" * 44 + "1" * 4
+    assert days[0] == "1" * 4 + "0" * 44
+    assert days[1:6] == EMPTY[1:6]
+
+
+def test_set_slots_whole_day_when_end_equals_start():
+    days = set_slots(EMPTY, [2], 10, 10, True)
+
+    assert days[2] == "0" * 10 + "1" * 38
+    assert days[3] == "1" * 10 + "0" * 38
+
+
+def test_shift_slots_later_spills_into_next_day():
+    days = list(EMPTY)
+    days[6] = "0" * 46 + "11"
+
+    shifted = shift_slots(days, [6], 1)
+
+    assert shifted[6] == "0" * 47 + "1"
+    assert shifted[0] == "1" + "0" * 47
+
+
+def test_shift_slots_earlier_spills_into_previous_day():
+    days = list(EMPTY)
+    days[0] = "11" + "0" * 46
+
+    shifted = shift_slots(days, [0], -3)
+
+    assert shifted[0] == "0" * SLOTS_PER_DAY
+    assert shifted[6] == "0" * 45 + "110"
+
+
+def test_shift_all_days_rotates_the_week():
+    days = ["".join(str((slot + day) % 3 % 2) for slot in range(48)) for day in range(7)]
+    week = "".join(days)
+
+    shifted = "".join(shift_slots(days, range(7), 5))
+
+    assert shifted == week[-5:] + week[:-5]
+
+
+def test_copy_day():
+    days = set_slots(EMPTY, [0], 0, 4, True)
+
+    copied = copy_day(days, 0, [2, 4])
+
+    assert copied[2] == copied[4] == days[0]
+    assert copied[3] == EMPTY[3]
+
+
+def test_week_minute_starts_on_sunday():
+    assert week_minute(datetime(2024, 1, 7, 0, 0)) == 0  # a Sunday
+    assert week_minute(datetime(2024, 1, 8, 6, 30)) == 1440 + 390
+
+
+def test_schedule_index_matches_slots():
+    days = set_slots(EMPTY, [1, 2, 3, 4, 5], time_to_slot(6, 0), time_to_slot(22, 0), True)
+    days = set_slots(days, [6], time_to_slot(23, 0), time_to_slot(1, 0), True)
+    index = ScheduleIndex(days)
+    bits = "".join(days)
+
+    for minute in range(0, WEEK_MINUTES, 7):
+        assert index.state_at(minute) is (bits[minute // 30] == "1")
+
+
+def test_schedule_index_next_transition_wraps_the_week():
+    days = set_slots(EMPTY, [1], time_to_slot(6, 0), time_to_slot(8, 0), True)
+    index = ScheduleIndex(days)
+
+    assert index.next_transition(1440) == (360, True)
+    assert index.next_transition(1440 + 400) == (80, False)
+    # After Monday's last change the next one is Monday 06:00 a week later
+    assert index.next_transition(1440 + 480) == (WEEK_MINUTES - 120, True)
+
+
+def test_schedule_index_constant_program():
+    assert ScheduleIndex(EMPTY).state_at(100) is False
+    assert ScheduleIndex(EMPTY).next_transition(100) is None
+    always = ScheduleIndex(["1" * SLOTS_PER_DAY] * 7)
+    assert always.state_at(WEEK_MINUTES - 1) is True
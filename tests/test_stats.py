@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from pyecoal.codec import CMD_SETTINGS, CMD_STATUS, build_read_cmd, build_value_cmd
+from pyecoal.stats import AdaptiveTimeout, P2Quantile, TimingStats, command_class
+
+
+def test_command_class():
+    assert command_class(CMD_STATUS) == "status"
+    assert command_class(CMD_SETTINGS) == "settings"
+    assert command_class(build_read_cmd(0x28)) == "read"
+    assert command_class(build_value_cmd(0x28, 60)) == "write"
+
+
+def test_timing_stats():
+    stats = TimingStats()
+    assert stats.as_dict()["mean_ms"] is None
+
+    stats.add(0.010)
+    stats.add(0.030, ok=False)
+
+    assert stats.as_dict() == {
+        "count": 2,
+        "failures": 1,
+        "mean_ms": 20.0,
+        "min_ms": 10.0,
+        "max_ms": 30.0,
+        "last_ms": 30.0,
+    }
+
+
+def test_p2_quantile_small_samples_are_exact():
+    estimate = P2Quantile(0.5)
+    assert estimate.value is None
+    for x in (3.0, 1.0, 2.0):
+        estimate.add(x)
+    assert estimate.value == 2.0
+
+
+@pytest.mark.parametrize("p", [0.5, 0.9, 0.99])
+def test_p2_quantile_tracks_uniform(p):
+    rng = random.Random(1)
+    estimate = P2Quantile(p)
+    for _ in range(20_000):
+        estimate.add(rng.random())
+    assert estimate.count == 20_000
+    assert estimate.value == pytest.approx(p, abs=0.02)
+
+
+def test_adaptive_timeout_waits_for_warmup():
+    timeouts = AdaptiveTimeout(floor=1.0, ceiling=10.0, margin=3.0, warmup=5)
+    for _ in range(4):
+        timeouts.observe("status", 0.5)
+    assert timeouts.timeout("status") == 10.0
+
+    timeouts.observe("status", 0.5)
+    assert timeouts.timeout("status") == pytest.approx(1.5)
+    assert timeouts.timeout("read") == 10.0
+
+
+def test_adaptive_timeout_clamps():
+    timeouts = AdaptiveTimeout(floor=1.0, ceiling=10.0, warmup=1)
+    timeouts.observe("fast", 0.01)
+    timeouts.observe("slow", 8.0)
+    assert timeouts.timeout("fast") == 1.0
+    assert timeouts.timeout("slow") == 10.0
+    assert timeouts.as_dict()["fast"]["samples"] == 1
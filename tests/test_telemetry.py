@@ -0,0 +1,70 @@
+from datetime import datetime, timezone
+
+from pyecoal.telemetry import TelemetryReader, TelemetryWriter
+
+DAY = datetime(2024, 1, 10, tzinfo=timezone.utc).timestamp()
+
+
+def test_round_trip_across_days(tmp_path, make_frame):
+    writer = TelemetryWriter(tmp_path)
+    timestamps = [DAY - 60, DAY + 30, DAY + 90]
+    for n, timestamp in enumerate(timestamps):
+        writer.append(timestamp, make_frame(boiler=60.0 + n))
+
+    assert writer.flush() == 3
+    reader = TelemetryReader(tmp_path)
+    assert [path.name for path in reader.files()] == [
+        "ecoal-20240109.ectl",
+        "ecoal-20240110.ectl",
+    ]
+    assert [(t, s.boiler_temp) for t, s in reader.statuses()] == [
+        (DAY - 60, 60.0),
+        (DAY + 30, 61.0),
+        (DAY + 90, 62.0),
+    ]
+
+
+def test_range_query(tmp_path, make_frame):
+    writer = TelemetryWriter(tmp_path)
+    for n in range(100):
+        writer.append(DAY + n * 30, make_frame(boiler=n))
+    writer.flush()
+
+    frames = list(TelemetryReader(tmp_path).frames(DAY + 300, DAY + 600))
+
+    assert [t for t, _ in frames] == [DAY + n * 30 for n in range(10, 20)]
+    assert all(len(raw) == 86 for _, raw in frames)
+
+
+def test_changes_only_ignores_the_clock(tmp_path, make_frame):
+    writer = TelemetryWriter(tmp_path, changes_only=True)
+
+    assert writer.append(DAY, make_frame(clock=(24, 1, 10, 0, 0, 0)))
+    assert not writer.append(DAY + 30, make_frame(clock=(24, 1, 10, 0, 0, 30)))
+    assert writer.append(DAY + 60, make_frame(boiler=70.0))
+    assert not writer.append(DAY + 90, [0] * 10)
+    assert writer.pending == 2
+
+
+def test_buffer_drops_oldest(tmp_path, make_frame):
+    writer = TelemetryWriter(tmp_path, max_buffer=2)
+    for n in range(3):
+        writer.append(DAY + n, make_frame(boiler=n))
+
+    assert writer.dropped == 1
+    writer.flush()
+    assert [t for t, _ in TelemetryReader(tmp_path).frames()] == [DAY + 1, DAY + 2]
+
+
+def test_keep_days_prunes_when_a_new_day_starts(tmp_path, make_frame):
+    for day in ("20240101", "20240104", "20240105"):
+        (tmp_path / f"ecoal-{day}.ectl").write_bytes(b"")
+    writer = TelemetryWriter(tmp_path, keep_days=5)
+
+    writer.append(DAY, make_frame())
+    writer.flush()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "ecoal-20240105.ectl",
+        "ecoal-20240110.ectl",
+    ]
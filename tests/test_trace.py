@@ -0,0 +1,57 @@
+import asyncio
+
+from pyecoal.capture import CaptureRecord, ReplayTransport
+from pyecoal.client import EcoalClient
+from pyecoal.codec import build_value_cmd
+from pyecoal.trace import CommandTrace, TraceLog, activate, span
+
+
+def test_span_without_trace_is_a_no_op():
+    with span("http"):
+        pass
+
+
+def test_spans_recorded_on_the_active_trace():
+    trace = CommandTrace("set_temp")
+    with activate(trace):
+        with span("build"):
+            pass
+    with span("outside"):
+        pass
+    trace.begin("confirm")
+    assert trace.is_open("confirm")
+    trace.end("confirm")
+    trace.end("never_opened")
+
+    assert [name for name, _, _ in trace.spans] == ["build", "confirm"]
+    assert all(0 <= start <= end <= trace.total for _, start, end in trace.spans)
+    assert set(trace.as_dict()["spans"]) == {"build", "confirm"}
+
+
+def test_client_records_build_and_http_spans():
+    cmd = build_value_cmd(0x28, 60)
+    client = EcoalClient(
+        "host", transport=ReplayTransport([CaptureRecord(0.0, cmd, "[2,1,0,3]")])
+    )
+    trace = CommandTrace("co_target_temp")
+
+    async def run():
+        with activate(trace):
+            return await client.set_param(0x28, 60)
+
+    assert asyncio.run(run()) is True
+    assert [name for name, _, _ in trace.spans] == ["build", "http"]
+
+
+def test_trace_log_summary():
+    log = TraceLog(size=3)
+    for total in (0.1, 0.2, 0.3, 0.4):
+        trace = CommandTrace("switch")
+        trace.spans.append(("http", 0.0, total))
+        log.add(trace)
+
+    summary = log.summary()["switch"]
+
+    assert summary["total"]["count"] == 3
+    assert summary["http"]["p50_ms"] == 300.0
+    assert summary["http"]["max_ms"] == 400.0